@@ -0,0 +1,209 @@
+"""Kraken - build_plan module.
+
+Classes:
+BuildPlan -- Flattened, ordered work lists used by the builders.
+
+"""
+
+from collections import OrderedDict
+
+
+class BuildPlan(object):
+    """Flattened description of everything that has to be built for a kraken
+    scene item.
+
+    The hierarchy is walked once, depth first, and each item is sorted in to a
+    typed work list in the order the builder has to process it. The builder
+    phases then consume the lists instead of walking the hierarchy again.
+
+    A plan can be generated and inspected without a DCC.
+
+    """
+
+    # Object types in the order they have to be tested in. New classes should
+    # be added above the classes they are derrived from. No new types should be
+    # added below SceneItem.
+    objectTypes = (
+        'Container',
+        'Layer',
+        'Component',
+        'ComponentGroup',
+        'HierarchyGroup',
+        'CtrlSpace',
+        'Locator',
+        'Joint',
+        'Control',
+        'Curve',
+        'SceneItem'
+    )
+
+    constraintTypes = (
+        'OrientationConstraint',
+        'PoseConstraint',
+        'PositionConstraint',
+        'ScaleConstraint'
+    )
+
+    operatorTypes = (
+        'SpliceOperator',
+    )
+
+
+    def __init__(self, kSceneItem=None):
+        super(BuildPlan, self).__init__()
+
+        self.rootItem = None
+
+        # (kObject, objectType, buildName) tuples.
+        self.objects = []
+
+        # Attributes to connect, in hierarchy order.
+        self.attributes = []
+
+        # (componentInput, connectionType) tuples, connectionType is 'Xfo' or
+        # 'Attribute'.
+        self.inputConnections = []
+
+        # (kOperator, operatorType) tuples.
+        self.operators = []
+
+        # (kConstraint, constraintType) tuples.
+        self.constraints = []
+
+        if kSceneItem is not None:
+            self.generate(kSceneItem)
+
+
+    def __str__(self):
+        """Returns a summary of the number of items in each work list.
+
+        Returns:
+            str: Summary of the plan.
+
+        """
+
+        counts = ", ".join([key + ":" + str(value) for key, value in self.getCounts().iteritems()])
+
+        return "BuildPlan(" + counts + ")"
+
+
+    def _getType(self, kSceneItem, typeNames):
+        """Returns the first of the given type names the scene item is a type of.
+
+        Args:
+            kSceneItem (object): kraken item to get the type of.
+            typeNames (tuple): The type names to test, in order.
+
+        Returns:
+            str: The matching type name, None if the item matches none of them.
+
+        """
+
+        for typeName in typeNames:
+            if kSceneItem.isTypeOf(typeName):
+                return typeName
+
+        return None
+
+
+    def generate(self, kSceneItem):
+        """Generates the work lists for the supplied kSceneItem and its
+        descendants.
+
+        Args:
+            kSceneItem (object): kraken scene item to generate the plan for.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        self.rootItem = kSceneItem
+        self.objects = []
+        self.attributes = []
+        self.inputConnections = []
+        self.operators = []
+        self.constraints = []
+
+        # Depth first, parents before children, children in order.
+        stack = [kSceneItem]
+        while len(stack) > 0:
+            kObject = stack.pop()
+            self._addObject(kObject)
+
+            for i in reversed(xrange(kObject.getNumChildren())):
+                stack.append(kObject.getChildByIndex(i))
+
+        return True
+
+
+    def _addObject(self, kObject):
+        """Adds a single object and its attributes, connections, operators and
+        constraints to the work lists.
+
+        Args:
+            kObject (object): kraken object to add.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        objectType = self._getType(kObject, self.objectTypes)
+        if objectType is None:
+            raise NotImplementedError(kObject.getName() + ' has an unsupported type: ' + str(type(kObject)))
+
+        self.objects.append((kObject, objectType, kObject.getBuildName()))
+
+        for i in xrange(kObject.getNumAttributeGroups()):
+            attributeGroup = kObject.getAttributeGroupByIndex(i)
+            for y in xrange(attributeGroup.getNumAttributes()):
+                self.attributes.append(attributeGroup.getAttributeByIndex(y))
+
+        if objectType == 'Component':
+            for i in xrange(kObject.getNumInputs()):
+                componentInput = kObject.getInputByIndex(i)
+                if componentInput.getTarget() is None or componentInput.getConnection() is None:
+                    continue
+
+                dataType = componentInput.getDataType()
+                if dataType.startswith('Xfo'):
+                    self.inputConnections.append((componentInput, 'Xfo'))
+                elif dataType.startswith(('Boolean', 'Float', 'Integer', 'String')):
+                    self.inputConnections.append((componentInput, 'Attribute'))
+
+            for i in xrange(kObject.getNumOperators()):
+                operator = kObject.getOperatorByIndex(i)
+                operatorType = self._getType(operator, self.operatorTypes)
+                if operatorType is None:
+                    raise NotImplementedError(operator.getName() + ' has an unsupported type: ' + str(type(operator)))
+
+                self.operators.append((operator, operatorType))
+
+        for i in xrange(kObject.getNumConstraints()):
+            constraint = kObject.getConstraintByIndex(i)
+            constraintType = self._getType(constraint, self.constraintTypes)
+            if constraintType is None:
+                raise NotImplementedError(constraint.getName() + ' has an unsupported type: ' + str(type(constraint)))
+
+            self.constraints.append((constraint, constraintType))
+
+        return True
+
+
+    def getCounts(self):
+        """Returns the number of items in each of the work lists.
+
+        Returns:
+            OrderedDict: Work list names and item counts.
+
+        """
+
+        counts = OrderedDict()
+        counts['objects'] = len(self.objects)
+        counts['attributes'] = len(self.attributes)
+        counts['inputConnections'] = len(self.inputConnections)
+        counts['operators'] = len(self.operators)
+        counts['constraints'] = len(self.constraints)
+
+        return counts
@@ -9,6 +9,7 @@ Builder -- Base builder object to build objects in DCC.
 from kraken.core.kraken_system import KrakenSystem
 from kraken.core.configs.config import Config
 from kraken.core.profiler import Profiler
+from kraken.core.build_plan import BuildPlan
 
 from kraken.core.objects.components.component import Component
 from kraken.core.objects.constraints.pose_constraint import PoseConstraint
@@ -23,6 +24,19 @@ class Builder(object):
         super(Builder, self).__init__()
         self._buildElements = []
 
+        # Lookup tables for the build elements. Kraken scene items are keyed by
+        # identity, DCC scene items by value when they are hashable.
+        self._sceneItemMap = {}
+        self._dccSceneItemMap = {}
+
+        self._buildPlan = None
+
+        # Stub operators added during the current build, source code key ->
+        # name of the stub operator.
+        self._klOperators = {}
+        self._klOperatorStats = None
+        self.resetKLOperatorStats()
+
         self.config = Config.getInstance()
 
         self._debugMode = debugMode
@@ -51,9 +65,32 @@ class Builder(object):
 
         self._buildElements.append(pairing)
 
+        # The first registered pairing wins, as it did when the list was searched.
+        self._sceneItemMap.setdefault(id(kSceneItem), pairing)
+        self._dccSceneItemMap.setdefault(self._getDCCSceneItemKey(dccSceneItem), pairing)
+
         return True
 
 
+    def _getDCCSceneItemKey(self, dccSceneItem):
+        """Returns the key used to store a DCC scene item in the lookup table.
+
+        Args:
+            dccSceneItem (object): dcc scene item to get the key for.
+
+        Returns:
+            object: The DCC scene item if it is hashable, else its id.
+
+        """
+
+        try:
+            hash(dccSceneItem)
+        except TypeError:
+            return id(dccSceneItem)
+
+        return dccSceneItem
+
+
     def getDCCSceneItem(self, kSceneItem):
         """Given a kSceneItem, returns the built dcc scene item.
 
@@ -65,11 +102,73 @@ class Builder(object):
 
         """
 
-        for builtElement in self._buildElements:
-            if builtElement['src'] == kSceneItem:
-                return builtElement['tgt']
+        pairing = self._sceneItemMap.get(id(kSceneItem))
+        if pairing is None:
+            return None
 
-        return None
+        return pairing['tgt']
+
+
+    def getKrakenSceneItem(self, dccSceneItem):
+        """Given a built dcc scene item, returns the kraken scene item it was
+        built from.
+
+        Args:
+            dccSceneItem (object): dcc scene item to base the search.
+
+        Returns:
+            object: The Kraken Scene Item that corresponds to the given dcc scene item
+
+        """
+
+        pairing = self._dccSceneItemMap.get(self._getDCCSceneItemKey(dccSceneItem))
+        if pairing is None:
+            return None
+
+        return pairing['src']
+
+
+    def hasDCCSceneItem(self, kSceneItem):
+        """Returns whether a dcc scene item has been built for the kSceneItem.
+
+        Args:
+            kSceneItem (object): kSceneItem to check.
+
+        Returns:
+            bool: True if the kSceneItem has been built.
+
+        """
+
+        return id(kSceneItem) in self._sceneItemMap
+
+
+    def getBuildElements(self):
+        """Returns the registered pairings in the order they were built.
+
+        The build map remains available after the build so synchronizers and
+        tools can reuse it.
+
+        Returns:
+            list: List of (kSceneItem, dccSceneItem) tuples.
+
+        """
+
+        return [(pairing['src'], pairing['tgt']) for pairing in self._buildElements]
+
+
+    def clearBuildElements(self):
+        """Clears the registered pairings.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        self._buildElements = []
+        self._sceneItemMap = {}
+        self._dccSceneItemMap = {}
+
+        return True
 
 
     # ========================
@@ -423,6 +522,72 @@ class Builder(object):
     # =========================
     # Operator Builder Methods
     # =========================
+    def getKLOperatorSourceCode(self, kOperator, arraySizes={}):
+        """Returns the name and source code of the stub operator for a Splice
+        operator.
+
+        Stubs are shared by all the operators with the same solver type,
+        extension, arg signature and array sizes: they get the same stub name
+        and source code, which is only generated once. Each Splice node is still
+        given the stub source when its operator is added.
+
+        Args:
+            kOperator (object): kraken operator that represents a Splice operator.
+            arraySizes (dict): Sizes of the output arrays resized by the stub.
+
+        Returns:
+            tuple: The name of the stub operator and its source code.
+
+        """
+
+        stats = self._klOperatorStats
+        stats['operators'] += 1
+
+        if kOperator.hasCachedSourceCode(arraySizes=arraySizes):
+            stats['cacheHits'] += 1
+
+        key = kOperator.getSourceCodeKey(arraySizes=arraySizes)
+        if key in self._klOperators:
+            stats['reusedStubs'] += 1
+        else:
+            self._klOperators[key] = kOperator.getKLOperatorName(arraySizes=arraySizes)
+            stats['distinctStubs'] += 1
+
+        return (self._klOperators[key], kOperator.generateSourceCode(arraySizes=arraySizes))
+
+
+    def getKLOperatorStats(self):
+        """Returns the stub operator counters of the current build.
+
+        Returns:
+            dict: The number of 'operators' built, the number of stub source
+                code 'cacheHits', the number of 'distinctStubs' and the number
+                of operators reusing the name of a stub already used in this
+                build ('reusedStubs').
+
+        """
+
+        return dict(self._klOperatorStats)
+
+
+    def resetKLOperatorStats(self):
+        """Resets the stub operator counters, called at the start of each build.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        self._klOperators = {}
+        self._klOperatorStats = {
+            'operators': 0,
+            'cacheHits': 0,
+            'distinctStubs': 0,
+            'reusedStubs': 0
+        }
+
+        return True
+
     def buildSpliceOperators(self, kOperator):
         """Builds Splice Operators on the components.
 
@@ -473,206 +638,255 @@ class Builder(object):
 
         """
 
+        self._buildObjects(BuildPlan(kObject))
 
-        dccSceneItem = None
+        return self.getDCCSceneItem(kObject)
 
-        buildName = kObject.getBuildName()
 
-        if self._debugMode:
-            print "building:" + kObject.getPath() + " as:" + buildName
+    def buildConstraints(self, kObject):
+        """Builds constraints for the supplied kObject.
 
-        # Build Object
-        if kObject.isTypeOf("Container"):
-            dccSceneItem = self.buildContainer(kObject, buildName)
+        Args:
+            kObject (object): kraken object to create constraints for.
 
-        elif kObject.isTypeOf("Layer"):
-            dccSceneItem = self.buildLayer(kObject, buildName)
+        Returns:
+            bool: True if successful.
 
-        elif kObject.isTypeOf("Component"):
-            pass
+        """
 
-        elif kObject.isTypeOf("ComponentGroup"):
-            dccSceneItem = self.buildGroup(kObject, buildName)
-            component = kObject
+        return self._buildConstraints(BuildPlan(kObject))
 
-        elif kObject.isTypeOf("HierarchyGroup"):
-            dccSceneItem = self.buildHierarchyGroup(kObject, buildName)
 
-        elif kObject.isTypeOf("CtrlSpace"):
-            dccSceneItem = self.buildGroup(kObject, buildName)
+    def buildInputConnections(self, kObject):
+        """Builds the connections between the component inputs of each
+        component.
+
+        Only input connections are built otherwise duplicate constraints / expressions
+        would be created.
 
-        elif kObject.isTypeOf("Locator"):
-            dccSceneItem = self.buildLocator(kObject, buildName)
+        Args:
+            kObject (object): kraken object to create connections for.
 
-        elif kObject.isTypeOf("Joint"):
-            dccSceneItem = self.buildJoint(kObject, buildName)
+        Returns:
+            bool: True if successful.
 
-        elif kObject.isTypeOf("Control"):
-            dccSceneItem = self.buildControl(kObject, buildName)
+        """
 
-        elif kObject.isTypeOf("Curve"):
-            dccSceneItem = self.buildCurve(kObject, buildName)
+        return self._buildInputConnections(BuildPlan(kObject))
 
-        # Important Note: The order of these tests is important.
-        # New classes should be added above the classes they are derrived from.
-        # No new types should be added below SceneItem here.
-        elif kObject.isTypeOf("SceneItem"):
-            dccSceneItem = self.buildLocator(kObject, buildName)
 
-        else:
-            raise NotImplementedError(kObject.getName() + ' has an unsupported type: ' + str(type(kObject)))
+    def buildAttrConnections(self, kObject):
+        """Builds the connections between the component inputs and outputs of each
+        component.
 
-        if dccSceneItem is not None:
-            self.buildAttributes(kObject)
-            self.setTransform(kObject)
-            self.lockParameters(kObject)
-            self.setVisibility(kObject)
-            self.setObjectColor(kObject)
+        Args:
+            kObject (object): kraken object to create connections for.
 
-        # Build children
-        for i in xrange(kObject.getNumChildren()):
-            child = kObject.getChildByIndex(i)
-            self.buildHierarchy(child, component)
+        Returns:
+            bool: True if successful.
 
-        return dccSceneItem
+        """
 
+        return self._buildAttrConnections(BuildPlan(kObject))
 
-    def buildConstraints(self, kObject):
-        """Builds constraints for the supplied kObject.
+
+    def buildOperators(self, kObject):
+        """Build operators in the hierarchy.
 
         Args:
-            kObject (object): kraken object to create constraints for.
+            kObject (object): kraken object to create operators for.
 
         Returns:
             bool: True if successful.
 
         """
 
-        dccSceneItem = None
-        for i in xrange(kObject.getNumConstraints()):
+        return self._buildOperators(BuildPlan(kObject))
 
-            constraint = kObject.getConstraintByIndex(i)
 
-            # Build Object
-            if constraint.isTypeOf("OrientationConstraint"):
-                dccSceneItem = self.buildOrientationConstraint(constraint)
+    # ====================
+    # Build Plan Methods
+    # ====================
+    def createBuildPlan(self, kSceneItem):
+        """Creates the build plan for the supplied kSceneItem.
 
-            elif constraint.isTypeOf("PoseConstraint"):
-                dccSceneItem = self.buildPoseConstraint(constraint)
+        The plan can be created and inspected without building anything, which
+        allows the traversal cost of a rig to be measured outside of a DCC.
 
-            elif constraint.isTypeOf("PositionConstraint"):
-                dccSceneItem = self.buildPositionConstraint(constraint)
+        Args:
+            kSceneItem (object): kraken kSceneItem object to plan the build of.
 
-            elif constraint.isTypeOf("ScaleConstraint"):
-                dccSceneItem = self.buildScaleConstraint(constraint)
+        Returns:
+            object: The BuildPlan for the kSceneItem.
 
-            else:
-                raise NotImplementedError(constraint.getName() + ' has an unsupported type: ' + str(type(constraint)))
+        """
 
-        # Build children
-        for i in xrange(kObject.getNumChildren()):
-            child = kObject.getChildByIndex(i)
-            self.buildConstraints(child)
+        Profiler.getInstance().push("createBuildPlan:" + kSceneItem.getName())
 
-        return True
+        try:
+            buildPlan = BuildPlan(kSceneItem)
+        finally:
+            Profiler.getInstance().pop()
 
+        return buildPlan
 
-    def buildInputConnections(self, kObject):
-        """Builds the connections between the component inputs of each
-        component.
 
-        Only input connections are built otherwise duplicate constraints / expressions
-        would be created.
+    def getBuildPlan(self):
+        """Returns the build plan used by the last build.
+
+        Returns:
+            object: The BuildPlan, None if nothing has been built yet.
+
+        """
+
+        return self._buildPlan
+
+
+    def _buildObjects(self, buildPlan):
+        """Builds the objects of the build plan and their attributes.
 
         Args:
-            kObject (object): kraken object to create connections for.
+            buildPlan (object): BuildPlan with the objects to build.
 
         Returns:
             bool: True if successful.
 
         """
 
-        if kObject.isTypeOf('Component'):
+        for kObject, objectType, buildName in buildPlan.objects:
+
+            if self._debugMode:
+                print "building:" + kObject.getPath() + " as:" + buildName
+
+            dccSceneItem = None
+
+            # Build Object
+            if objectType == "Container":
+                dccSceneItem = self.buildContainer(kObject, buildName)
+
+            elif objectType == "Layer":
+                dccSceneItem = self.buildLayer(kObject, buildName)
+
+            elif objectType == "Component":
+                pass
+
+            elif objectType == "ComponentGroup":
+                dccSceneItem = self.buildGroup(kObject, buildName)
+
+            elif objectType == "HierarchyGroup":
+                dccSceneItem = self.buildHierarchyGroup(kObject, buildName)
+
+            elif objectType == "CtrlSpace":
+                dccSceneItem = self.buildGroup(kObject, buildName)
 
-            # Build input connections
-            for i in xrange(kObject.getNumInputs()):
+            elif objectType == "Locator":
+                dccSceneItem = self.buildLocator(kObject, buildName)
 
-                componentInput = kObject.getInputByIndex(i)
-                if componentInput.getTarget() is None or componentInput.getConnection() is None:
-                    continue
+            elif objectType == "Joint":
+                dccSceneItem = self.buildJoint(kObject, buildName)
 
-                if self._debugMode:
-                    print "buildConnection:" + componentInput.getName()
+            elif objectType == "Control":
+                dccSceneItem = self.buildControl(kObject, buildName)
 
-                if componentInput.getDataType().startswith('Xfo'):
-                    self.buildXfoConnection(componentInput)
+            elif objectType == "Curve":
+                dccSceneItem = self.buildCurve(kObject, buildName)
 
-                elif componentInput.getDataType().startswith(('Boolean', 'Float', 'Integer', 'String')):
-                    self.buildAttributeConnection(componentInput)
+            elif objectType == "SceneItem":
+                dccSceneItem = self.buildLocator(kObject, buildName)
 
-        # Build connections for children.
-        for i in xrange(kObject.getNumChildren()):
-            child = kObject.getChildByIndex(i)
-            self.buildInputConnections(child)
+            if dccSceneItem is not None:
+                self.buildAttributes(kObject)
+                self.setTransform(kObject)
+                self.lockParameters(kObject)
+                self.setVisibility(kObject)
+                self.setObjectColor(kObject)
 
         return True
 
 
-    def buildAttrConnections(self, kObject):
-        """Builds the connections between the component inputs and outputs of each
-        component.
+    def _buildAttrConnections(self, buildPlan):
+        """Connects the attributes of the build plan.
 
         Args:
-            kObject (object): kraken object to create connections for.
+            buildPlan (object): BuildPlan with the attributes to connect.
 
         Returns:
             bool: True if successful.
 
         """
 
-        # Build input connections
-        for i in xrange(kObject.getNumAttributeGroups()):
-            attributeGroup = kObject.getAttributeGroupByIndex(i)
+        for attribute in buildPlan.attributes:
+            self.connectAttribute(attribute)
 
-            for y in xrange(attributeGroup.getNumAttributes()):
-                attribute = attributeGroup.getAttributeByIndex(y)
-                self.connectAttribute(attribute)
+        return True
+
+
+    def _buildInputConnections(self, buildPlan):
+        """Builds the component input connections of the build plan.
 
-        # Build connections for children.
-        for i in xrange(kObject.getNumChildren()):
-            child = kObject.getChildByIndex(i)
-            self.buildAttrConnections(child)
+        Args:
+            buildPlan (object): BuildPlan with the connections to build.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        for componentInput, connectionType in buildPlan.inputConnections:
+
+            if self._debugMode:
+                print "buildConnection:" + componentInput.getName()
+
+            if connectionType == 'Xfo':
+                self.buildXfoConnection(componentInput)
+
+            elif connectionType == 'Attribute':
+                self.buildAttributeConnection(componentInput)
 
         return True
 
 
-    def buildOperators(self, kObject):
-        """Build operators in the hierarchy.
+    def _buildOperators(self, buildPlan):
+        """Builds the operators of the build plan.
 
         Args:
-            kObject (object): kraken object to create operators for.
+            buildPlan (object): BuildPlan with the operators to build.
 
         Returns:
             bool: True if successful.
 
         """
 
-        if kObject.isTypeOf('Component'):
+        for operator, operatorType in buildPlan.operators:
+            if operatorType == 'SpliceOperator':
+                self.buildSpliceOperators(operator)
 
-            # Build operators
-            for i in xrange(kObject.getNumOperators()):
-                operator = kObject.getOperatorByIndex(i)
+        return True
 
-                if operator.isTypeOf('SpliceOperator'):
-                    self.buildSpliceOperators(operator)
 
-                else:
-                    raise NotImplementedError(operator.getName() + ' has an unsupported type: ' + str(type(kObject)))
+    def _buildConstraints(self, buildPlan):
+        """Builds the constraints of the build plan.
 
-        # Build connections for children.
-        for i in xrange(kObject.getNumChildren()):
-            child = kObject.getChildByIndex(i)
-            self.buildOperators(child)
+        Args:
+            buildPlan (object): BuildPlan with the constraints to build.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        for constraint, constraintType in buildPlan.constraints:
+            if constraintType == "OrientationConstraint":
+                self.buildOrientationConstraint(constraint)
+
+            elif constraintType == "PoseConstraint":
+                self.buildPoseConstraint(constraint)
+
+            elif constraintType == "PositionConstraint":
+                self.buildPositionConstraint(constraint)
+
+            elif constraintType == "ScaleConstraint":
+                self.buildScaleConstraint(constraint)
 
         return True
 
@@ -855,11 +1069,13 @@ class Builder(object):
 
         """
 
-        self.buildHierarchy(kSceneItem, component=None)
-        self.buildAttrConnections(kSceneItem)
-        self.buildInputConnections(kSceneItem)
-        self.buildOperators(kSceneItem)
-        self.buildConstraints(kSceneItem)
+        self._buildPlan = self.createBuildPlan(kSceneItem)
+
+        self._buildObjects(self._buildPlan)
+        self._buildAttrConnections(self._buildPlan)
+        self._buildInputConnections(self._buildPlan)
+        self._buildOperators(self._buildPlan)
+        self._buildConstraints(self._buildPlan)
 
         return True
 
@@ -877,6 +1093,8 @@ class Builder(object):
 
         Profiler.getInstance().push("build:" + kSceneItem.getName())
 
+        self.resetKLOperatorStats()
+
         try:
             self._preBuild(kSceneItem)
             self._build(kSceneItem)
@@ -24,6 +24,7 @@ class Config(object):
         self._colors = self.initColors()
         self._colorMap = self.initColorMap()
         self._nameTemplate = self.initNameTemplate()
+        self._nameTemplatePrograms = {}
         self._controlShapes = self.initControlShapes()
 
 
@@ -183,6 +184,83 @@ class Config(object):
         return self._nameTemplate
 
 
+    def setNameTemplate(self, nameTemplate):
+        """Sets the naming template for this configuration.
+
+        The naming template must be set through this method rather than edited
+        in place so the compiled name template programs are regenerated.
+
+        Args:
+            nameTemplate (dict): naming template.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        self._nameTemplate = nameTemplate
+        self._nameTemplatePrograms = {}
+
+        return True
+
+
+    def getNameTemplateProgram(self, typeNameHierarchy):
+        """Returns the naming template compiled for an object type.
+
+        The format and type lookups of the naming template are resolved once per
+        type hierarchy. The program is a tuple of (token, value) pairs:
+        separators carry the separator string and the 'type' token carries the
+        resolved object type and its name. All other tokens have no value.
+
+        Args:
+            typeNameHierarchy (tuple): The type names of the object, starting
+                with its own class.
+
+        Returns:
+            tuple: The compiled program.
+
+        """
+
+        program = self._nameTemplatePrograms.get(typeNameHierarchy)
+        if program is not None:
+            return program
+
+        nameTemplate = self.getNameTemplate()
+
+        # Get the token list for this type of object
+        format = None
+        for typeName in nameTemplate['formats'].keys():
+            if typeName in typeNameHierarchy:
+                format = nameTemplate['formats'][typeName]
+                break
+
+        if format is None:
+            format = nameTemplate['formats']['default']
+
+        objectType = None
+        for eachType in typeNameHierarchy:
+            if eachType in nameTemplate['types'].keys():
+                objectType = eachType
+                break
+
+        if objectType is None:
+            objectType = 'default'
+
+        tokens = []
+        for token in format:
+            if token == 'sep':
+                tokens.append((token, nameTemplate['separator']))
+            elif token == 'type':
+                tokens.append((token, (objectType, nameTemplate['types'][objectType])))
+            else:
+                tokens.append((token, None))
+
+        program = tuple(tokens)
+        self._nameTemplatePrograms[typeNameHierarchy] = program
+
+        return program
+
+
     # ======================
     # Control Shape Methods
     # ======================
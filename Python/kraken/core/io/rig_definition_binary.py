@@ -0,0 +1,433 @@
+"""Kraken - core.io.rig_definition_binary module.
+
+Binary container for rig definitions. A file holds the same data as the JSON
+rig definition files:
+
+    header        -- 'KRGB' magic, uint16 version, uint16 flags.
+    string table  -- uint32 count, then uint32 length and UTF-8 bytes for every
+                     string used as a key or value.
+    float table   -- uint32 count, then the doubles of all the packed math
+                     values, contiguous.
+    value         -- tagged tree of the top level value.
+
+Vec2, Vec3, Vec4, Quat and Xfo values are stored as an offset in to the float
+table. Other math values are stored as their JSON dictionaries. All numbers
+are little endian.
+
+Classes:
+RigDefinitionBinaryReader - Reader for binary rig definition files.
+
+"""
+
+import sys
+import array
+import struct
+
+from kraken.core.maths import decodeValue
+from kraken.core.maths import Vec2, Vec3, Vec4, Quat, Xfo
+from kraken.core.maths.math_object import MathObject
+
+
+MAGIC = 'KRGB'
+VERSION = 1
+
+_header = struct.Struct('<4sHH')
+_uint8 = struct.Struct('<B')
+_uint32 = struct.Struct('<I')
+_int64 = struct.Struct('<q')
+_double = struct.Struct('<d')
+_mathValue = struct.Struct('<BI')
+
+# Value tags.
+_NONE = 'N'
+_TRUE = 'T'
+_FALSE = 'F'
+_INT = 'I'
+_FLOAT = 'D'
+_STRING = 'S'
+_LIST = 'L'
+_DICT = 'O'
+_MATH = 'M'
+
+# Packed math classes, stored as their index in this tuple.
+_mathClasses = ('Vec2', 'Vec3', 'Vec4', 'Quat', 'Xfo')
+_mathClassSizes = (2, 3, 4, 4, 10)
+_mathClassIds = dict([(name, i) for i, name in enumerate(_mathClasses)])
+
+
+def isBinaryRigDefinition(filepath):
+    """Returns whether a file is a binary rig definition.
+
+    Args:
+        filepath (str): Path of the file to test.
+
+    Returns:
+        bool: True if the file starts with the binary rig definition magic.
+
+    """
+
+    with open(filepath, 'rb') as rigFile:
+        return rigFile.read(len(MAGIC)) == MAGIC
+
+
+def _getMathValues(value, className):
+    """Returns the floats of a packed math value.
+
+    Args:
+        value (object): The math value.
+        className (str): The class name of the value.
+
+    Returns:
+        tuple: The floats of the value.
+
+    """
+
+    if className == 'Vec3':
+        return (value.x, value.y, value.z)
+
+    elif className == 'Xfo':
+        tr = value.tr
+        ori = value.ori
+        v = ori.v
+        sc = value.sc
+        return (tr.x, tr.y, tr.z, v.x, v.y, v.z, ori.w, sc.x, sc.y, sc.z)
+
+    elif className == 'Quat':
+        v = value.v
+        return (v.x, v.y, v.z, value.w)
+
+    elif className == 'Vec2':
+        return (value.x, value.y)
+
+    elif className == 'Vec4':
+        return (value.x, value.y, value.z, value.t)
+
+
+def _createMathValue(classId, floats, offset):
+    """Constructs a packed math value from the float table.
+
+    Args:
+        classId (int): Index of the class in the packed classes.
+        floats (array): The float table.
+        offset (int): Offset of the first float of the value.
+
+    Returns:
+        object: The math value.
+
+    """
+
+    f = floats
+    o = offset
+    className = _mathClasses[classId]
+
+    if className == 'Vec3':
+        return Vec3(f[o], f[o + 1], f[o + 2])
+
+    elif className == 'Xfo':
+        return Xfo(tr=Vec3(f[o], f[o + 1], f[o + 2]),
+                   ori=Quat(v=Vec3(f[o + 3], f[o + 4], f[o + 5]), w=f[o + 6]),
+                   sc=Vec3(f[o + 7], f[o + 8], f[o + 9]))
+
+    elif className == 'Quat':
+        return Quat(v=Vec3(f[o], f[o + 1], f[o + 2]), w=f[o + 3])
+
+    elif className == 'Vec2':
+        return Vec2(f[o], f[o + 1])
+
+    elif className == 'Vec4':
+        return Vec4(f[o], f[o + 1], f[o + 2], f[o + 3])
+
+
+def encodeRigDefinition(data):
+    """Encodes rig definition data in to the binary format.
+
+    Args:
+        data (dict): The rig definition, with math values either as math
+            objects or as their JSON dictionaries.
+
+    Returns:
+        str: The encoded data.
+
+    """
+
+    strings = []
+    stringIds = {}
+    floats = array.array('d')
+    tree = []
+
+    def addString(value):
+        stringId = stringIds.get(value)
+        if stringId is None:
+            stringId = len(strings)
+            stringIds[value] = stringId
+            strings.append(value)
+
+        return stringId
+
+    def encode(value):
+        valueType = type(value)
+
+        if valueType is dict and '__mathObjectClass__' in value:
+            if value['__mathObjectClass__'] in _mathClassIds:
+                value = decodeValue(value)
+                valueType = type(value)
+
+        if value is None:
+            tree.append(_NONE)
+
+        elif valueType is bool:
+            tree.append(_TRUE if value else _FALSE)
+
+        elif valueType in (int, long):
+            tree.append(_INT + _int64.pack(value))
+
+        elif valueType is float:
+            tree.append(_FLOAT + _double.pack(value))
+
+        elif valueType in (str, unicode):
+            tree.append(_STRING + _uint32.pack(addString(value)))
+
+        elif valueType in (list, tuple):
+            tree.append(_LIST + _uint32.pack(len(value)))
+            for item in value:
+                encode(item)
+
+        elif valueType is dict:
+            tree.append(_DICT + _uint32.pack(len(value)))
+            for key, item in value.iteritems():
+                tree.append(_uint32.pack(addString(key)))
+                encode(item)
+
+        elif isinstance(value, MathObject):
+            className = value.__class__.__name__
+            classId = _mathClassIds.get(className)
+            if classId is None:
+                encode(value.jsonEncode())
+            else:
+                tree.append(_MATH + _mathValue.pack(classId, len(floats)))
+                floats.extend(_getMathValues(value, className))
+
+        else:
+            raise Exception("Unable to encode value of type '" + valueType.__name__ + "' in a binary rig definition.")
+
+    encode(data)
+
+    if sys.byteorder == 'big':
+        floats.byteswap()
+
+    result = [_header.pack(MAGIC, VERSION, 0)]
+
+    result.append(_uint32.pack(len(strings)))
+    for value in strings:
+        if type(value) is unicode:
+            value = value.encode('utf-8')
+        result.append(_uint32.pack(len(value)))
+        result.append(value)
+
+    result.append(_uint32.pack(len(floats)))
+    result.append(floats.tostring())
+
+    result.extend(tree)
+
+    return ''.join(result)
+
+
+def writeBinaryRigDefinition(filepath, data):
+    """Writes rig definition data to a binary file.
+
+    Args:
+        filepath (str): Path of the file to write.
+        data (dict): The rig definition.
+
+    Returns:
+        bool: True if successful.
+
+    """
+
+    with open(filepath, 'wb') as rigFile:
+        rigFile.write(encodeRigDefinition(data))
+
+    return True
+
+
+class RigDefinitionBinaryReader(object):
+    """Reads binary rig definition files.
+
+    The reader has the same interface as RigDefinitionReader, so the loaders
+    don't have to know which format a file is in. The float table is read in
+    one go and math values are constructed straight from it.
+
+    """
+
+    def __init__(self, filepath=None, data=None):
+        super(RigDefinitionBinaryReader, self).__init__()
+
+        if data is None:
+            with open(filepath, 'rb') as rigFile:
+                data = rigFile.read()
+
+        self._filepath = filepath
+        self._data = data
+        self._pos = 0
+        self._strings = []
+        self._floats = None
+
+        self._readTables()
+
+
+    def _readTables(self):
+        """Reads the header, string table and float table.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        data = self._data
+
+        if len(data) < _header.size:
+            raise Exception("Invalid binary rig definition:" + str(self._filepath))
+
+        magic, version, flags = _header.unpack_from(data, 0)
+        if magic != MAGIC:
+            raise Exception("Invalid binary rig definition:" + str(self._filepath))
+
+        if version > VERSION:
+            raise Exception("Unsupported binary rig definition version " + str(version) + ":" + str(self._filepath))
+
+        pos = _header.size
+
+        numStrings = _uint32.unpack_from(data, pos)[0]
+        pos += 4
+        strings = []
+        for i in xrange(numStrings):
+            length = _uint32.unpack_from(data, pos)[0]
+            pos += 4
+            strings.append(data[pos:pos + length].decode('utf-8'))
+            pos += length
+
+        numFloats = _uint32.unpack_from(data, pos)[0]
+        pos += 4
+        floats = array.array('d')
+        floats.fromstring(data[pos:pos + numFloats * 8])
+        if sys.byteorder == 'big':
+            floats.byteswap()
+        pos += numFloats * 8
+
+        self._strings = strings
+        self._floats = floats
+        self._pos = pos
+
+        return True
+
+
+    def _readValue(self):
+        """Decodes the value at the current position.
+
+        Returns:
+            object: The decoded value.
+
+        """
+
+        data = self._data
+        pos = self._pos
+        tag = data[pos]
+        pos += 1
+
+        if tag == _MATH:
+            classId, offset = _mathValue.unpack_from(data, pos)
+            self._pos = pos + _mathValue.size
+            return _createMathValue(classId, self._floats, offset)
+
+        elif tag == _STRING:
+            self._pos = pos + 4
+            return self._strings[_uint32.unpack_from(data, pos)[0]]
+
+        elif tag == _FLOAT:
+            self._pos = pos + 8
+            return _double.unpack_from(data, pos)[0]
+
+        elif tag == _INT:
+            self._pos = pos + 8
+            return _int64.unpack_from(data, pos)[0]
+
+        elif tag == _DICT:
+            count = _uint32.unpack_from(data, pos)[0]
+            self._pos = pos + 4
+            value = {}
+            for i in xrange(count):
+                key = self._strings[_uint32.unpack_from(data, self._pos)[0]]
+                self._pos += 4
+                value[key] = self._readValue()
+
+            if '__mathObjectClass__' in value:
+                return decodeValue(value)
+
+            return value
+
+        elif tag == _LIST:
+            count = _uint32.unpack_from(data, pos)[0]
+            self._pos = pos + 4
+            return [self._readValue() for i in xrange(count)]
+
+        elif tag == _TRUE:
+            self._pos = pos
+            return True
+
+        elif tag == _FALSE:
+            self._pos = pos
+            return False
+
+        elif tag == _NONE:
+            self._pos = pos
+            return None
+
+        raise Exception("Invalid value tag '" + tag + "' in binary rig definition:" + str(self._filepath))
+
+
+    def read(self):
+        """Decodes the whole rig definition.
+
+        Returns:
+            object: The rig definition with math values decoded.
+
+        """
+
+        self._readTables()
+
+        return self._readValue()
+
+
+    def iterItems(self, streamKeys=()):
+        """Iterates over the top level keys and values of the file.
+
+        Args:
+            streamKeys (tuple): Keys whose list values are returned one
+                element at a time. Each element is returned with the key.
+
+        Returns:
+            iterator: Iterator returning (key, value) tuples in file order.
+
+        """
+
+        self._readTables()
+
+        data = self._data
+        if data[self._pos] != _DICT:
+            raise Exception("Binary rig definition doesn't contain a dictionary:" + str(self._filepath))
+
+        count = _uint32.unpack_from(data, self._pos + 1)[0]
+        self._pos += 5
+
+        for i in xrange(count):
+            key = self._strings[_uint32.unpack_from(data, self._pos)[0]]
+            self._pos += 4
+
+            if key in streamKeys and data[self._pos] == _LIST:
+                numItems = _uint32.unpack_from(data, self._pos + 1)[0]
+                self._pos += 5
+                for y in xrange(numItems):
+                    yield key, self._readValue()
+
+            else:
+                yield key, self._readValue()
@@ -0,0 +1,211 @@
+"""Kraken - core.io.rig_definition_reader module.
+
+Classes:
+RigDefinitionReader - Incremental reader for rig definition files.
+
+"""
+
+import json
+
+from kraken.core.maths import decodeValue
+
+
+def decodeMathObject(jsonData):
+    """Object hook for the JSON decoder that constructs math objects as soon as
+    their dictionary is parsed.
+
+    Args:
+        jsonData (dict): The parsed JSON object.
+
+    Returns:
+        object: The math object if the dictionary describes one, the
+            dictionary otherwise.
+
+    """
+
+    if '__mathObjectClass__' in jsonData:
+        return decodeValue(jsonData)
+
+    return jsonData
+
+
+class RigDefinitionReader(object):
+    """Reads the top level values of a rig definition file one at a time.
+
+    Only the part of the file needed to decode the current value is kept in
+    memory and math objects are decoded while parsing. Lists stored under the
+    stream keys, such as the components of a rig, are returned one element at
+    a time so each element can be used as soon as it has been read.
+
+    """
+
+    def __init__(self, filepath, chunkSize=65536):
+        super(RigDefinitionReader, self).__init__()
+
+        self._filepath = filepath
+        self._chunkSize = chunkSize
+        self._decoder = json.JSONDecoder(object_hook=decodeMathObject)
+
+        self._file = None
+        self._buffer = ''
+        self._pos = 0
+        self._eof = False
+
+
+    # ===============
+    # Buffer Methods
+    # ===============
+    def _read(self, size=None):
+        """Reads the next chunk of the file in to the buffer, dropping the
+        data that has already been parsed.
+
+        Args:
+            size (int): Minimum number of bytes to read.
+
+        Returns:
+            bool: False if the end of the file has been reached.
+
+        """
+
+        if self._eof:
+            return False
+
+        if size is None or size < self._chunkSize:
+            size = self._chunkSize
+
+        chunk = self._file.read(size)
+        if len(chunk) == 0:
+            self._eof = True
+            return False
+
+        self._buffer = self._buffer[self._pos:] + chunk
+        self._pos = 0
+
+        return True
+
+
+    def _peek(self):
+        """Returns the next character that isn't white space without consuming
+        it.
+
+        Returns:
+            str: The next character, an empty string at the end of the file.
+
+        """
+
+        while True:
+            buf = self._buffer
+            pos = self._pos
+            end = len(buf)
+            while pos < end and buf[pos] in ' \t\n\r':
+                pos += 1
+
+            self._pos = pos
+            if pos < end:
+                return buf[pos]
+
+            if self._read() is False:
+                return ''
+
+
+    def _expect(self, characters):
+        """Consumes the next character that isn't white space.
+
+        Args:
+            characters (str): The characters that are allowed.
+
+        Returns:
+            str: The consumed character.
+
+        """
+
+        character = self._peek()
+        if character == '' or character not in characters:
+            raise Exception("Invalid rig definition file '" + self._filepath + "'. Expected one of '" +
+                            characters + "' but found '" + character + "'.")
+
+        self._pos += 1
+
+        return character
+
+
+    def _decodeValue(self):
+        """Decodes the next JSON value, reading more of the file until the
+        value is complete.
+
+        Returns:
+            object: The decoded value.
+
+        """
+
+        self._peek()
+
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except ValueError:
+                # Incomplete value, read more. Reading at least as much as is
+                # buffered keeps the number of decode attempts logarithmic.
+                if self._read(len(self._buffer) - self._pos) is False:
+                    raise
+
+                continue
+
+            # Numbers and literals can be cut off at the end of the buffer.
+            if end == len(self._buffer) and not self._eof:
+                if self._read() is True:
+                    continue
+
+            self._pos = end
+
+            return value
+
+
+    # ===============
+    # Reader Methods
+    # ===============
+    def iterItems(self, streamKeys=()):
+        """Iterates over the top level keys and values of the file.
+
+        Args:
+            streamKeys (tuple): Keys whose list values are returned one
+                element at a time. Each element is returned with the key.
+
+        Returns:
+            iterator: Iterator returning (key, value) tuples in file order.
+
+        """
+
+        with open(self._filepath, 'r') as rigFile:
+            self._file = rigFile
+            self._buffer = ''
+            self._pos = 0
+            self._eof = False
+
+            self._expect('{')
+            if self._peek() == '}':
+                return
+
+            while True:
+                key = self._decodeValue()
+                self._expect(':')
+
+                if key in streamKeys and self._peek() == '[':
+                    self._expect('[')
+                    if self._peek() == ']':
+                        self._expect(']')
+                    else:
+                        while True:
+                            yield key, self._decodeValue()
+                            if self._expect(',]') == ']':
+                                break
+
+                else:
+                    yield key, self._decodeValue()
+
+                if self._expect(',}') == '}':
+                    break
+
+            self._file = None
+            self._buffer = ''
+            self._pos = 0
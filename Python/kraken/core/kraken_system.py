@@ -11,12 +11,21 @@ import json
 import imp
 import importlib
 from collections import OrderedDict
+from collections import namedtuple
 
-import FabricEngine.Core
+try:
+    import FabricEngine.Core
+except ImportError:
+    FabricEngine = None
 
 import kraken
 from kraken.core.profiler import Profiler
 
+
+# Argument of a KL solver, as returned by KrakenSolver.getArguments().
+SolverArg = namedtuple('SolverArg', ['name', 'connectionType', 'dataType'])
+
+
 class KrakenSystem(object):
     """The KrakenSystem is a singleton object used to provide an interface with
     the FabricEngine Core and RTVal system."""
@@ -36,11 +45,53 @@ class KrakenSystem(object):
         self.registeredConfigs = OrderedDict()
         self.registeredComponents = OrderedDict()
 
+        # Classes found by loadComponentModules whose modules haven't been
+        # imported yet, class path -> manifest entry of the class.
+        self.manifestConfigs = OrderedDict()
+        self.manifestComponents = OrderedDict()
+
+        # Module whose import registered each class, class path -> module path.
+        self.registeringModules = {}
+
+        self.mathBackend = None
+        self.pythonBackend = None
+
+        # Arguments of the solver types, solver type name -> SolverArg list.
+        self.solverArgs = {}
+        self.solverArgCache = None
+        self.extensionVersions = {}
+
+        # Backend evaluating the solvers, with overrides per solver type.
+        self.solverBackend = None
+        self.solverBackends = {}
+        self.pythonSolvers = None
+
+        backend = os.getenv('KRAKEN_MATH_BACKEND')
+        if backend is None:
+            if FabricEngine is None:
+                backend = 'Python'
+            else:
+                backend = 'KL'
+
+        self.setMathBackend(backend)
+
+        solverBackend = os.getenv('KRAKEN_SOLVER_BACKEND')
+        if solverBackend is None:
+            if FabricEngine is None:
+                solverBackend = 'Python'
+            else:
+                solverBackend = 'KL'
+
+        self.setSolverBackend(solverBackend)
+
 
     def loadCoreClient(self):
         """Loads the Fabric Engine Core Client"""
 
         if self.client == None:
+            if FabricEngine is None:
+                raise Exception("Unable to load the Fabric Engine Core Client, the FabricEngine module could not be imported.")
+
             Profiler.getInstance().push("loadCoreClient")
 
             try:
@@ -112,6 +163,67 @@ class KrakenSystem(object):
             self.loadedExtensions.append(extension)
             Profiler.getInstance().pop()
 
+    # ====================
+    # Math Backend Methods
+    # ====================
+
+    def getMathBackend(self):
+        """Returns the name of the backend used by the math objects.
+
+        Returns:
+            str: The name of the math backend, 'KL' or 'Python'.
+
+        """
+
+        return self.mathBackend
+
+
+    def setMathBackend(self, backend):
+        """Sets the backend used by the math objects.
+
+        With the 'KL' backend math objects wrap Fabric Engine RTVals. With the
+        'Python' backend they wrap pure Python values and RTVals are only
+        constructed when MathObject.getRTVal() is called. Math objects created
+        before the backend is changed keep their current values.
+
+        The default backend can be set with the 'KRAKEN_MATH_BACKEND'
+        environment variable.
+
+        Args:
+            backend (str): The name of the math backend, 'KL' or 'Python'.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        if backend not in ('KL', 'Python'):
+            raise Exception("Invalid math backend:" + str(backend) + ". Valid backends are 'KL' and 'Python'.")
+
+        if backend == 'KL' and FabricEngine is None:
+            raise Exception("The 'KL' math backend requires the FabricEngine module.")
+
+        self.mathBackend = backend
+
+        return True
+
+
+    def getPythonBackend(self):
+        """Returns the module implementing the Python math backend.
+
+        The module is imported on first use as it depends on the maths package.
+
+        Returns:
+            object: The kraken.core.maths.python_backend module.
+
+        """
+
+        if self.pythonBackend is None:
+            from kraken.core.maths import python_backend
+            self.pythonBackend = python_backend
+
+        return self.pythonBackend
+
     # ==============
     # RTVal Methods
     # ==============
@@ -133,7 +245,10 @@ class KrakenSystem(object):
 
         if defaultValue is not None:
             if hasattr(defaultValue, '_rtval'):
-                return defaultValue._rtval
+                return defaultValue.getRTVal()
+
+            if self.isPyVal(defaultValue):
+                return defaultValue.toRTVal()
 
             typeDesc = self.typeDescs[dataType]
             if 'members' in typeDesc:
@@ -160,9 +275,55 @@ class KrakenSystem(object):
                     raise Exception("Error constructing RTVal:" + dataType)
 
 
+    def constructPyVal(self, dataType, defaultValue=None):
+        """Constructs a new Python math value using the given name and optional
+        default value.
+
+        Types that have no Python implementation are constructed as RTVals.
+
+        Args:
+            dataType (str): The name of the data type to construct.
+            defaultValue (value): The default value to use to initialize the value.
+
+        Returns:
+            object: The constructed value.
+
+        """
+
+        pythonBackend = self.getPythonBackend()
+
+        if hasattr(defaultValue, '_rtval'):
+            defaultValue = defaultValue._rtval
+
+        if isinstance(defaultValue, pythonBackend.PyMathValue):
+            return defaultValue
+
+        pyType = pythonBackend.MATH_TYPES.get(dataType)
+        if pyType is not None:
+            if defaultValue is None:
+                return pyType()
+
+            if self.isRTVal(defaultValue):
+                return pyType.fromRTVal(defaultValue)
+
+            return self.constructRTVal(dataType, defaultValue)
+
+        simpleType = pythonBackend.SIMPLE_TYPES.get(dataType)
+        if simpleType is not None:
+            if defaultValue is None:
+                return simpleType()
+
+            return simpleType(defaultValue)
+
+        return self.constructRTVal(dataType, defaultValue)
+
+
     def rtVal(self, dataType, defaultValue=None):
         """Constructs a new RTVal using the given name and optional devault value.
 
+        When the 'Python' math backend is active, Python math values are
+        constructed for the types it implements.
+
         Args:
             dataType (str): The name of the data type to construct.
             defaultValue (value): The default value to use to initialize the RTVal
@@ -172,6 +333,9 @@ class KrakenSystem(object):
 
         """
 
+        if self.mathBackend == 'Python':
+            return self.constructPyVal(dataType, defaultValue)
+
         return self.constructRTVal(dataType, defaultValue)
 
 
@@ -189,6 +353,23 @@ class KrakenSystem(object):
         return str(type(value)) == "<type 'PyRTValObject'>"
 
 
+    def isPyVal(self, value):
+        """Returns true if the given value is a Python math value.
+
+        Args:
+            value (value): value to test.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        if self.pythonBackend is None:
+            return False
+
+        return isinstance(value, self.pythonBackend.PyMathValue)
+
+
     def getRTValTypeName(self, rtval):
         """Returns the name of the type, handling extracting the name from KL RTVals.
 
@@ -200,11 +381,319 @@ class KrakenSystem(object):
 
         """
 
-        if ks.isRTVal(rtval):
+        if ks.isPyVal(rtval):
+            return rtval.typeName
+        elif ks.isRTVal(rtval):
             return json.loads(rtval.type("Type").jsonDesc("String"))['name']
         else:
             return "None"
 
+    # ==================
+    # Solver Methods
+    # ==================
+
+    def getExtensionVersion(self, extension):
+        """Returns a version string for a KL extension.
+
+        The extension is found through its manifest file ('<extension>.fpm.json')
+        in the folders of the 'FABRIC_EXTS_PATH' environment variable. The
+        version is made of the version in the manifest and the modification
+        time of the newest file of the extension, so it changes whenever the
+        extension is edited.
+
+        Args:
+            extension (str): The name of the extension.
+
+        Returns:
+            str: The version of the extension, None if it couldn't be found.
+
+        """
+
+        if extension in self.extensionVersions:
+            return self.extensionVersions[extension]
+
+        version = None
+        manifestName = extension + '.fpm.json'
+
+        extsPath = os.getenv('FABRIC_EXTS_PATH')
+        if extsPath is not None:
+            for path in extsPath.split(os.pathsep):
+                if path == '' or not os.path.isdir(path):
+                    continue
+
+                for dirPath, dirNames, fileNames in os.walk(path):
+                    if manifestName not in fileNames:
+                        continue
+
+                    manifestVersion = ''
+                    try:
+                        with open(os.path.join(dirPath, manifestName), 'r') as manifestFile:
+                            manifestVersion = str(json.load(manifestFile).get('version', ''))
+                    except (IOError, ValueError, AttributeError):
+                        pass
+
+                    mtime = 0.0
+                    for extDirPath, extDirNames, extFileNames in os.walk(dirPath):
+                        for fileName in extFileNames:
+                            if fileName.endswith('.kl') or fileName.endswith('.fpm.json'):
+                                mtime = max(mtime, os.path.getmtime(os.path.join(extDirPath, fileName)))
+
+                    version = manifestVersion + ':' + repr(mtime)
+                    break
+
+                if version is not None:
+                    break
+
+        self.extensionVersions[extension] = version
+
+        return version
+
+
+    def getSolverArgCachePath(self):
+        """Returns the path of the solver argument cache file.
+
+        The path can be set with the 'KRAKEN_SOLVER_ARG_CACHE' environment
+        variable and defaults to '.kraken/solverArgCache.json' in the user's
+        home folder.
+
+        Returns:
+            str: The path of the cache file.
+
+        """
+
+        cachePath = os.getenv('KRAKEN_SOLVER_ARG_CACHE')
+        if cachePath is None:
+            cachePath = os.path.join(os.path.expanduser('~'), '.kraken', 'solverArgCache.json')
+
+        return cachePath
+
+
+    def __loadSolverArgCache(self):
+        """Loads the solver argument cache file.
+
+        Returns:
+            dict: The cached solvers, solver type name -> cache entry.
+
+        """
+
+        if self.solverArgCache is None:
+            self.solverArgCache = {}
+
+            cachePath = self.getSolverArgCachePath()
+            if os.path.exists(cachePath):
+                try:
+                    with open(cachePath, 'r') as cacheFile:
+                        cache = json.load(cacheFile)
+
+                    if cache.get('version') == 1:
+                        self.solverArgCache = cache['solvers']
+
+                except (IOError, ValueError, KeyError):
+                    self.solverArgCache = {}
+
+        return self.solverArgCache
+
+
+    def __writeSolverArgCache(self):
+        """Writes the solver argument cache file.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        cachePath = self.getSolverArgCachePath()
+
+        try:
+            cacheDir = os.path.dirname(cachePath)
+            if cacheDir != '' and not os.path.exists(cacheDir):
+                os.makedirs(cacheDir)
+
+            with open(cachePath, 'w') as cacheFile:
+                json.dump({'version': 1, 'solvers': self.solverArgCache}, cacheFile, indent=2)
+
+        except (IOError, OSError), e:
+            print "Unable to write the solver argument cache '" + cachePath + "': " + str(e)
+            return False
+
+        return True
+
+
+    def getSolverBackend(self, solverTypeName=None):
+        """Returns the name of the backend evaluating a solver type.
+
+        Args:
+            solverTypeName (str): The name of the solver type, None for the
+                default backend.
+
+        Returns:
+            str: The name of the solver backend, 'KL' or 'Python'.
+
+        """
+
+        return self.solverBackends.get(solverTypeName, self.solverBackend)
+
+
+    def setSolverBackend(self, backend, solverTypeName=None):
+        """Sets the backend evaluating the solvers.
+
+        With the 'KL' backend SpliceOperators evaluate the KL solvers. With the
+        'Python' backend they evaluate the Python implementations of the
+        solvers, see getPythonSolverClass, and fall back to KL for the solver
+        types that have none.
+
+        The default backend can be set with the 'KRAKEN_SOLVER_BACKEND'
+        environment variable.
+
+        Args:
+            backend (str): The name of the solver backend, 'KL' or 'Python'.
+            solverTypeName (str): The name of the solver type to set the
+                backend of, None to set the default backend.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        if backend not in ('KL', 'Python'):
+            raise Exception("Invalid solver backend:" + str(backend) + ". Valid backends are 'KL' and 'Python'.")
+
+        if solverTypeName is None:
+            self.solverBackend = backend
+        else:
+            self.solverBackends[solverTypeName] = backend
+
+        return True
+
+
+    def getPythonSolvers(self):
+        """Returns the module implementing the Python solvers.
+
+        The module is imported on first use as it depends on the maths package.
+
+        Returns:
+            object: The kraken.core.objects.operators.python_solvers module.
+
+        """
+
+        if self.pythonSolvers is None:
+            self.getPythonBackend()
+
+            from kraken.core.objects.operators import python_solvers
+            self.pythonSolvers = python_solvers
+
+        return self.pythonSolvers
+
+
+    def registerPythonSolver(self, solverClass):
+        """Registers a Python implementation of a solver type.
+
+        Args:
+            solverClass (object): The solver class, its typeName is the name of
+                the KL solver type it implements.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        self.getPythonSolvers().SOLVER_TYPES[solverClass.typeName] = solverClass
+
+        return True
+
+
+    def getPythonSolverClass(self, solverTypeName):
+        """Returns the Python implementation of a solver type.
+
+        Args:
+            solverTypeName (str): The name of the solver type.
+
+        Returns:
+            object: The solver class, None if the solver type has no Python
+                implementation or the 'KL' backend evaluates it.
+
+        """
+
+        if self.getSolverBackend(solverTypeName) != 'Python':
+            return None
+
+        return self.getPythonSolvers().SOLVER_TYPES.get(solverTypeName)
+
+
+    def getSolverArgs(self, solverTypeName, extension):
+        """Returns the arguments of a KL solver type.
+
+        The arguments are queried from KL once per solver type and shared by
+        all the operators using the type. They are also cached on disk, see
+        getSolverArgCachePath, together with the versions of the 'Kraken'
+        extension and of the solver's extension. Cached arguments are used as
+        long as the extension versions match, so no Fabric Engine client is
+        needed to construct operators of cached solver types. Solver types
+        evaluated by the 'Python' backend return the arguments of their Python
+        implementation.
+
+        Args:
+            solverTypeName (str): The name of the KL solver type.
+            extension (str): The name of the extension defining the solver.
+
+        Returns:
+            list: The SolverArg tuples of the solver.
+
+        """
+
+        solverClass = self.getPythonSolverClass(solverTypeName)
+        if solverClass is not None:
+            return solverClass.getArguments()
+
+        args = self.solverArgs.get(solverTypeName)
+        if args is not None:
+            return args
+
+        extensions = ['Kraken']
+        if extension != 'Kraken':
+            extensions.append(extension)
+
+        versions = [self.getExtensionVersion(x) for x in extensions]
+        if None in versions:
+            versions = None
+
+        cache = self.__loadSolverArgCache()
+        entry = cache.get(solverTypeName)
+        if versions is not None and entry is not None and entry.get('extension') == extension and entry.get('versions') == versions:
+            args = [SolverArg(*[str(x) for x in arg]) for arg in entry['args']]
+
+        else:
+            Profiler.getInstance().push("getSolverArgs:" + solverTypeName)
+
+            self.loadCoreClient()
+            for x in extensions:
+                self.loadExtension(x)
+
+            solverRTVal = self.constructRTVal(solverTypeName)
+            rtvalArgs = solverRTVal.getArguments('KrakenSolverArg[]')
+
+            args = []
+            for i in xrange(len(rtvalArgs)):
+                arg = rtvalArgs[i]
+                args.append(SolverArg(str(arg.name), str(arg.connectionType), str(arg.dataType)))
+
+            Profiler.getInstance().pop()
+
+            # Only persist arguments of extensions with a known version, the
+            # cached entry couldn't be invalidated otherwise.
+            if versions is not None:
+                cache[solverTypeName] = {
+                    'extension': extension,
+                    'versions': versions,
+                    'args': [list(arg) for arg in args]
+                }
+
+                self.__writeSolverArgCache()
+
+        self.solverArgs[solverTypeName] = args
+
+        return args
+
     # ==================
     # Config Methods
     # ==================
@@ -237,6 +726,9 @@ class KrakenSystem(object):
 
         """
 
+        if className not in self.registeredConfigs and className in self.manifestConfigs:
+            importlib.import_module(self.manifestConfigs[className]['module'])
+
         if className not in self.registeredConfigs:
             raise Exception("Config with that class not registered:" + className)
 
@@ -246,12 +738,20 @@ class KrakenSystem(object):
     def getConfigClassNames(self):
         """Returns the names of the registered Python config classes
 
+        Configs found by loadComponentModules are included even if their
+        modules haven't been imported yet.
+
         Returns:
             list: The array of config class names.
 
         """
 
-        return self.registeredConfigs.keys()
+        # Classes stay in the manifest once they are imported, which keeps the
+        # order of the names stable.
+        classNames = self.manifestConfigs.keys()
+        classNames.extend([x for x in self.registeredConfigs if x not in self.manifestConfigs])
+
+        return classNames
 
     # ==================
     # Component Methods
@@ -285,6 +785,9 @@ class KrakenSystem(object):
 
         """
 
+        if className not in self.registeredComponents and className in self.manifestComponents:
+            importlib.import_module(self.manifestComponents[className]['module'])
+
         if className not in self.registeredComponents:
             raise Exception("Component with that class not registered:" + className)
 
@@ -294,23 +797,54 @@ class KrakenSystem(object):
     def getComponentClassNames(self):
         """Returns the names of the registered Python component classes
 
+        Components found by loadComponentModules are included even if their
+        modules haven't been imported yet.
+
         Returns:
             list: The array of component class names.
 
         """
 
-        return self.registeredComponents.keys()
+        # Classes stay in the manifest once they are imported, which keeps the
+        # order of the names stable.
+        classNames = self.manifestComponents.keys()
+        classNames.extend([x for x in self.registeredComponents if x not in self.manifestComponents])
 
+        return classNames
 
-    def loadComponentModules(self):
-        """Loads all the component modules and configs specified in the 'KRAKEN_PATHS' environment variable.
 
-        The kraken_examples are loaded at all times.
+    def getComponentType(self, className):
+        """Returns the component type of a component class, e.g. 'Guide',
+        without importing its module if it is in the manifest.
+
+        Args:
+            className (str): The name of the Python component class
+
+        Returns:
+            str: The component type of the class.
+
+        """
+
+        if className not in self.registeredComponents and className in self.manifestComponents:
+            return self.manifestComponents[className]['componentType']
+
+        return self.getComponentClass(className).getComponentType()
+
+
+    def findComponentModules(self):
+        """Finds the modules in the kraken_examples package and in the packages
+        specified in the 'KRAKEN_PATHS' environment variable.
+
+        The parent folders of the top level packages are added to sys.path.
+
+        Returns:
+            list: (module path, file path) tuples of the modules.
 
         """
 
+        modules = []
 
-        def __importDirRecursive(path, parentModulePath=''):
+        def __findDirRecursive(path, parentModulePath=''):
             contents = os.listdir(path)
             moduleFilefound = False
             for item in contents:
@@ -330,39 +864,197 @@ class KrakenSystem(object):
             if moduleFilefound:
                 for item in contents:
                     if os.path.isfile(os.path.join(path, item)):
-                        # parse all the files of given path and import python modules
+                        # parse all the files of given path and collect python modules
                         if item.endswith(".py") and item != "__init__.py":
-                            module = modulePath+"."+item[:-3]
-                            try:
-                                importlib.import_module(module)
-
-                            except ImportError, e:
-                                print e
-                                for arg in e.args:
-                                    print arg
-
-                            except Exception, e:
-                                for arg in e.args:
-                                    print arg
+                            modules.append((modulePath + "." + item[:-3], os.path.join(path, item)))
 
 
             for item in contents:
                 if os.path.isdir(os.path.join(path, item)):
                     if moduleFilefound:
-                        __importDirRecursive(os.path.join(path, item), modulePath)
+                        __findDirRecursive(os.path.join(path, item), modulePath)
                     else:
-                        __importDirRecursive(os.path.join(path, item))
+                        __findDirRecursive(os.path.join(path, item))
 
 
         # find the kraken examples module in the same folder as the kraken module.
         examplePaths = os.path.join(os.path.dirname(os.path.dirname(kraken.__file__)), 'kraken_examples')
-        __importDirRecursive(examplePaths)
+        __findDirRecursive(examplePaths)
 
         pathsVar = os.getenv('KRAKEN_PATHS')
         if pathsVar is not None:
             pathsList = pathsVar.split(';')
             for path in pathsList:
-                __importDirRecursive(path)
+                __findDirRecursive(path)
+
+        return modules
+
+
+    def getManifestPath(self):
+        """Returns the path of the component manifest file.
+
+        The path can be set with the 'KRAKEN_COMPONENT_MANIFEST' environment
+        variable and defaults to '.kraken/componentManifest.json' in the user's
+        home folder.
+
+        Returns:
+            str: The path of the manifest file.
+
+        """
+
+        manifestPath = os.getenv('KRAKEN_COMPONENT_MANIFEST')
+        if manifestPath is None:
+            manifestPath = os.path.join(os.path.expanduser('~'), '.kraken', 'componentManifest.json')
+
+        return manifestPath
+
+
+    def __importComponentModule(self, module):
+        """Imports a component module and returns the manifest entries of the
+        component and config classes it registers.
+
+        Args:
+            module (str): The module path.
+
+        Returns:
+            dict: Lists of the registered 'components' and 'configs', None if
+                the module couldn't be imported.
+
+        """
+
+        registeredClasses = set(self.registeredComponents.keys() + self.registeredConfigs.keys())
+
+        try:
+            importlib.import_module(module)
+
+        except ImportError, e:
+            print e
+            for arg in e.args:
+                print arg
+
+            return None
+
+        except Exception, e:
+            for arg in e.args:
+                print arg
+
+            return None
+
+        # Classes registered while importing the module are recorded under it,
+        # as importing it registers them wherever they are defined. Classes
+        # registered before without a known registering module are recorded
+        # under the module defining them.
+        prefix = module + '.'
+        for className in self.registeredComponents.keys() + self.registeredConfigs.keys():
+            if className in registeredClasses:
+                if className in self.registeringModules:
+                    continue
+
+                if not className.startswith(prefix) or '.' in className[len(prefix):]:
+                    continue
+
+            self.registeringModules[className] = module
+
+        components = []
+        for className, componentClass in self.registeredComponents.iteritems():
+            if self.registeringModules.get(className) == module:
+                components.append({
+                    'class': className,
+                    'componentType': componentClass.getComponentType()
+                })
+
+        configs = []
+        for className in self.registeredConfigs:
+            if self.registeringModules.get(className) == module:
+                configs.append({'class': className})
+
+        return {'components': components, 'configs': configs}
+
+
+    def loadComponentModules(self, manifestPath=None):
+        """Loads all the component modules and configs specified in the 'KRAKEN_PATHS' environment variable.
+
+        The kraken_examples are loaded at all times.
+
+        The classes of each module are cached in a manifest file together with
+        the modification time of the module. Modules that haven't changed since
+        they were added to the manifest aren't imported, their classes are
+        imported on demand by getComponentClass and getConfigClass. The classes
+        found by a previous call are forgotten, so classes whose module was
+        removed or no longer registers them aren't imported on demand.
+
+        Args:
+            manifestPath (str): The path of the manifest file, see
+                getManifestPath for the default.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        if manifestPath is None:
+            manifestPath = self.getManifestPath()
+
+        manifestFiles = {}
+        if os.path.exists(manifestPath):
+            try:
+                with open(manifestPath, 'r') as manifestFile:
+                    manifest = json.load(manifestFile)
+
+                if manifest.get('version') == 1:
+                    manifestFiles = manifest['files']
+
+            except (IOError, ValueError, KeyError):
+                manifestFiles = {}
+
+        self.manifestComponents = OrderedDict()
+        self.manifestConfigs = OrderedDict()
+
+        files = {}
+        changed = False
+        for module, filePath in self.findComponentModules():
+            mtime = os.path.getmtime(filePath)
+
+            entry = manifestFiles.get(filePath)
+            if entry is None or entry['mtime'] != mtime or entry['module'] != module:
+                classes = self.__importComponentModule(module)
+                changed = True
+                if classes is None:
+                    continue
+
+                entry = {
+                    'module': module,
+                    'mtime': mtime,
+                    'components': classes['components'],
+                    'configs': classes['configs']
+                }
+
+            files[filePath] = entry
+
+            for componentEntry in entry['components']:
+                self.manifestComponents[componentEntry['class']] = {
+                    'module': module,
+                    'componentType': componentEntry['componentType']
+                }
+
+            for configEntry in entry['configs']:
+                self.manifestConfigs[configEntry['class']] = {
+                    'module': module
+                }
+
+        if changed or len(files) != len(manifestFiles):
+            try:
+                manifestDir = os.path.dirname(manifestPath)
+                if manifestDir != '' and not os.path.exists(manifestDir):
+                    os.makedirs(manifestDir)
+
+                with open(manifestPath, 'w') as manifestFile:
+                    json.dump({'version': 1, 'files': files}, manifestFile, indent=2)
+
+            except (IOError, OSError), e:
+                print "Unable to write the component manifest '" + manifestPath + "': " + str(e)
+
+        return True
 
 
     @classmethod
@@ -9,6 +9,8 @@ from xfo import Xfo
 from mat33 import Mat33
 from mat44 import Mat44
 from rotation_order import RotationOrder
+from vec3_array import Vec3Array
+from xfo_array import XfoArray
 
 
 PI = 3.141592653589793
@@ -46,7 +46,7 @@ class Euler(MathObject):
         super(Euler, self).__init__()
 
         if ks.getRTValTypeName(x) == 'Euler':
-            self._rtval = x
+            self.setRTVal(x)
         else:
 
             if x is not None and not isinstance(x, (int, float)) and not isinstance(x, Euler):
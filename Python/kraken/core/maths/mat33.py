@@ -18,7 +18,7 @@ class Mat33(MathObject):
         super(Mat33, self).__init__()
 
         if ks.getRTValTypeName(row0) == 'Mat33':
-            self._rtval = row0
+            self.setRTVal(row0)
         else:
             self._rtval = ks.rtVal('Mat33')
             if isinstance(row0, Mat33):
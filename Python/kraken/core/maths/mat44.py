@@ -19,7 +19,7 @@ class Mat44(MathObject):
         super(Mat44, self).__init__()
 
         if ks.getRTValTypeName(row0) == 'Mat44':
-            self._rtval = row0
+            self.setRTVal(row0)
         else:
             self._rtval = ks.rtVal('Mat44')
             if isinstance(row0, Mat33):
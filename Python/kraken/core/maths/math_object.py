@@ -5,7 +5,8 @@ MathObject -- A base class for all math types.
 """
 
 import json
-import FabricEngine.Core
+
+from kraken.core.kraken_system import ks
 
 
 class MathObject(object):
@@ -21,11 +22,17 @@ class MathObject(object):
     def getRTVal(self):
         """Returns the internal RTVal object owned by the math object.
 
+        When the math object holds a Python math value, an RTVal is constructed
+        from it.
+
         Returns:
             object: RTVal
 
         """
 
+        if ks.isPyVal(self._rtval):
+            return self._rtval.toRTVal()
+
         return self._rtval
 
 
@@ -37,6 +44,9 @@ class MathObject(object):
 
         """
 
+        if ks.getMathBackend() == 'Python' and ks.isRTVal(rtval):
+            rtval = ks.getPythonBackend().MATH_TYPES[ks.getRTValTypeName(rtval)].fromRTVal(rtval)
+
         self._rtval = rtval
 
 
@@ -0,0 +1,1463 @@
+"""Kraken - maths.python_backend module.
+
+Pure Python implementations of the KL Math types used by the Kraken math
+classes. When the KrakenSystem math backend is set to 'Python', these objects
+are stored in the '_rtval' member of the math objects in place of the
+FabricEngine RTVals. They follow the same calling convention as RTVals (the
+first argument of every method is the name of the return type) so the math
+classes work unchanged on either backend.
+
+RTVals are only constructed from these values at the DCC / Splice boundary
+through MathObject.getRTVal().
+
+Classes:
+PyMathValue -- Base class for all Python math values.
+PyVec2 -- Python implementation of the KL Vec2 type.
+PyVec3 -- Python implementation of the KL Vec3 type.
+PyVec4 -- Python implementation of the KL Vec4 type.
+PyRotationOrder -- Python implementation of the KL RotationOrder type.
+PyEuler -- Python implementation of the KL Euler type.
+PyQuat -- Python implementation of the KL Quat type.
+PyMat33 -- Python implementation of the KL Mat33 type.
+PyMat44 -- Python implementation of the KL Mat44 type.
+PyXfo -- Python implementation of the KL Xfo type.
+
+"""
+
+import math
+
+
+PRECISION = 1.0e-5
+DIVIDEPRECISION = 1.0e-9
+
+# Simple KL types are represented by the matching Python value types.
+SIMPLE_TYPES = {
+    'Boolean': bool,
+    'Scalar': float,
+    'Float32': float,
+    'Float64': float,
+    'Integer': int,
+    'SInt32': int,
+    'UInt32': int,
+    'UInt8': int,
+    'Size': int,
+    'Index': int,
+    'String': str
+}
+
+
+def _clamp(value, minValue, maxValue):
+    return max(minValue, min(maxValue, value))
+
+
+class PyMathValue(object):
+    """Base class for all Python math values."""
+
+    __slots__ = ()
+
+    typeName = None
+    members = ()
+
+
+    def __str__(self):
+        values = []
+        for name, memberType in self.members:
+            values.append(name + ":" + str(getattr(self, name)))
+
+        return self.typeName + "{" + ", ".join(values) + "}"
+
+
+    def clone(self):
+        """Returns a deep copy of this value.
+
+        Returns:
+            object: The cloned value.
+
+        """
+
+        value = self.__class__()
+        value.copy(self)
+
+        return value
+
+
+    def copy(self, other):
+        """Copies the members of the other value in to this one.
+
+        Args:
+            other (object): Value of the same type to copy from.
+
+        Returns:
+            object: This value.
+
+        """
+
+        for name, memberType in self.members:
+            member = getattr(other, name)
+            if isinstance(member, PyMathValue):
+                getattr(self, name).copy(member)
+            else:
+                setattr(self, name, member)
+
+        return self
+
+
+    def toRTVal(self):
+        """Constructs a FabricEngine RTVal holding the same value.
+
+        Returns:
+            object: The constructed RTVal.
+
+        """
+
+        from kraken.core.kraken_system import ks
+
+        rtval = ks.constructRTVal(self.typeName)
+        for name, memberType in self.members:
+            member = getattr(self, name)
+            if isinstance(member, PyMathValue):
+                setattr(rtval, name, member.toRTVal())
+            else:
+                setattr(rtval, name, ks.constructRTVal(memberType, member))
+
+        return rtval
+
+
+    @classmethod
+    def fromRTVal(cls, rtval):
+        """Constructs a Python value from a FabricEngine RTVal.
+
+        Args:
+            rtval (object): The RTVal to read the members from.
+
+        Returns:
+            object: The constructed Python value.
+
+        """
+
+        value = cls()
+        for name, memberType in cls.members:
+            member = getattr(rtval, name)
+            if memberType in MATH_TYPES:
+                setattr(value, name, MATH_TYPES[memberType].fromRTVal(member))
+            else:
+                setattr(value, name, SIMPLE_TYPES[memberType](member))
+
+        return value
+
+
+    def equal(self, returnType, other):
+        return self._values() == other._values()
+
+
+    def almostEqual(self, returnType, other, precision=PRECISION):
+        for a, b in zip(self._values(), other._values()):
+            if abs(a - b) >= precision:
+                return False
+
+        return True
+
+
+# =========
+# Vectors
+# =========
+class _PyVector(PyMathValue):
+    """Shared implementation of the vector types."""
+
+    __slots__ = ()
+
+    components = ()
+
+
+    def _values(self):
+        return tuple(getattr(self, name) for name in self.components)
+
+
+    @classmethod
+    def _fromValues(cls, values):
+        return cls(*values)
+
+
+    def set(self, returnType, *values):
+        for name, value in zip(self.components, values):
+            setattr(self, name, float(value))
+
+
+    def setNull(self, returnType):
+        for name in self.components:
+            setattr(self, name, 0.0)
+
+
+    def component(self, returnType, i):
+        return getattr(self, self.components[i])
+
+
+    def setComponent(self, returnType, i, v):
+        setattr(self, self.components[i], float(v))
+
+
+    def add(self, returnType, other):
+        return self._fromValues([a + b for a, b in zip(self._values(), other._values())])
+
+
+    def subtract(self, returnType, other):
+        return self._fromValues([a - b for a, b in zip(self._values(), other._values())])
+
+
+    def multiply(self, returnType, other):
+        return self._fromValues([a * b for a, b in zip(self._values(), other._values())])
+
+
+    def divide(self, returnType, other):
+        return self._fromValues([a / b for a, b in zip(self._values(), other._values())])
+
+
+    def multiplyScalar(self, returnType, other):
+        return self._fromValues([a * other for a in self._values()])
+
+
+    def divideScalar(self, returnType, other):
+        return self._fromValues([a / other for a in self._values()])
+
+
+    def negate(self, returnType):
+        return self._fromValues([-a for a in self._values()])
+
+
+    def inverse(self, returnType):
+        return self._fromValues([1.0 / a for a in self._values()])
+
+
+    def dot(self, returnType, other):
+        return sum([a * b for a, b in zip(self._values(), other._values())])
+
+
+    def lengthSquared(self, returnType):
+        return self.dot('Scalar', self)
+
+
+    def length(self, returnType):
+        return math.sqrt(self.dot('Scalar', self))
+
+
+    def unit(self, returnType):
+        length = self.length('Scalar')
+        if length < DIVIDEPRECISION:
+            return self._fromValues([0.0 for a in self._values()])
+
+        return self.divideScalar(returnType, length)
+
+
+    def unit_safe(self, returnType):
+        length = self.length('Scalar')
+        if length < DIVIDEPRECISION:
+            return self.clone()
+
+        return self.divideScalar(returnType, length)
+
+
+    def setUnit(self, returnType):
+        length = self.length('Scalar')
+        if length >= DIVIDEPRECISION:
+            self.copy(self.divideScalar(returnType, length))
+
+        return length
+
+
+    def normalize(self, returnType):
+        return self.setUnit(returnType)
+
+
+    def clamp(self, returnType, minValue, maxValue):
+        return self._fromValues([_clamp(a, lo, hi) for a, lo, hi in
+                                 zip(self._values(), minValue._values(), maxValue._values())])
+
+
+    def unitsAngleTo(self, returnType, other):
+        return math.acos(_clamp(self.dot('Scalar', other), -1.0, 1.0))
+
+
+    def angleTo(self, returnType, other):
+        return self.unit(self.typeName).unitsAngleTo('Scalar', other.unit(self.typeName))
+
+
+    def distanceTo(self, returnType, other):
+        return self.subtract(self.typeName, other).length('Scalar')
+
+
+    def linearInterpolate(self, returnType, other, t):
+        return self._fromValues([a + (b - a) * t for a, b in zip(self._values(), other._values())])
+
+
+    def distanceToLine(self, returnType, lineP0, lineP1):
+        direction = lineP1.subtract(self.typeName, lineP0)
+        lengthSquared = direction.lengthSquared('Scalar')
+        if lengthSquared < DIVIDEPRECISION:
+            return self.distanceTo('Scalar', lineP0)
+
+        t = self.subtract(self.typeName, lineP0).dot('Scalar', direction) / lengthSquared
+        closest = lineP0.add(self.typeName, direction.multiplyScalar(self.typeName, t))
+
+        return self.distanceTo('Scalar', closest)
+
+
+    def distanceToSegment(self, returnType, segmentP0, segmentP1):
+        direction = segmentP1.subtract(self.typeName, segmentP0)
+        lengthSquared = direction.lengthSquared('Scalar')
+        if lengthSquared < DIVIDEPRECISION:
+            return self.distanceTo('Scalar', segmentP0)
+
+        t = self.subtract(self.typeName, segmentP0).dot('Scalar', direction) / lengthSquared
+        t = _clamp(t, 0.0, 1.0)
+        closest = segmentP0.add(self.typeName, direction.multiplyScalar(self.typeName, t))
+
+        return self.distanceTo('Scalar', closest)
+
+
+class PyVec2(_PyVector):
+    """Python implementation of the KL Vec2 type."""
+
+    __slots__ = ('x', 'y')
+
+    typeName = 'Vec2'
+    components = ('x', 'y')
+    members = (('x', 'Scalar'), ('y', 'Scalar'))
+
+
+    def __init__(self, x=0.0, y=0.0):
+        self.x = x
+        self.y = y
+
+
+    def cross(self, returnType, other):
+        return self.x * other.y - self.y * other.x
+
+
+class PyVec3(_PyVector):
+    """Python implementation of the KL Vec3 type.
+
+    The most frequently used methods are written out explicitly as Vec3 is by
+    far the most common math type in a rig.
+
+    """
+
+    __slots__ = ('x', 'y', 'z')
+
+    typeName = 'Vec3'
+    components = ('x', 'y', 'z')
+    members = (('x', 'Scalar'), ('y', 'Scalar'), ('z', 'Scalar'))
+
+
+    def __init__(self, x=0.0, y=0.0, z=0.0):
+        self.x = x
+        self.y = y
+        self.z = z
+
+
+    def _values(self):
+        return (self.x, self.y, self.z)
+
+
+    def clone(self):
+        return PyVec3(self.x, self.y, self.z)
+
+
+    def copy(self, other):
+        self.x = other.x
+        self.y = other.y
+        self.z = other.z
+
+        return self
+
+
+    def set(self, returnType, x, y, z):
+        self.x = float(x)
+        self.y = float(y)
+        self.z = float(z)
+
+
+    def add(self, returnType, other):
+        return PyVec3(self.x + other.x, self.y + other.y, self.z + other.z)
+
+
+    def subtract(self, returnType, other):
+        return PyVec3(self.x - other.x, self.y - other.y, self.z - other.z)
+
+
+    def multiply(self, returnType, other):
+        return PyVec3(self.x * other.x, self.y * other.y, self.z * other.z)
+
+
+    def multiplyScalar(self, returnType, other):
+        return PyVec3(self.x * other, self.y * other, self.z * other)
+
+
+    def negate(self, returnType):
+        return PyVec3(-self.x, -self.y, -self.z)
+
+
+    def dot(self, returnType, other):
+        return self.x * other.x + self.y * other.y + self.z * other.z
+
+
+    def cross(self, returnType, other):
+        return PyVec3(self.y * other.z - self.z * other.y,
+                      self.z * other.x - self.x * other.z,
+                      self.x * other.y - self.y * other.x)
+
+
+    def length(self, returnType):
+        return math.sqrt(self.x * self.x + self.y * self.y + self.z * self.z)
+
+
+    def unit(self, returnType):
+        length = math.sqrt(self.x * self.x + self.y * self.y + self.z * self.z)
+        if length < DIVIDEPRECISION:
+            return PyVec3()
+
+        return PyVec3(self.x / length, self.y / length, self.z / length)
+
+
+    def distanceTo(self, returnType, other):
+        dx = self.x - other.x
+        dy = self.y - other.y
+        dz = self.z - other.z
+
+        return math.sqrt(dx * dx + dy * dy + dz * dz)
+
+
+class PyVec4(_PyVector):
+    """Python implementation of the KL Vec4 type."""
+
+    __slots__ = ('x', 'y', 'z', 't')
+
+    typeName = 'Vec4'
+    components = ('x', 'y', 'z', 't')
+    members = (('x', 'Scalar'), ('y', 'Scalar'), ('z', 'Scalar'), ('t', 'Scalar'))
+
+
+    def __init__(self, x=0.0, y=0.0, z=0.0, t=0.0):
+        self.x = x
+        self.y = y
+        self.z = z
+        self.t = t
+
+
+# ================
+# Rotation Order
+# ================
+class PyRotationOrder(PyMathValue):
+    """Python implementation of the KL RotationOrder type.
+
+    The matrix of a rotation order 'ABC' is computed as RA * RB * RC.
+
+    """
+
+    __slots__ = ('order',)
+
+    typeName = 'RotationOrder'
+    members = (('order', 'Integer'),)
+
+    # Axis indices for each of the rotation orders.
+    axes = ((0, 1, 2), (1, 2, 0), (2, 0, 1), (0, 2, 1), (2, 1, 0), (1, 0, 2))
+
+
+    def __init__(self, order=0):
+        self.order = order
+
+
+    def _values(self):
+        return (self.order,)
+
+
+    def setXYZ(self, returnType):
+        self.order = 0
+
+
+    def setYZX(self, returnType):
+        self.order = 1
+
+
+    def setZXY(self, returnType):
+        self.order = 2
+
+
+    def setXZY(self, returnType):
+        self.order = 3
+
+
+    def setZYX(self, returnType):
+        self.order = 4
+
+
+    def setYXZ(self, returnType):
+        self.order = 5
+
+
+    def isReversed(self, returnType):
+        return self.order > 2
+
+
+# ========
+# Euler
+# ========
+class PyEuler(PyMathValue):
+    """Python implementation of the KL Euler type."""
+
+    __slots__ = ('x', 'y', 'z', '_ro')
+
+    typeName = 'Euler'
+    members = (('x', 'Scalar'), ('y', 'Scalar'), ('z', 'Scalar'), ('ro', 'RotationOrder'))
+
+
+    def __init__(self, x=0.0, y=0.0, z=0.0, ro=None):
+        self.x = x
+        self.y = y
+        self.z = z
+        self._ro = PyRotationOrder()
+        if ro is not None:
+            self._ro.copy(ro)
+
+
+    @property
+    def ro(self):
+        return self._ro
+
+
+    @ro.setter
+    def ro(self, value):
+        self._ro.copy(value)
+
+
+    def _values(self):
+        return (self.x, self.y, self.z, self._ro.order)
+
+
+    def set(self, returnType, x, y, z, ro=None):
+        self.x = float(x)
+        self.y = float(y)
+        self.z = float(z)
+        if ro is not None:
+            self._ro.copy(ro)
+
+
+    def toMat33(self, returnType):
+        angles = (self.x, self.y, self.z)
+        result = None
+        for axis in self._ro.axes[self._ro.order]:
+            axisMat = _axisRotationMat33(axis, angles[axis])
+            if result is None:
+                result = axisMat
+            else:
+                result = result.multiply('Mat33', axisMat)
+
+        return result
+
+
+# ============
+# Quaternion
+# ============
+class PyQuat(PyMathValue):
+    """Python implementation of the KL Quat type."""
+
+    __slots__ = ('_v', 'w')
+
+    typeName = 'Quat'
+    members = (('v', 'Vec3'), ('w', 'Scalar'))
+
+
+    def __init__(self, v=None, w=1.0):
+        if v is None:
+            self._v = PyVec3()
+        else:
+            self._v = v
+        self.w = w
+
+
+    @property
+    def v(self):
+        return self._v
+
+
+    @v.setter
+    def v(self, value):
+        self._v.copy(value)
+
+
+    def _values(self):
+        return (self._v.x, self._v.y, self._v.z, self.w)
+
+
+    def clone(self):
+        return PyQuat(self._v.clone(), self.w)
+
+
+    def copy(self, other):
+        self._v.copy(other._v)
+        self.w = other.w
+
+        return self
+
+
+    def set(self, returnType, v, w):
+        self._v.copy(v)
+        self.w = float(w)
+
+
+    def setIdentity(self, returnType):
+        self._v.setNull('')
+        self.w = 1.0
+
+
+    def setFromEuler(self, returnType, euler, ro=None):
+        if isinstance(euler, PyVec3):
+            euler = PyEuler(euler.x, euler.y, euler.z, ro)
+
+        angles = (euler.x, euler.y, euler.z)
+        result = None
+        for axis in euler.ro.axes[euler.ro.order]:
+            halfAngle = angles[axis] * 0.5
+            axisVec = [0.0, 0.0, 0.0]
+            axisVec[axis] = math.sin(halfAngle)
+            axisQuat = PyQuat(PyVec3(*axisVec), math.cos(halfAngle))
+            if result is None:
+                result = axisQuat
+            else:
+                result = result.multiply('Quat', axisQuat)
+
+        self.copy(result)
+
+        return self
+
+
+    def setFromAxisAndAngle(self, returnType, axis, angle):
+        halfAngle = angle * 0.5
+        self._v.copy(axis.unit('Vec3').multiplyScalar('Vec3', math.sin(halfAngle)))
+        self.w = math.cos(halfAngle)
+
+        return self
+
+
+    def setFromMat33(self, returnType, mat):
+        x, y, z, w = quatValuesFromMat33(mat._values())
+        self._v.set('', x, y, z)
+        self.w = w
+
+        return self
+
+
+    def setFrom2Vectors(self, returnType, sourceDirVec, destDirVec, arbitraryIfAmbiguous=True):
+        val = sourceDirVec.dot('Scalar', destDirVec) + 1.0
+        if val <= PRECISION:
+            # the vectors pointed in opposite directions.
+            if arbitraryIfAmbiguous:
+                axis = PyVec3(1.0, 0.0, 0.0).cross('Vec3', sourceDirVec)
+                if axis.lengthSquared('Scalar') < PRECISION:
+                    axis = PyVec3(0.0, 1.0, 0.0).cross('Vec3', sourceDirVec)
+                self._v.copy(axis.unit('Vec3'))
+            else:
+                self._v.setNull('')
+            self.w = 0.0
+        else:
+            val = math.sqrt(2.0 * val)
+            self._v.copy(sourceDirVec.cross('Vec3', destDirVec).divideScalar('Vec3', val))
+            self.w = val * 0.5
+
+        return self
+
+
+    def setFromDirectionAndUpvector(self, returnType, direction, upvector):
+        zAxis = direction.unit_safe('Vec3')
+        yAxis = upvector.unit_safe('Vec3')
+        xAxis = yAxis.cross('Vec3', zAxis).unit_safe('Vec3')
+        yAxis = zAxis.cross('Vec3', xAxis).unit_safe('Vec3')
+
+        mat = PyMat33()
+        mat.setColumns('', xAxis, yAxis, zAxis)
+
+        return self.setFromMat33(returnType, mat)
+
+
+    def add(self, returnType, other):
+        return PyQuat(self._v.add('Vec3', other._v), self.w + other.w)
+
+
+    def subtract(self, returnType, other):
+        return PyQuat(self._v.subtract('Vec3', other._v), self.w - other.w)
+
+
+    def multiply(self, returnType, other):
+        av = self._v
+        bv = other._v
+        aw = self.w
+        bw = other.w
+
+        return PyQuat(PyVec3(aw * bv.x + bw * av.x + av.y * bv.z - av.z * bv.y,
+                             aw * bv.y + bw * av.y + av.z * bv.x - av.x * bv.z,
+                             aw * bv.z + bw * av.z + av.x * bv.y - av.y * bv.x),
+                      aw * bw - (av.x * bv.x + av.y * bv.y + av.z * bv.z))
+
+
+    def divide(self, returnType, other):
+        return self.multiply(returnType, other.inverse('Quat'))
+
+
+    def multiplyScalar(self, returnType, other):
+        return PyQuat(self._v.multiplyScalar('Vec3', other), self.w * other)
+
+
+    def divideScalar(self, returnType, other):
+        return PyQuat(self._v.divideScalar('Vec3', other), self.w / other)
+
+
+    def rotateVector(self, returnType, v):
+        # Equivalent to (q * Quat(v, 0.0) * q.conjugate()).v
+        qv = self._v
+        t = qv.cross('Vec3', v).multiplyScalar('Vec3', 2.0)
+
+        return v.add('Vec3', t.multiplyScalar('Vec3', self.w)).add('Vec3', qv.cross('Vec3', t))
+
+
+    def dot(self, returnType, other):
+        return self._v.dot('Scalar', other._v) + self.w * other.w
+
+
+    def conjugate(self, returnType):
+        return PyQuat(self._v.negate('Vec3'), self.w)
+
+
+    def lengthSquared(self, returnType):
+        return self.dot('Scalar', self)
+
+
+    def length(self, returnType):
+        return math.sqrt(self.dot('Scalar', self))
+
+
+    def unit(self, returnType):
+        length = self.length('Scalar')
+        if length < DIVIDEPRECISION:
+            return PyQuat()
+
+        return self.divideScalar(returnType, length)
+
+
+    def unit_safe(self, returnType):
+        length = self.length('Scalar')
+        if length < DIVIDEPRECISION:
+            return PyQuat()
+
+        return self.divideScalar(returnType, length)
+
+
+    def setUnit(self, returnType):
+        length = self.length('Scalar')
+        if length >= DIVIDEPRECISION:
+            self.copy(self.divideScalar('Quat', length))
+
+        return length
+
+
+    def inverse(self, returnType):
+        lengthSquared = self.lengthSquared('Scalar')
+        if lengthSquared < DIVIDEPRECISION:
+            return PyQuat()
+
+        return self.conjugate('Quat').divideScalar('Quat', lengthSquared)
+
+
+    def alignWith(self, returnType, other):
+        if self.dot('Scalar', other) < 0.0:
+            self._v.copy(self._v.negate('Vec3'))
+            self.w = -self.w
+
+        return self
+
+
+    def getAngle(self, returnType):
+        return math.acos(_clamp(self.w, -1.0, 1.0)) * 2.0
+
+
+    def getXaxis(self, returnType):
+        return self.rotateVector('Vec3', PyVec3(1.0, 0.0, 0.0))
+
+
+    def getYaxis(self, returnType):
+        return self.rotateVector('Vec3', PyVec3(0.0, 1.0, 0.0))
+
+
+    def getZaxis(self, returnType):
+        return self.rotateVector('Vec3', PyVec3(0.0, 0.0, 1.0))
+
+
+    def mirror(self, returnType, axisIndex):
+        values = [self._v.x, self._v.y, self._v.z]
+        for i in xrange(3):
+            if i != axisIndex:
+                values[i] = -values[i]
+
+        return PyQuat(PyVec3(*values), self.w)
+
+
+    def toMat33(self, returnType):
+        x = self._v.x
+        y = self._v.y
+        z = self._v.z
+        w = self.w
+
+        return PyMat33(PyVec3(1.0 - 2.0 * (y * y + z * z), 2.0 * (x * y - z * w), 2.0 * (x * z + y * w)),
+                       PyVec3(2.0 * (x * y + z * w), 1.0 - 2.0 * (x * x + z * z), 2.0 * (y * z - x * w)),
+                       PyVec3(2.0 * (x * z - y * w), 2.0 * (y * z + x * w), 1.0 - 2.0 * (x * x + y * y)))
+
+
+    def toEuler(self, returnType, ro=None):
+        if ro is None:
+            ro = PyRotationOrder()
+
+        m = self.toMat33('Mat33')._values()
+        a, b, c = ro.axes[ro.order]
+        if ro.isReversed('Boolean'):
+            sign = -1.0
+        else:
+            sign = 1.0
+
+        angles = [0.0, 0.0, 0.0]
+        angles[b] = math.asin(_clamp(sign * m[a][c], -1.0, 1.0))
+        if abs(m[a][c]) < 1.0 - PRECISION:
+            angles[a] = math.atan2(-sign * m[b][c], m[c][c])
+            angles[c] = math.atan2(-sign * m[a][b], m[a][a])
+        else:
+            # Gimbal lock, all of the rotation is put on the first axis.
+            angles[a] = math.atan2(sign * m[c][b], m[b][b])
+            angles[c] = 0.0
+
+        return PyEuler(angles[0], angles[1], angles[2], ro)
+
+
+    def toEulerAngles(self, returnType, ro=None):
+        euler = self.toEuler('Euler', ro)
+
+        return PyVec3(euler.x, euler.y, euler.z)
+
+
+    def sphericalLinearInterpolate(self, returnType, q2, t):
+        angle = self.dot('Scalar', q2)
+        if angle < 0.0:
+            q2 = q2.multiplyScalar('Quat', -1.0)
+            angle = -angle
+
+        if angle < 1.0 - PRECISION:
+            theta = math.acos(angle)
+            sinTheta = math.sin(theta)
+            r = self.multiplyScalar('Quat', math.sin((1.0 - t) * theta) / sinTheta)
+            r = r.add('Quat', q2.multiplyScalar('Quat', math.sin(t * theta) / sinTheta))
+        else:
+            r = self.linearInterpolate('Quat', q2, t)
+
+        r.setUnit('Scalar')
+
+        return r
+
+
+    def linearInterpolate(self, returnType, other, t):
+        r = self.add('Quat', other.subtract('Quat', self).multiplyScalar('Quat', t))
+        r.setUnit('Scalar')
+
+        return r
+
+
+# ==========
+# Matrices
+# ==========
+class PyMat33(PyMathValue):
+    """Python implementation of the KL Mat33 type."""
+
+    __slots__ = ('_row0', '_row1', '_row2')
+
+    typeName = 'Mat33'
+    members = (('row0', 'Vec3'), ('row1', 'Vec3'), ('row2', 'Vec3'))
+
+
+    def __init__(self, row0=None, row1=None, row2=None):
+        if row0 is None:
+            row0 = PyVec3(1.0, 0.0, 0.0)
+            row1 = PyVec3(0.0, 1.0, 0.0)
+            row2 = PyVec3(0.0, 0.0, 1.0)
+        self._row0 = row0
+        self._row1 = row1
+        self._row2 = row2
+
+
+    @property
+    def row0(self):
+        return self._row0
+
+
+    @row0.setter
+    def row0(self, value):
+        self._row0.copy(value)
+
+
+    @property
+    def row1(self):
+        return self._row1
+
+
+    @row1.setter
+    def row1(self, value):
+        self._row1.copy(value)
+
+
+    @property
+    def row2(self):
+        return self._row2
+
+
+    @row2.setter
+    def row2(self, value):
+        self._row2.copy(value)
+
+
+    def _values(self):
+        return (self._row0._values(), self._row1._values(), self._row2._values())
+
+
+    @classmethod
+    def _fromValues(cls, values):
+        return cls(*[PyVec3(*row) for row in values])
+
+
+    def setRows(self, returnType, row0, row1, row2):
+        self._row0.copy(row0)
+        self._row1.copy(row1)
+        self._row2.copy(row2)
+
+
+    def setColumns(self, returnType, col0, col1, col2):
+        self._row0.set('', col0.x, col1.x, col2.x)
+        self._row1.set('', col0.y, col1.y, col2.y)
+        self._row2.set('', col0.z, col1.z, col2.z)
+
+
+    def setNull(self, returnType):
+        for row in (self._row0, self._row1, self._row2):
+            row.setNull('')
+
+
+    def setIdentity(self, returnType):
+        self.setNull('')
+        self._row0.x = 1.0
+        self._row1.y = 1.0
+        self._row2.z = 1.0
+
+
+    def setDiagonal(self, returnType, v):
+        if isinstance(v, PyVec3):
+            values = v._values()
+        else:
+            values = (v, v, v)
+
+        self._row0.x = float(values[0])
+        self._row1.y = float(values[1])
+        self._row2.z = float(values[2])
+
+
+    def add(self, returnType, other):
+        return PyMat33(self._row0.add('Vec3', other._row0),
+                       self._row1.add('Vec3', other._row1),
+                       self._row2.add('Vec3', other._row2))
+
+
+    def subtract(self, returnType, other):
+        return PyMat33(self._row0.subtract('Vec3', other._row0),
+                       self._row1.subtract('Vec3', other._row1),
+                       self._row2.subtract('Vec3', other._row2))
+
+
+    def multiply(self, returnType, other):
+        return self._fromValues(_multiplyMatrices(self._values(), other._values()))
+
+
+    def multiplyScalar(self, returnType, other):
+        return PyMat33(self._row0.multiplyScalar('Vec3', other),
+                       self._row1.multiplyScalar('Vec3', other),
+                       self._row2.multiplyScalar('Vec3', other))
+
+
+    def multiplyVector(self, returnType, other):
+        return PyVec3(self._row0.dot('Scalar', other),
+                      self._row1.dot('Scalar', other),
+                      self._row2.dot('Scalar', other))
+
+
+    def divideScalar(self, returnType, other):
+        return self.multiplyScalar(returnType, 1.0 / other)
+
+
+    def determinant(self, returnType):
+        return _determinant(self._values())
+
+
+    def adjoint(self, returnType):
+        return self._fromValues(_adjoint(self._values()))
+
+
+    def inverse(self, returnType):
+        det = self.determinant('Scalar')
+        if abs(det) < DIVIDEPRECISION:
+            return PyMat33()
+
+        return self.adjoint('Mat33').divideScalar('Mat33', det)
+
+
+    def inverse_safe(self, returnType):
+        return self.inverse(returnType)
+
+
+    def transpose(self, returnType):
+        return self._fromValues(zip(*self._values()))
+
+
+    def almostEqual(self, returnType, other, precision=PRECISION):
+        for rowA, rowB in zip(self._values(), other._values()):
+            for a, b in zip(rowA, rowB):
+                if abs(a - b) >= precision:
+                    return False
+
+        return True
+
+
+class PyMat44(PyMathValue):
+    """Python implementation of the KL Mat44 type."""
+
+    __slots__ = ('_row0', '_row1', '_row2', '_row3')
+
+    typeName = 'Mat44'
+    members = (('row0', 'Vec4'), ('row1', 'Vec4'), ('row2', 'Vec4'), ('row3', 'Vec4'))
+
+
+    def __init__(self, row0=None, row1=None, row2=None, row3=None):
+        if row0 is None:
+            row0 = PyVec4(1.0, 0.0, 0.0, 0.0)
+            row1 = PyVec4(0.0, 1.0, 0.0, 0.0)
+            row2 = PyVec4(0.0, 0.0, 1.0, 0.0)
+            row3 = PyVec4(0.0, 0.0, 0.0, 1.0)
+        self._row0 = row0
+        self._row1 = row1
+        self._row2 = row2
+        self._row3 = row3
+
+
+    @property
+    def row0(self):
+        return self._row0
+
+
+    @row0.setter
+    def row0(self, value):
+        self._row0.copy(value)
+
+
+    @property
+    def row1(self):
+        return self._row1
+
+
+    @row1.setter
+    def row1(self, value):
+        self._row1.copy(value)
+
+
+    @property
+    def row2(self):
+        return self._row2
+
+
+    @row2.setter
+    def row2(self, value):
+        self._row2.copy(value)
+
+
+    @property
+    def row3(self):
+        return self._row3
+
+
+    @row3.setter
+    def row3(self, value):
+        self._row3.copy(value)
+
+
+    def _rows(self):
+        return (self._row0, self._row1, self._row2, self._row3)
+
+
+    def _values(self):
+        return tuple(row._values() for row in self._rows())
+
+
+    @classmethod
+    def _fromValues(cls, values):
+        return cls(*[PyVec4(*row) for row in values])
+
+
+    def setRows(self, returnType, row0, row1, row2, row3):
+        for row, value in zip(self._rows(), (row0, row1, row2, row3)):
+            row.copy(value)
+
+
+    def setColumns(self, returnType, col0, col1, col2, col3):
+        cols = (col0, col1, col2, col3)
+        for i, row in enumerate(self._rows()):
+            row.set('', *[col._values()[i] for col in cols])
+
+
+    def setNull(self, returnType):
+        for row in self._rows():
+            row.setNull('')
+
+
+    def setIdentity(self, returnType):
+        self.setNull('')
+        self._row0.x = 1.0
+        self._row1.y = 1.0
+        self._row2.z = 1.0
+        self._row3.t = 1.0
+
+
+    def setDiagonal(self, returnType, v):
+        if isinstance(v, PyVec3):
+            values = (v.x, v.y, v.z, 1.0)
+        else:
+            values = (v, v, v, v)
+
+        for i, row in enumerate(self._rows()):
+            row.setComponent('', i, values[i])
+
+
+    def translation(self, returnType):
+        return PyVec3(self._row0.t, self._row1.t, self._row2.t)
+
+
+    def upperLeft(self, returnType):
+        return PyMat33(PyVec3(self._row0.x, self._row0.y, self._row0.z),
+                       PyVec3(self._row1.x, self._row1.y, self._row1.z),
+                       PyVec3(self._row2.x, self._row2.y, self._row2.z))
+
+
+    def add(self, returnType, other):
+        return PyMat44(*[a.add('Vec4', b) for a, b in zip(self._rows(), other._rows())])
+
+
+    def subtract(self, returnType, other):
+        return PyMat44(*[a.subtract('Vec4', b) for a, b in zip(self._rows(), other._rows())])
+
+
+    def multiply(self, returnType, other):
+        return self._fromValues(_multiplyMatrices(self._values(), other._values()))
+
+
+    def multiplyScalar(self, returnType, other):
+        return PyMat44(*[row.multiplyScalar('Vec4', other) for row in self._rows()])
+
+
+    def multiplyVector(self, returnType, other):
+        values = []
+        for row in self._rows():
+            values.append(row.x * other.x + row.y * other.y + row.z * other.z + row.t)
+
+        if values[3] != 0.0 and values[3] != 1.0:
+            return PyVec3(values[0] / values[3], values[1] / values[3], values[2] / values[3])
+
+        return PyVec3(values[0], values[1], values[2])
+
+
+    def divideScalar(self, returnType, other):
+        return self.multiplyScalar(returnType, 1.0 / other)
+
+
+    def determinant(self, returnType):
+        return _determinant(self._values())
+
+
+    def adjoint(self, returnType):
+        return self._fromValues(_adjoint(self._values()))
+
+
+    def inverse(self, returnType):
+        det = self.determinant('Scalar')
+        if abs(det) < DIVIDEPRECISION:
+            return PyMat44()
+
+        return self.adjoint('Mat44').divideScalar('Mat44', det)
+
+
+    def inverse_safe(self, returnType):
+        return self.inverse(returnType)
+
+
+    def transpose(self, returnType):
+        return self._fromValues(zip(*self._values()))
+
+
+    def almostEqual(self, returnType, other, precision=PRECISION):
+        for rowA, rowB in zip(self._values(), other._values()):
+            for a, b in zip(rowA, rowB):
+                if abs(a - b) >= precision:
+                    return False
+
+        return True
+
+
+# ===========
+# Transform
+# ===========
+class PyXfo(PyMathValue):
+    """Python implementation of the KL Xfo type."""
+
+    __slots__ = ('_tr', '_ori', '_sc')
+
+    typeName = 'Xfo'
+    members = (('ori', 'Quat'), ('tr', 'Vec3'), ('sc', 'Vec3'))
+
+
+    def __init__(self, tr=None, ori=None, sc=None):
+        if tr is None:
+            tr = PyVec3()
+        if ori is None:
+            ori = PyQuat()
+        if sc is None:
+            sc = PyVec3(1.0, 1.0, 1.0)
+        self._tr = tr
+        self._ori = ori
+        self._sc = sc
+
+
+    @property
+    def tr(self):
+        return self._tr
+
+
+    @tr.setter
+    def tr(self, value):
+        self._tr.copy(value)
+
+
+    @property
+    def ori(self):
+        return self._ori
+
+
+    @ori.setter
+    def ori(self, value):
+        self._ori.copy(value)
+
+
+    @property
+    def sc(self):
+        return self._sc
+
+
+    @sc.setter
+    def sc(self, value):
+        self._sc.copy(value)
+
+
+    def _values(self):
+        return self._tr._values() + self._ori._values() + self._sc._values()
+
+
+    def clone(self):
+        return PyXfo(self._tr.clone(), self._ori.clone(), self._sc.clone())
+
+
+    def copy(self, other):
+        self._tr.copy(other._tr)
+        self._ori.copy(other._ori)
+        self._sc.copy(other._sc)
+
+        return self
+
+
+    def set(self, returnType, tr, ori, sc):
+        self._tr.copy(tr)
+        self._ori.copy(ori)
+        self._sc.copy(sc)
+
+
+    def setIdentity(self, returnType):
+        self._tr.setNull('')
+        self._ori.setIdentity('')
+        self._sc.set('', 1.0, 1.0, 1.0)
+
+
+    def setFromMat44(self, returnType, m):
+        self._tr.copy(m.translation('Vec3'))
+
+        m33 = m.upperLeft('Mat33')
+        cols = [PyVec3(*col) for col in zip(*m33._values())]
+        scales = [col.length('Scalar') for col in cols]
+        if m33.determinant('Scalar') < 0.0:
+            scales[0] = -scales[0]
+
+        for i in xrange(3):
+            if abs(scales[i]) > DIVIDEPRECISION:
+                cols[i] = cols[i].divideScalar('Vec3', scales[i])
+
+        m33.setColumns('', *cols)
+        self._sc.set('', *scales)
+        self._ori.setFromMat33('Quat', m33)
+
+        return self
+
+
+    def toMat44(self, returnType):
+        rot = self._ori.toMat33('Mat33')._values()
+        sc = self._sc._values()
+        tr = self._tr._values()
+
+        rows = []
+        for i in xrange(3):
+            rows.append(PyVec4(rot[i][0] * sc[0], rot[i][1] * sc[1], rot[i][2] * sc[2], tr[i]))
+        rows.append(PyVec4(0.0, 0.0, 0.0, 1.0))
+
+        return PyMat44(*rows)
+
+
+    def multiply(self, returnType, xfo):
+        return PyXfo(self.transformVector('Vec3', xfo._tr),
+                     self._ori.multiply('Quat', xfo._ori).unit('Quat'),
+                     self._sc.multiply('Vec3', xfo._sc))
+
+
+    def transformVector(self, returnType, v):
+        return self._tr.add('Vec3', self._ori.rotateVector('Vec3', self._sc.multiply('Vec3', v)))
+
+
+    def inverse(self, returnType):
+        invSc = self._sc.inverse('Vec3')
+        invOri = self._ori.inverse('Quat')
+        invTr = invOri.rotateVector('Vec3', self._tr.negate('Vec3')).multiply('Vec3', invSc)
+
+        return PyXfo(invTr, invOri, invSc)
+
+
+    def inverseTransformVector(self, returnType, vec):
+        localVec = self._ori.inverse('Quat').rotateVector('Vec3', vec.subtract('Vec3', self._tr))
+
+        return localVec.divide('Vec3', self._sc)
+
+
+    def linearInterpolate(self, returnType, other, t):
+        return PyXfo(self._tr.linearInterpolate('Vec3', other._tr, t),
+                     self._ori.sphericalLinearInterpolate('Quat', other._ori, t),
+                     self._sc.linearInterpolate('Vec3', other._sc, t))
+
+
+# ================
+# Helper Methods
+# ================
+def _axisRotationMat33(axis, angle):
+    c = math.cos(angle)
+    s = math.sin(angle)
+    if axis == 0:
+        return PyMat33(PyVec3(1.0, 0.0, 0.0), PyVec3(0.0, c, -s), PyVec3(0.0, s, c))
+    elif axis == 1:
+        return PyMat33(PyVec3(c, 0.0, s), PyVec3(0.0, 1.0, 0.0), PyVec3(-s, 0.0, c))
+
+    return PyMat33(PyVec3(c, -s, 0.0), PyVec3(s, c, 0.0), PyVec3(0.0, 0.0, 1.0))
+
+
+def quatValuesFromMat33(m):
+    """Computes the unit quaternion of a rotation matrix.
+
+    Args:
+        m (list): The rows of the rotation matrix as lists of floats.
+
+    Returns:
+        tuple: The x, y, z and w values of the quaternion.
+
+    """
+
+    trace = m[0][0] + m[1][1] + m[2][2]
+    if trace > 0.0:
+        s = 0.5 / math.sqrt(trace + 1.0)
+        w = 0.25 / s
+        x = (m[2][1] - m[1][2]) * s
+        y = (m[0][2] - m[2][0]) * s
+        z = (m[1][0] - m[0][1]) * s
+    elif m[0][0] > m[1][1] and m[0][0] > m[2][2]:
+        s = 2.0 * math.sqrt(1.0 + m[0][0] - m[1][1] - m[2][2])
+        w = (m[2][1] - m[1][2]) / s
+        x = 0.25 * s
+        y = (m[0][1] + m[1][0]) / s
+        z = (m[0][2] + m[2][0]) / s
+    elif m[1][1] > m[2][2]:
+        s = 2.0 * math.sqrt(1.0 + m[1][1] - m[0][0] - m[2][2])
+        w = (m[0][2] - m[2][0]) / s
+        x = (m[0][1] + m[1][0]) / s
+        y = 0.25 * s
+        z = (m[1][2] + m[2][1]) / s
+    else:
+        s = 2.0 * math.sqrt(1.0 + m[2][2] - m[0][0] - m[1][1])
+        w = (m[1][0] - m[0][1]) / s
+        x = (m[0][2] + m[2][0]) / s
+        y = (m[1][2] + m[2][1]) / s
+        z = 0.25 * s
+
+    length = math.sqrt(x * x + y * y + z * z + w * w)
+    if length < DIVIDEPRECISION:
+        return (0.0, 0.0, 0.0, 1.0)
+
+    return (x / length, y / length, z / length, w / length)
+
+
+def _multiplyMatrices(a, b):
+    columns = zip(*b)
+
+    return [[sum([x * y for x, y in zip(row, col)]) for col in columns] for row in a]
+
+
+def _minor(m, row, col):
+    return [r[:col] + r[col + 1:] for i, r in enumerate(m) if i != row]
+
+
+def _determinant(m):
+    if len(m) == 2:
+        return m[0][0] * m[1][1] - m[0][1] * m[1][0]
+
+    det = 0.0
+    for col in xrange(len(m)):
+        cofactor = _determinant(_minor(m, 0, col))
+        if col % 2:
+            cofactor = -cofactor
+        det += m[0][col] * cofactor
+
+    return det
+
+
+def _adjoint(m):
+    size = len(m)
+    result = [[0.0] * size for i in xrange(size)]
+    for row in xrange(size):
+        for col in xrange(size):
+            cofactor = _determinant(_minor(m, row, col))
+            if (row + col) % 2:
+                cofactor = -cofactor
+            # The adjoint is the transpose of the cofactor matrix.
+            result[col][row] = cofactor
+
+    return result
+
+
+MATH_TYPES = {
+    'Vec2': PyVec2,
+    'Vec3': PyVec3,
+    'Vec4': PyVec4,
+    'RotationOrder': PyRotationOrder,
+    'Euler': PyEuler,
+    'Quat': PyQuat,
+    'Mat33': PyMat33,
+    'Mat44': PyMat44,
+    'Xfo': PyXfo
+}
@@ -23,7 +23,7 @@ class Quat(MathObject):
         super(Quat, self).__init__()
 
         if ks.getRTValTypeName(v) == 'Quat':
-            self._rtval = v
+            self.setRTVal(v)
         else:
             if v is not None and not isinstance(v, Vec3) and  not isinstance(v, Euler):
                 raise TypeError("Quat: Invalid type for 'v' argument. Must be a Vec3.")
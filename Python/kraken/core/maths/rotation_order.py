@@ -19,7 +19,7 @@ class RotationOrder(MathObject):
         super(RotationOrder, self).__init__()
 
         if ks.getRTValTypeName(order) == 'RotationOrder':
-            self._rtval = order
+            self.setRTVal(order)
         else:
             self._rtval = ks.rtVal('RotationOrder')
             if isinstance(order, RotationOrder):
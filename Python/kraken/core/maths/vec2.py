@@ -17,7 +17,7 @@ class Vec2(MathObject):
 
         super(Vec2, self).__init__()
         if ks.getRTValTypeName(x) == 'Vec2':
-            self._rtval = x
+            self.setRTVal(x)
         else:
             self._rtval = ks.rtVal('Vec2')
             if isinstance(x, Vec2):
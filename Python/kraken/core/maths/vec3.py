@@ -17,7 +17,7 @@ class Vec3(MathObject):
 
         super(Vec3, self).__init__()
         if ks.getRTValTypeName(x) == 'Vec3':
-            self._rtval = x
+            self.setRTVal(x)
         else:
             self._rtval = ks.rtVal('Vec3')
             if isinstance(x, Vec3):
@@ -0,0 +1,391 @@
+"""Kraken - maths.vec3_array module.
+
+Classes:
+Vec3Array -- Contiguous array of 3 dimensional vectors.
+"""
+
+import math
+
+from vec3 import Vec3
+from python_backend import DIVIDEPRECISION
+
+
+class Vec3Array(object):
+    """Contiguous array of 3 dimensional vectors.
+
+    The values are stored in a single flat list of floats so operations on
+    whole chains of vectors are computed in one call, without constructing a
+    Vec3 for each element.
+
+    """
+
+    def __init__(self, values=None):
+        """Initializes the Vec3Array.
+
+        Args:
+            values (list or int): List of Vec3 objects to initialize the array
+                with, or the number of null vectors to create.
+
+        """
+
+        super(Vec3Array, self).__init__()
+
+        if values is None:
+            self._values = []
+        elif isinstance(values, (int, long)):
+            self._values = [0.0] * (values * 3)
+        elif isinstance(values, Vec3Array):
+            self._values = list(values._values)
+        else:
+            self._values = []
+            for value in values:
+                self._values.extend((value.x, value.y, value.z))
+
+
+    def __str__(self):
+        """String representation of the Vec3Array object.
+
+        Returns:
+            str: String representation of the Vec3Array object.
+
+        """
+
+        return "Vec3Array(" + ",".join([str(vec) for vec in self]) + ")"
+
+
+    def __len__(self):
+        """Returns the number of vectors in the array.
+
+        Returns:
+            int: Number of vectors.
+
+        """
+
+        return len(self._values) / 3
+
+
+    def __getitem__(self, index):
+        """Returns the vector at the given index, or a new array for a slice.
+
+        Args:
+            index (int or slice): Index of the vector.
+
+        Returns:
+            Vec3: The vector at the index or a Vec3Array for a slice.
+
+        """
+
+        if isinstance(index, slice):
+            result = Vec3Array()
+            for i in xrange(*index.indices(len(self))):
+                result._values.extend(self._values[i * 3:i * 3 + 3])
+
+            return result
+
+        if index < 0:
+            index += len(self)
+
+        if index < 0 or index >= len(self):
+            raise IndexError("Vec3Array index out of range:" + str(index))
+
+        i = index * 3
+
+        return Vec3(self._values[i], self._values[i + 1], self._values[i + 2])
+
+
+    def __setitem__(self, index, value):
+        """Sets the vector at the given index.
+
+        Args:
+            index (int): Index of the vector.
+            value (Vec3): Vector to set.
+
+        """
+
+        if index < 0:
+            index += len(self)
+
+        if index < 0 or index >= len(self):
+            raise IndexError("Vec3Array index out of range:" + str(index))
+
+        i = index * 3
+        self._values[i:i + 3] = [value.x, value.y, value.z]
+
+
+    def __iter__(self):
+        """Iterates over the vectors in the array.
+
+        Returns:
+            iterator: Iterator returning Vec3 objects.
+
+        """
+
+        for i in xrange(len(self)):
+            yield self[i]
+
+
+    def clone(self):
+        """Returns a new array with the same values as this one.
+
+        Returns:
+            Vec3Array: Cloned array.
+
+        """
+
+        return Vec3Array(self)
+
+
+    def resize(self, size):
+        """Resizes the array, new vectors are set to null.
+
+        Args:
+            size (int): The new number of vectors.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        count = size * 3
+        if count < len(self._values):
+            del self._values[count:]
+        else:
+            self._values.extend([0.0] * (count - len(self._values)))
+
+        return True
+
+
+    def append(self, value):
+        """Appends a vector to the end of the array.
+
+        Args:
+            value (Vec3): Vector to append.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        self._values.extend((value.x, value.y, value.z))
+
+        return True
+
+
+    def toList(self):
+        """Returns the vectors of the array as a list of Vec3 objects.
+
+        Returns:
+            list: List of Vec3 objects.
+
+        """
+
+        return list(self)
+
+
+    # ===================
+    # Batched Operations
+    # ===================
+    def _otherValues(self, other):
+        """Returns the flat values of the other operand, broadcasting a single
+        Vec3 across the array.
+
+        Args:
+            other (Vec3Array or Vec3): The other operand.
+
+        Returns:
+            list: Flat list of floats with the same length as this array's.
+
+        """
+
+        if isinstance(other, Vec3Array):
+            if len(other._values) != len(self._values):
+                raise Exception("Vec3Array size mismatch:" + str(len(self)) + " != " + str(len(other)))
+
+            return other._values
+
+        return [other.x, other.y, other.z] * len(self)
+
+
+    def add(self, other):
+        """Adds a vector or array of vectors to this array.
+
+        Args:
+            other (Vec3Array or Vec3): Operand to add.
+
+        Returns:
+            Vec3Array: New array with the result.
+
+        """
+
+        result = Vec3Array()
+        result._values = [a + b for a, b in zip(self._values, self._otherValues(other))]
+
+        return result
+
+
+    def subtract(self, other):
+        """Subtracts a vector or array of vectors from this array.
+
+        Args:
+            other (Vec3Array or Vec3): Operand to subtract.
+
+        Returns:
+            Vec3Array: New array with the result.
+
+        """
+
+        result = Vec3Array()
+        result._values = [a - b for a, b in zip(self._values, self._otherValues(other))]
+
+        return result
+
+
+    def multiply(self, other):
+        """Multiplies the components of this array by a vector or array of
+        vectors.
+
+        Args:
+            other (Vec3Array or Vec3): Operand to multiply by.
+
+        Returns:
+            Vec3Array: New array with the result.
+
+        """
+
+        result = Vec3Array()
+        result._values = [a * b for a, b in zip(self._values, self._otherValues(other))]
+
+        return result
+
+
+    def multiplyScalar(self, other):
+        """Multiplies all the vectors of this array by a scalar.
+
+        Args:
+            other (float): Value to multiply by.
+
+        Returns:
+            Vec3Array: New array with the result.
+
+        """
+
+        result = Vec3Array()
+        result._values = [a * other for a in self._values]
+
+        return result
+
+
+    def negate(self):
+        """Returns the negated vectors of this array.
+
+        Returns:
+            Vec3Array: New array with the result.
+
+        """
+
+        result = Vec3Array()
+        result._values = [-a for a in self._values]
+
+        return result
+
+
+    def dot(self, other):
+        """Returns the dot products of the vectors of this array with a vector
+        or array of vectors.
+
+        Args:
+            other (Vec3Array or Vec3): Operand to compute the dot products with.
+
+        Returns:
+            list: List of floats.
+
+        """
+
+        a = self._values
+        b = self._otherValues(other)
+
+        return [a[i] * b[i] + a[i + 1] * b[i + 1] + a[i + 2] * b[i + 2] for i in xrange(0, len(a), 3)]
+
+
+    def cross(self, other):
+        """Returns the cross products of the vectors of this array with a
+        vector or array of vectors.
+
+        Args:
+            other (Vec3Array or Vec3): Operand to compute the cross products with.
+
+        Returns:
+            Vec3Array: New array with the result.
+
+        """
+
+        a = self._values
+        b = self._otherValues(other)
+
+        values = []
+        for i in xrange(0, len(a), 3):
+            ax, ay, az = a[i], a[i + 1], a[i + 2]
+            bx, by, bz = b[i], b[i + 1], b[i + 2]
+            values.extend((ay * bz - az * by, az * bx - ax * bz, ax * by - ay * bx))
+
+        result = Vec3Array()
+        result._values = values
+
+        return result
+
+
+    def length(self):
+        """Returns the lengths of the vectors of this array.
+
+        Returns:
+            list: List of floats.
+
+        """
+
+        a = self._values
+
+        return [math.sqrt(a[i] * a[i] + a[i + 1] * a[i + 1] + a[i + 2] * a[i + 2]) for i in xrange(0, len(a), 3)]
+
+
+    def unit(self):
+        """Returns the unit vectors of this array. Null vectors stay null.
+
+        Returns:
+            Vec3Array: New array with the result.
+
+        """
+
+        a = self._values
+
+        values = []
+        for i in xrange(0, len(a), 3):
+            x, y, z = a[i], a[i + 1], a[i + 2]
+            length = math.sqrt(x * x + y * y + z * z)
+            if length < DIVIDEPRECISION:
+                values.extend((0.0, 0.0, 0.0))
+            else:
+                values.extend((x / length, y / length, z / length))
+
+        result = Vec3Array()
+        result._values = values
+
+        return result
+
+
+    def linearInterpolate(self, other, t):
+        """Linearly interpolates the vectors of this array towards a vector or
+        array of vectors.
+
+        Args:
+            other (Vec3Array or Vec3): Vectors to interpolate towards.
+            t (float): Blend value.
+
+        Returns:
+            Vec3Array: New array with the result.
+
+        """
+
+        result = Vec3Array()
+        result._values = [a + (b - a) * t for a, b in zip(self._values, self._otherValues(other))]
+
+        return result
@@ -17,7 +17,7 @@ class Vec4(MathObject):
 
         super(Vec4, self).__init__()
         if ks.getRTValTypeName(x) == 'Vec4':
-            self._rtval = x
+            self.setRTVal(x)
         else:
             self._rtval = ks.rtVal('Vec4')
             if isinstance(x, Vec4):
@@ -111,12 +111,12 @@ class Vec4(MathObject):
         return self._rtval.z
 
 
-    @y.setter
+    @z.setter
     def z(self, value):
-        """Sets y value from the input value.
+        """Sets z value from the input value.
 
         Args:
-            value (float): Value to set the y property as.
+            value (float): Value to set the z property as.
 
         Returns:
             bool: True if successful.
@@ -140,7 +140,7 @@ class Vec4(MathObject):
         return self._rtval.t
 
 
-    @y.setter
+    @t.setter
     def t(self, value):
         """Sets t value from the input value.
 
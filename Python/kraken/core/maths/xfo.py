@@ -20,7 +20,7 @@ class Xfo(MathObject):
 
         super(Xfo, self).__init__()
         if ks.getRTValTypeName(tr) == 'Xfo':
-            self._rtval = tr
+            self.setRTVal(tr)
         else:
             self._rtval = ks.rtVal('Xfo')
             if isinstance(tr, Xfo):
@@ -0,0 +1,654 @@
+"""Kraken - maths.xfo_array module.
+
+Classes:
+XfoArray -- Contiguous array of transforms.
+"""
+
+import math
+
+from vec3 import Vec3
+from quat import Quat
+from xfo import Xfo
+from vec3_array import Vec3Array
+from python_backend import PRECISION
+from python_backend import DIVIDEPRECISION
+from python_backend import quatValuesFromMat33
+
+
+class XfoArray(object):
+    """Contiguous array of transforms.
+
+    Translations, orientations and scales are stored in flat lists of floats
+    (N x 3, N x 4 and N x 3) so transforms of whole chains can be computed in
+    one call instead of one Xfo operation per element.
+
+    """
+
+    def __init__(self, values=None):
+        """Initializes the XfoArray.
+
+        Args:
+            values (list or int): List of Xfo objects to initialize the array
+                with, or the number of identity transforms to create.
+
+        """
+
+        super(XfoArray, self).__init__()
+
+        self._tr = []
+        self._ori = []
+        self._sc = []
+
+        if values is None:
+            pass
+        elif isinstance(values, (int, long)):
+            self.resize(values)
+        elif isinstance(values, XfoArray):
+            self._tr = list(values._tr)
+            self._ori = list(values._ori)
+            self._sc = list(values._sc)
+        else:
+            for value in values:
+                self.append(value)
+
+
+    def __str__(self):
+        """String representation of the XfoArray object.
+
+        Returns:
+            str: String representation of the XfoArray object.
+
+        """
+
+        return "XfoArray(" + ",".join([str(xfo) for xfo in self]) + ")"
+
+
+    def __len__(self):
+        """Returns the number of transforms in the array.
+
+        Returns:
+            int: Number of transforms.
+
+        """
+
+        return len(self._tr) / 3
+
+
+    def __getitem__(self, index):
+        """Returns the transform at the given index, or a new array for a slice.
+
+        Args:
+            index (int or slice): Index of the transform.
+
+        Returns:
+            Xfo: The transform at the index or an XfoArray for a slice.
+
+        """
+
+        if isinstance(index, slice):
+            result = XfoArray()
+            for i in xrange(*index.indices(len(self))):
+                result._tr.extend(self._tr[i * 3:i * 3 + 3])
+                result._ori.extend(self._ori[i * 4:i * 4 + 4])
+                result._sc.extend(self._sc[i * 3:i * 3 + 3])
+
+            return result
+
+        index = self._checkIndex(index)
+        i3 = index * 3
+        i4 = index * 4
+        tr = self._tr
+        ori = self._ori
+        sc = self._sc
+
+        return Xfo(tr=Vec3(tr[i3], tr[i3 + 1], tr[i3 + 2]),
+                   ori=Quat(v=Vec3(ori[i4], ori[i4 + 1], ori[i4 + 2]), w=ori[i4 + 3]),
+                   sc=Vec3(sc[i3], sc[i3 + 1], sc[i3 + 2]))
+
+
+    def __setitem__(self, index, value):
+        """Sets the transform at the given index.
+
+        Args:
+            index (int): Index of the transform.
+            value (Xfo): Transform to set.
+
+        """
+
+        index = self._checkIndex(index)
+        i3 = index * 3
+        i4 = index * 4
+        tr = value.tr
+        ori = value.ori
+        v = ori.v
+        sc = value.sc
+
+        self._tr[i3:i3 + 3] = [tr.x, tr.y, tr.z]
+        self._ori[i4:i4 + 4] = [v.x, v.y, v.z, ori.w]
+        self._sc[i3:i3 + 3] = [sc.x, sc.y, sc.z]
+
+
+    def __iter__(self):
+        """Iterates over the transforms in the array.
+
+        Returns:
+            iterator: Iterator returning Xfo objects.
+
+        """
+
+        for i in xrange(len(self)):
+            yield self[i]
+
+
+    def _checkIndex(self, index):
+        """Validates an index, resolving negative indices.
+
+        Args:
+            index (int): Index to validate.
+
+        Returns:
+            int: The positive index.
+
+        """
+
+        if index < 0:
+            index += len(self)
+
+        if index < 0 or index >= len(self):
+            raise IndexError("XfoArray index out of range:" + str(index))
+
+        return index
+
+
+    def clone(self):
+        """Returns a new array with the same values as this one.
+
+        Returns:
+            XfoArray: Cloned array.
+
+        """
+
+        return XfoArray(self)
+
+
+    def resize(self, size):
+        """Resizes the array, new transforms are set to identity.
+
+        Args:
+            size (int): The new number of transforms.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        count = len(self)
+        if size < count:
+            del self._tr[size * 3:]
+            del self._ori[size * 4:]
+            del self._sc[size * 3:]
+        else:
+            self._tr.extend([0.0, 0.0, 0.0] * (size - count))
+            self._ori.extend([0.0, 0.0, 0.0, 1.0] * (size - count))
+            self._sc.extend([1.0, 1.0, 1.0] * (size - count))
+
+        return True
+
+
+    def append(self, value):
+        """Appends a transform to the end of the array.
+
+        Args:
+            value (Xfo): Transform to append.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        self.resize(len(self) + 1)
+        self[-1] = value
+
+        return True
+
+
+    def toList(self):
+        """Returns the transforms of the array as a list of Xfo objects.
+
+        Returns:
+            list: List of Xfo objects.
+
+        """
+
+        return list(self)
+
+
+    def getTranslations(self):
+        """Returns the translations of the transforms.
+
+        Returns:
+            Vec3Array: Array of translations.
+
+        """
+
+        result = Vec3Array()
+        result._values = list(self._tr)
+
+        return result
+
+
+    def setTranslations(self, translations):
+        """Sets the translations of the transforms.
+
+        Args:
+            translations (Vec3Array): Array of translations of the same size.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        if len(translations) != len(self):
+            raise Exception("XfoArray size mismatch:" + str(len(self)) + " != " + str(len(translations)))
+
+        self._tr = list(translations._values)
+
+        return True
+
+
+    # ===================
+    # Batched Operations
+    # ===================
+    def _otherValues(self, other):
+        """Returns the flat values of the other operand, broadcasting a single
+        Xfo across the array.
+
+        Args:
+            other (XfoArray or Xfo): The other operand.
+
+        Returns:
+            tuple: Translation, orientation and scale flat lists.
+
+        """
+
+        if isinstance(other, XfoArray):
+            if len(other) != len(self):
+                raise Exception("XfoArray size mismatch:" + str(len(self)) + " != " + str(len(other)))
+
+            return other._tr, other._ori, other._sc
+
+        single = XfoArray([other])
+        count = len(self)
+
+        return single._tr * count, single._ori * count, single._sc * count
+
+
+    def setFromVectors(self, xAxes, yAxes, zAxes, translations):
+        """Sets the transforms from arrays of axis vectors and translations.
+
+        The array is resized to the size of the inputs and the scales are reset.
+
+        Args:
+            xAxes (Vec3Array): X axis vectors.
+            yAxes (Vec3Array): Y axis vectors.
+            zAxes (Vec3Array): Z axis vectors.
+            translations (Vec3Array): Translation vectors.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        count = len(translations)
+        for axes in (xAxes, yAxes, zAxes):
+            if len(axes) != count:
+                raise Exception("XfoArray size mismatch:" + str(count) + " != " + str(len(axes)))
+
+        x = xAxes._values
+        y = yAxes._values
+        z = zAxes._values
+
+        ori = []
+        for i in xrange(0, count * 3, 3):
+            # The axes are the columns of the rotation matrix.
+            ori.extend(quatValuesFromMat33(((x[i], y[i], z[i]),
+                                            (x[i + 1], y[i + 1], z[i + 1]),
+                                            (x[i + 2], y[i + 2], z[i + 2]))))
+
+        self._tr = list(translations._values)
+        self._ori = ori
+        self._sc = [1.0] * (count * 3)
+
+        return True
+
+
+    def setFromMat44(self, mats):
+        """Sets the transforms from a list of 4x4 matrices.
+
+        The array is resized to the number of matrices.
+
+        Args:
+            mats (list): List of Mat44 objects.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        tr = []
+        ori = []
+        sc = []
+        for mat in mats:
+            # Read the rows from the RTVal (or Python value) directly to avoid
+            # constructing a Vec4 for each of them.
+            rtval = mat._rtval
+            rows = []
+            for row in (rtval.row0, rtval.row1, rtval.row2):
+                rows.append((row.x, row.y, row.z))
+                tr.append(row.t)
+
+            cols = zip(*rows)
+            scales = [math.sqrt(c[0] * c[0] + c[1] * c[1] + c[2] * c[2]) for c in cols]
+
+            det = (rows[0][0] * (rows[1][1] * rows[2][2] - rows[1][2] * rows[2][1]) -
+                   rows[0][1] * (rows[1][0] * rows[2][2] - rows[1][2] * rows[2][0]) +
+                   rows[0][2] * (rows[1][0] * rows[2][1] - rows[1][1] * rows[2][0]))
+            if det < 0.0:
+                scales[0] = -scales[0]
+
+            divisors = [1.0 if abs(scale) < DIVIDEPRECISION else scale for scale in scales]
+            rotation = [[rows[r][c] / divisors[c] for c in xrange(3)] for r in xrange(3)]
+
+            ori.extend(quatValuesFromMat33(rotation))
+            sc.extend(scales)
+
+        self._tr = tr
+        self._ori = ori
+        self._sc = sc
+
+        return True
+
+
+    def setFromValues(self, values):
+        """Sets the transforms from a flat list of floats.
+
+        Each transform is stored as 10 floats: translation x, y, z, orientation
+        x, y, z, w and scale x, y, z. The array is resized to the number of
+        transforms in the list.
+
+        Args:
+            values (list): Flat list of floats, 10 per transform.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        if len(values) % 10 != 0:
+            raise Exception("XfoArray values must contain 10 floats per transform: " + str(len(values)))
+
+        tr = []
+        ori = []
+        sc = []
+        for i in xrange(0, len(values), 10):
+            tr.extend(values[i:i + 3])
+            ori.extend(values[i + 3:i + 7])
+            sc.extend(values[i + 7:i + 10])
+
+        self._tr = [float(x) for x in tr]
+        self._ori = [float(x) for x in ori]
+        self._sc = [float(x) for x in sc]
+
+        return True
+
+
+    def getValues(self):
+        """Returns the transforms as a flat list of floats.
+
+        Returns:
+            list: Flat list of floats, 10 per transform, in the layout used by
+                setFromValues.
+
+        """
+
+        tr = self._tr
+        ori = self._ori
+        sc = self._sc
+
+        values = []
+        for i in xrange(len(self)):
+            i3 = i * 3
+            i4 = i * 4
+            values.extend(tr[i3:i3 + 3])
+            values.extend(ori[i4:i4 + 4])
+            values.extend(sc[i3:i3 + 3])
+
+        return values
+
+
+    def multiply(self, other):
+        """Multiplies each transform of this array by a transform or by the
+        transform with the same index in another array.
+
+        Args:
+            other (XfoArray or Xfo): Transforms to multiply by.
+
+        Returns:
+            XfoArray: New array with the result.
+
+        """
+
+        tr, ori, sc = self._tr, self._ori, self._sc
+        otherTr, otherOri, otherSc = self._otherValues(other)
+
+        resultTr = []
+        resultOri = []
+        resultSc = []
+        for i in xrange(len(self)):
+            i3 = i * 3
+            i4 = i * 4
+            qx, qy, qz, qw = ori[i4], ori[i4 + 1], ori[i4 + 2], ori[i4 + 3]
+
+            rx, ry, rz = _rotateVector(qx, qy, qz, qw,
+                                       sc[i3] * otherTr[i3],
+                                       sc[i3 + 1] * otherTr[i3 + 1],
+                                       sc[i3 + 2] * otherTr[i3 + 2])
+            resultTr.extend((tr[i3] + rx, tr[i3 + 1] + ry, tr[i3 + 2] + rz))
+
+            resultOri.extend(_unitQuat(*_multiplyQuats(qx, qy, qz, qw,
+                                                       otherOri[i4], otherOri[i4 + 1],
+                                                       otherOri[i4 + 2], otherOri[i4 + 3])))
+
+            resultSc.extend((sc[i3] * otherSc[i3],
+                             sc[i3 + 1] * otherSc[i3 + 1],
+                             sc[i3 + 2] * otherSc[i3 + 2]))
+
+        result = XfoArray()
+        result._tr = resultTr
+        result._ori = resultOri
+        result._sc = resultSc
+
+        return result
+
+
+    def inverse(self):
+        """Returns the inverses of the transforms of this array.
+
+        Returns:
+            XfoArray: New array with the result.
+
+        """
+
+        tr, ori, sc = self._tr, self._ori, self._sc
+
+        resultTr = []
+        resultOri = []
+        resultSc = []
+        for i in xrange(len(self)):
+            i3 = i * 3
+            i4 = i * 4
+
+            invSc = (1.0 / sc[i3], 1.0 / sc[i3 + 1], 1.0 / sc[i3 + 2])
+
+            qx, qy, qz, qw = ori[i4], ori[i4 + 1], ori[i4 + 2], ori[i4 + 3]
+            lengthSquared = qx * qx + qy * qy + qz * qz + qw * qw
+            if lengthSquared < DIVIDEPRECISION:
+                invOri = (0.0, 0.0, 0.0, 1.0)
+            else:
+                invOri = (-qx / lengthSquared, -qy / lengthSquared, -qz / lengthSquared, qw / lengthSquared)
+
+            rx, ry, rz = _rotateVector(invOri[0], invOri[1], invOri[2], invOri[3],
+                                       -tr[i3], -tr[i3 + 1], -tr[i3 + 2])
+
+            resultTr.extend((rx * invSc[0], ry * invSc[1], rz * invSc[2]))
+            resultOri.extend(invOri)
+            resultSc.extend(invSc)
+
+        result = XfoArray()
+        result._tr = resultTr
+        result._ori = resultOri
+        result._sc = resultSc
+
+        return result
+
+
+    def transformVector(self, vectors):
+        """Transforms a vector, or the vector with the same index in an array,
+        by each transform of this array.
+
+        Args:
+            vectors (Vec3Array or Vec3): Vectors to transform.
+
+        Returns:
+            Vec3Array: The transformed vectors.
+
+        """
+
+        tr, ori, sc = self._tr, self._ori, self._sc
+
+        if isinstance(vectors, Vec3Array):
+            if len(vectors) != len(self):
+                raise Exception("XfoArray size mismatch:" + str(len(self)) + " != " + str(len(vectors)))
+
+            v = vectors._values
+        else:
+            v = [vectors.x, vectors.y, vectors.z] * len(self)
+
+        values = []
+        for i in xrange(len(self)):
+            i3 = i * 3
+            i4 = i * 4
+            rx, ry, rz = _rotateVector(ori[i4], ori[i4 + 1], ori[i4 + 2], ori[i4 + 3],
+                                       sc[i3] * v[i3],
+                                       sc[i3 + 1] * v[i3 + 1],
+                                       sc[i3 + 2] * v[i3 + 2])
+            values.extend((tr[i3] + rx, tr[i3 + 1] + ry, tr[i3 + 2] + rz))
+
+        result = Vec3Array()
+        result._values = values
+
+        return result
+
+
+    def linearInterpolate(self, other, t):
+        """Interpolates the transforms of this array towards a transform or
+        array of transforms.
+
+        Translations and scales are linearly interpolated and orientations are
+        spherically interpolated.
+
+        Args:
+            other (XfoArray or Xfo): Transforms to interpolate towards.
+            t (float): Blend value.
+
+        Returns:
+            XfoArray: New array with the result.
+
+        """
+
+        otherTr, otherOri, otherSc = self._otherValues(other)
+        ori = self._ori
+
+        resultOri = []
+        for i4 in xrange(0, len(ori), 4):
+            resultOri.extend(_slerpQuats(ori[i4], ori[i4 + 1], ori[i4 + 2], ori[i4 + 3],
+                                         otherOri[i4], otherOri[i4 + 1], otherOri[i4 + 2], otherOri[i4 + 3],
+                                         t))
+
+        result = XfoArray()
+        result._tr = [a + (b - a) * t for a, b in zip(self._tr, otherTr)]
+        result._ori = resultOri
+        result._sc = [a + (b - a) * t for a, b in zip(self._sc, otherSc)]
+
+        return result
+
+
+    def mirror(self, plane):
+        """Mirrors the transforms of this array across a plane.
+
+        The translation is negated along the plane's axis and the orientations
+        are mirrored the same way as Quat.mirror.
+
+        Args:
+            plane (int): Index of the axis normal to the mirror plane.
+
+        Returns:
+            XfoArray: New array with the result.
+
+        """
+
+        result = XfoArray(self)
+        for i in xrange(len(self)):
+            result._tr[i * 3 + plane] = -result._tr[i * 3 + plane]
+            for j in xrange(3):
+                if j != plane:
+                    result._ori[i * 4 + j] = -result._ori[i * 4 + j]
+
+        return result
+
+
+# ================
+# Helper Methods
+# ================
+def _multiplyQuats(ax, ay, az, aw, bx, by, bz, bw):
+    return (aw * bx + bw * ax + ay * bz - az * by,
+            aw * by + bw * ay + az * bx - ax * bz,
+            aw * bz + bw * az + ax * by - ay * bx,
+            aw * bw - (ax * bx + ay * by + az * bz))
+
+
+def _unitQuat(x, y, z, w):
+    length = math.sqrt(x * x + y * y + z * z + w * w)
+    if length < DIVIDEPRECISION:
+        return (0.0, 0.0, 0.0, 1.0)
+
+    return (x / length, y / length, z / length, w / length)
+
+
+def _rotateVector(qx, qy, qz, qw, vx, vy, vz):
+    # t = 2 * cross(q.v, v), result = v + q.w * t + cross(q.v, t)
+    tx = 2.0 * (qy * vz - qz * vy)
+    ty = 2.0 * (qz * vx - qx * vz)
+    tz = 2.0 * (qx * vy - qy * vx)
+
+    return (vx + qw * tx + qy * tz - qz * ty,
+            vy + qw * ty + qz * tx - qx * tz,
+            vz + qw * tz + qx * ty - qy * tx)
+
+
+def _slerpQuats(ax, ay, az, aw, bx, by, bz, bw, t):
+    angle = ax * bx + ay * by + az * bz + aw * bw
+    if angle < 0.0:
+        bx, by, bz, bw = -bx, -by, -bz, -bw
+        angle = -angle
+
+    if angle < 1.0 - PRECISION:
+        theta = math.acos(angle)
+        sinTheta = math.sin(theta)
+        wa = math.sin((1.0 - t) * theta) / sinTheta
+        wb = math.sin(t * theta) / sinTheta
+    else:
+        wa = 1.0 - t
+        wb = t
+
+    return _unitQuat(ax * wa + bx * wb, ay * wa + by * wb, az * wa + bz * wb, aw * wa + bw * wb)
@@ -262,11 +262,7 @@ class Attribute(SceneItem):
 
         """
 
-        classHierarchy = []
-        for cls in type.mro(type(self)):
-            if cls == object:
-                break;
-            classHierarchy.append(cls.__name__)
+        classHierarchy = self.getTypeHierarchyNames()
 
         jsonData = {
             '__typeHierarchy__': classHierarchy,
@@ -170,11 +170,7 @@ class AttributeGroup(SceneItem):
 
         """
 
-        classHierarchy = []
-        for cls in type.mro(type(self)):
-            if cls == object:
-                break;
-            classHierarchy.append(cls.__name__)
+        classHierarchy = self.getTypeHierarchyNames()
 
         jsonData = {
             '__typeHierarchy__': classHierarchy,
@@ -44,7 +44,7 @@ class BoolAttribute(Attribute):
 
         """
 
-        return ks.rtVal('Boolean', self._value)
+        return ks.constructRTVal('Boolean', self._value)
 
 
     def getDataType(self):
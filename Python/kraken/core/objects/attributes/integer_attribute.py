@@ -29,7 +29,7 @@ class IntegerAttribute(NumberAttribute):
         RTVal
 
         """
-        return ks.rtVal('Integer', self._value)
+        return ks.constructRTVal('Integer', self._value)
 
 
     def validateValue(self, value):
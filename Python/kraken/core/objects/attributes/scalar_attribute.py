@@ -31,7 +31,7 @@ class ScalarAttribute(NumberAttribute):
 
         """
 
-        return ks.rtVal('Scalar', self._value)
+        return ks.constructRTVal('Scalar', self._value)
 
 
     def validateValue(self, value):
@@ -45,7 +45,7 @@ class StringAttribute(Attribute):
         RTVal
 
         """
-        return ks.rtVal('String', self._value)
+        return ks.constructRTVal('String', self._value)
 
 
 
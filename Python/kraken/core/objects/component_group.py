@@ -11,6 +11,8 @@ from kraken.core.objects.object_3d import Object3D
 class ComponentGroup(Object3D):
     """ComponentGroup object."""
 
+    _derivedName = True
+
     def __init__(self, name, component, parent=None):
         super(ComponentGroup, self).__init__(name, parent=parent)
 
@@ -22,6 +24,36 @@ class ComponentGroup(Object3D):
         self.lockTranslation(True, True, True)
 
 
+    # ==================
+    # Component Methods
+    # ==================
+    def setComponent(self, component):
+        """Sets the component attribute of this object.
+
+        The name of the ComponentGroup follows the component's, so its path
+        is cleared with the component's.
+
+        Arguments:
+        component -- Object, object that is the component of this one.
+
+        Return:
+        True if successful.
+
+        """
+
+        if self.getComponent() is not None:
+            self.getComponent()._removePathDependent(self)
+
+        super(ComponentGroup, self).setComponent(component)
+
+        if component is not None:
+            component._addPathDependent(self)
+
+        self._clearPathCache()
+
+        return True
+
+
     # =============
     # Name Methods
     # =============
@@ -27,6 +27,11 @@ class Component(Object3D):
 
     def __init__(self, name, parent=None, location='M'):
         self._location = location
+
+        # Objects whose component is this one, their build names contain the
+        # name and location of the component.
+        self._members = set()
+
         super(Component, self).__init__(name, parent)
         self._inputs = []
         self._outputs = []
@@ -58,6 +63,64 @@ class Component(Object3D):
         return ":" + self.getLocation()
 
 
+    def setName(self, name):
+        """Sets the name of the component with a string.
+
+        The build names of the objects of the component are cleared as they
+        contain the component name.
+
+        Arguments:
+        name -- String, the new name for the item.
+
+        Return:
+        True if successful.
+
+        """
+
+        super(Component, self).setName(name)
+
+        for member in self._members:
+            member._clearBuildNameCache(recursive=False)
+
+        return True
+
+
+    # ===============
+    # Member Methods
+    # ===============
+    def _addMember(self, kObject):
+        """Adds an object whose component is this one.
+
+        Arguments:
+        kObject -- Object, object to clear the build name of when the name or
+                   location of the component changes.
+
+        Return:
+        True if successful.
+
+        """
+
+        self._members.add(kObject)
+
+        return True
+
+
+    def _removeMember(self, kObject):
+        """Removes an object added with _addMember.
+
+        Arguments:
+        kObject -- Object, object to remove.
+
+        Return:
+        True if successful.
+
+        """
+
+        self._members.discard(kObject)
+
+        return True
+
+
     # =============
     # Side Methods
     # =============
@@ -156,11 +156,7 @@ class Constraint(SceneItem):
 
         """
 
-        classHierarchy = []
-        for cls in type.mro(type(self)):
-            if cls == object:
-                break;
-            classHierarchy.append(cls.__name__)
+        classHierarchy = self.getTypeHierarchyNames()
 
         jsonData = {
             '__typeHierarchy__': classHierarchy,
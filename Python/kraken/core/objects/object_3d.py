@@ -17,10 +17,21 @@ from kraken.core.objects.attributes.attribute_group import AttributeGroup
 class Object3D(SceneItem):
     """Kraken base object type for any 3D object."""
 
+    # Objects whose name is derived from another object can be renamed without
+    # their parent being notified. They are kept out of the parent's name
+    # indexes and tested individually instead.
+    _derivedName = False
+
     def __init__(self, name, parent=None):
         super(Object3D, self).__init__(name, parent)
+        self._buildNameCache = None
         self._component = None
         self._children = []
+        self._childNameIndex = {}
+        self._childDecoratedNameIndex = {}
+        self._childNameSuffixes = {}
+        self._derivedNameChildren = []
+        self._childIndexKeys = None
         self._flags = {}
         self._attributeGroups = []
         self._constraints = []
@@ -125,50 +136,40 @@ class Object3D(SceneItem):
     def getBuildName(self):
         """Returns the build name for the object.
 
+        Build names are cached per object. The cache is cleared when the name,
+        parent, component, location or flags of the object or one of its
+        ancestors change, and is ignored when the config or its name template
+        change.
+
         Return:
         String, name to be used in the DCC.
 
         """
 
-        typeNameHierarchy = self.getTypeHierarchyNames()
-
         config = Config.getInstance()
 
         # If flag is set on object to use explicit name, return it.
         if config.getExplicitNaming() is True or self.testFlag('EXPLICIT_NAME'):
             return self.getName()
 
-        nameTemplate = config.getNameTemplate()
-
-        # Get the token list for this type of object
-        format = None
-        for typeName in nameTemplate['formats'].keys():
-            if typeName in typeNameHierarchy:
-                format = nameTemplate['formats'][typeName]
-                break
-
-        if format is None:
-            format = nameTemplate['formats']['default']
+        program = config.getNameTemplateProgram(self._getTypeHierarchy()[0])
 
-        objectType = None
-        for eachType in typeNameHierarchy:
-            if eachType in nameTemplate['types'].keys():
-                objectType = eachType
-                break
+        buildNameCache = self._buildNameCache
+        if buildNameCache is not None and buildNameCache[0] is program:
+            return buildNameCache[1]
 
-        if objectType is None:
-            objectType = 'default'
+        nameTemplate = config.getNameTemplate()
 
         # Generate a name by concatenating the resolved tokens together.
         builtName = ""
         skipSep = False
-        for token in format:
+        for token, value in program:
 
-            if token is 'sep':
+            if token == 'sep':
                 if not skipSep:
-                    builtName += nameTemplate['separator']
+                    builtName += value
 
-            elif token is 'location':
+            elif token == 'location':
                 if self.isTypeOf('Component'):
                     location = self.getLocation()
                 else:
@@ -179,25 +180,26 @@ class Object3D(SceneItem):
 
                 builtName += location
 
-            elif token is 'type':
+            elif token == 'type':
+                objectType, typeName = value
 
                 if objectType == 'Locator' and self.testFlag('inputObject'):
-                    objectType = 'ComponentInput'
+                    typeName = nameTemplate['types']['ComponentInput']
                 elif objectType == 'Locator' and self.testFlag('outputObject'):
-                    objectType = 'ComponentOutput'
+                    typeName = nameTemplate['types']['ComponentOutput']
 
-                builtName += nameTemplate['types'][objectType]
+                builtName += typeName
 
-            elif token is 'name':
+            elif token == 'name':
                 builtName += self.getName()
 
-            elif token is 'component':
+            elif token == 'component':
                 if self.getComponent() is None:
                     skipSep = True
                     continue
                 builtName += self.getComponent().getName()
 
-            elif token is 'container':
+            elif token == 'container':
                 if self.getContainer() is None:
                     skipSep = True
                     continue
@@ -206,8 +208,36 @@ class Object3D(SceneItem):
             else:
                 raise ValueError("Unresolvabled token '" + token + "' used on: " + self.getPath())
 
+        self._buildNameCache = (program, builtName)
+
         return builtName
 
+
+    def _clearBuildNameCache(self, recursive=True):
+        """Clears the cached build name of this object and optionally of all
+        its descendants.
+
+        Arguments:
+        recursive -- Boolean, whether to clear the descendants' caches too.
+
+        Return:
+        True if successful.
+
+        """
+
+        if not recursive:
+            self._buildNameCache = None
+            return True
+
+        stack = [self]
+        while len(stack) > 0:
+            kObject = stack.pop()
+            kObject._buildNameCache = None
+            stack.extend(kObject._children)
+
+        return True
+
+
     def setName(self, name):
         """Sets the name of the object with a string.
 
@@ -239,14 +269,43 @@ class Object3D(SceneItem):
                 name = initName + str(suffix).zfill(2)
                 suffix += 1
 
+        # Re-index this object under its new name in the parent.
+        parent = self.getParent()
+        reindex = parent is not None and self._childIndexKeys is not None
+        if reindex:
+            parent._unindexChild(self)
+
         super(Object3D, self).setName(name)
 
+        if reindex:
+            parent._indexChild(self)
+
+        self._clearBuildNameCache()
+
         return True
 
 
     # ==================
     # Hierarchy Methods
     # ==================
+    def setParent(self, parent):
+        """Sets the parent attribute of this object.
+
+        Arguments:
+        parent -- Object, object that is the parent of this one.
+
+        Return:
+        True if successful.
+
+        """
+
+        super(Object3D, self).setParent(parent)
+
+        self._clearBuildNameCache()
+
+        return True
+
+
     def getContainer(self):
         """Returns the Container the object belongs to.
 
@@ -302,8 +361,16 @@ class Object3D(SceneItem):
 
         """
 
+        if self._component is not None:
+            self._component._removeMember(self)
+
         self._component = component
 
+        if component is not None:
+            component._addMember(self)
+
+        self._clearBuildNameCache(recursive=False)
+
         return True
 
 
@@ -355,22 +422,19 @@ class Object3D(SceneItem):
         if child.getParent() is not None:
             parent = child.getParent()
             if child in parent.getChildren():
+                parent._unindexChild(child)
                 parent.getChildren().remove(child)
 
         # check for name collision and adjust the name if they exist
         # Increment name if it already exists
         initName = child.getName()
-        name = initName
-        suffix = 1
-
-        while self.getChildByDecoratedName(name + child.getNameDecoration()) != None:
-            name = initName + str(suffix).zfill(2)
-            suffix += 1
+        name = self._allocateChildName(initName, child.getNameDecoration())
         if initName != name:
             child.setName(name)
 
         self.getChildren().append(child)
         child.setParent(self)
+        self._indexChild(child)
 
         # Assign the child the same component.
         if self._component is not None:
@@ -393,6 +457,7 @@ class Object3D(SceneItem):
         if self._checkChildIndex(index) is not True:
             return False
 
+        self._unindexChild(self.getChildren()[index])
         del self.getChildren()[index]
 
         return True
@@ -409,15 +474,13 @@ class Object3D(SceneItem):
 
         """
 
-        removeIndex = None
-
-        for i, eachChild in enumerate(self.getChildren()):
-            if eachChild.getName() == name:
-                removeIndex = i
-
-        if removeIndex is None:
+        # The last child with the name is removed.
+        children = self._findChildren(self._childNameIndex, name, 'getName')
+        if len(children) == 0:
             raise ValueError("'" + name + "' is not a valid child of this object.")
 
+        removeIndex = max([self._children.index(x) for x in children])
+
         self.removeChildByIndex(removeIndex)
 
         return True
@@ -439,6 +502,7 @@ class Object3D(SceneItem):
                 names.append(c.getName())
             raise Exception("Object '"+self.getPath() + "' does not have child:"+child.getPath() + ". it does have:" + str(names))
 
+        self._unindexChild(child)
         child.setParent(None)
 
         # Un-assign the child the component.
@@ -497,11 +561,7 @@ class Object3D(SceneItem):
 
         """
 
-        for eachChild in self.getChildren():
-            if eachChild.getName() == name:
-                return eachChild
-
-        return None
+        return self._findChild(self._childNameIndex, name, 'getName')
 
 
     def getChildByDecoratedName(self, decoratedName):
@@ -513,11 +573,146 @@ class Object3D(SceneItem):
 
         """
 
-        for eachChild in self.getChildren():
-            if eachChild.getDecoratedName() == decoratedName:
-                return eachChild
+        return self._findChild(self._childDecoratedNameIndex, decoratedName,
+                               'getDecoratedName')
 
-        return None
+
+    def _indexChild(self, child):
+        """Adds a child to the name and decorated name indexes.
+
+        Arguments:
+        child -- Object, child to index.
+
+        Return:
+        True if successful.
+
+        """
+
+        if child._derivedName:
+            self._derivedNameChildren.append(child)
+            child._childIndexKeys = ()
+            return True
+
+        name = child.getName()
+        decoratedName = child.getDecoratedName()
+        self._childNameIndex.setdefault(name, []).append(child)
+        self._childDecoratedNameIndex.setdefault(decoratedName, []).append(child)
+        child._childIndexKeys = (name, decoratedName)
+
+        return True
+
+
+    def _unindexChild(self, child):
+        """Removes a child from the name and decorated name indexes.
+
+        Freeing a name invalidates the collision suffixes handed out so far.
+
+        Arguments:
+        child -- Object, child to remove from the indexes.
+
+        Return:
+        True if the child was indexed.
+
+        """
+
+        indexKeys = child._childIndexKeys
+        if indexKeys is None:
+            return False
+
+        if child._derivedName:
+            self._derivedNameChildren.remove(child)
+        else:
+            for index, key in zip((self._childNameIndex, self._childDecoratedNameIndex), indexKeys):
+                entries = index[key]
+                entries.remove(child)
+                if len(entries) == 0:
+                    del index[key]
+
+        child._childIndexKeys = None
+        self._childNameSuffixes.clear()
+
+        return True
+
+
+    def _findChildren(self, index, key, nameMethod):
+        """Returns the children indexed under the key and the children with
+        derived names matching it.
+
+        Arguments:
+        index -- Dict, name index to look the key up in.
+        key -- String, name to look up.
+        nameMethod -- String, name of the method returning the compared name.
+
+        Return:
+        List of matching children.
+
+        """
+
+        children = index.get(key, [])
+        if len(self._derivedNameChildren) == 0:
+            return children
+
+        children = list(children)
+        for eachChild in self._derivedNameChildren:
+            if getattr(eachChild, nameMethod)() == key:
+                children.append(eachChild)
+
+        return children
+
+
+    def _findChild(self, index, key, nameMethod):
+        """Returns the first child, in child order, matching the key.
+
+        Arguments:
+        index -- Dict, name index to look the key up in.
+        key -- String, name to look up.
+        nameMethod -- String, name of the method returning the compared name.
+
+        Return:
+        Object if found.
+        None if not found.
+
+        """
+
+        children = self._findChildren(index, key, nameMethod)
+        if len(children) == 0:
+            return None
+        elif len(children) == 1:
+            return children[0]
+
+        return min(children, key=self._children.index)
+
+
+    def _allocateChildName(self, name, decoration):
+        """Returns a name that does not collide with the decorated names of the
+        children.
+
+        Colliding names get the lowest free 2 digit suffix. The last suffix
+        handed out per name is remembered so adding many children with the
+        same name doesn't probe every taken suffix again.
+
+        Arguments:
+        name -- String, requested name.
+        decoration -- String, name decoration of the child.
+
+        Return:
+        String, the requested name or the name with a suffix.
+
+        """
+
+        if self.getChildByDecoratedName(name + decoration) is None:
+            return name
+
+        key = (name, decoration)
+        suffix = self._childNameSuffixes.get(key, 1)
+        newName = name + str(suffix).zfill(2)
+        while self.getChildByDecoratedName(newName + decoration) is not None:
+            suffix += 1
+            newName = name + str(suffix).zfill(2)
+
+        self._childNameSuffixes[key] = suffix
+
+        return newName
 
 
     def getChildrenByType(self, childType):
@@ -553,6 +748,8 @@ class Object3D(SceneItem):
 
         self._flags[name] = True
 
+        self._clearBuildNameCache(recursive=False)
+
         return True
 
 
@@ -586,6 +783,7 @@ class Object3D(SceneItem):
 
         if name in self._flags:
             del self._flags[name]
+            self._clearBuildNameCache(recursive=False)
             return True
 
         return False
@@ -1076,6 +1274,7 @@ class Object3D(SceneItem):
 
         """
         self._flags =  jsonData['flags']
+        self._clearBuildNameCache(recursive=False)
         self.xfo =  loader.decodeValue(jsonData['xfo'])
         if 'color' in jsonData and jsonData['color'] is not None:
             self.setColor(loader.decodeValue(jsonData['color']))
@@ -0,0 +1,830 @@
+"""Kraken - objects.operators.python_solvers module.
+
+Pure Python implementations of the KL solvers of the Kraken extension. When the
+KrakenSystem solver backend of a solver type is set to 'Python', SpliceOperator
+constructs these objects in place of the solver RTVals. They follow the same
+calling convention as the KL solvers (the first argument of solve() is the name
+of the return type) and work on the Python math values of
+kraken.core.maths.python_backend, so rigs can be evaluated without the Fabric
+Engine runtime.
+
+Mat44 arguments are PyMat44 values and Mat44[] arguments are lists of them.
+Single 'io' outputs are updated in place, output arrays by replacing their
+elements. Debug drawing is not implemented.
+
+Classes:
+PyKrakenSolver -- Base class for all Python solvers.
+PyPoseConstraintSolver -- Python implementation of PoseConstraintSolver.
+PyMultiPoseConstraintSolver -- Python implementation of MultiPoseConstraintSolver.
+PyDirectionConstraintSolver -- Python implementation of DirectionConstraintSolver.
+PyRigScaleSolver -- Python implementation of RigScaleSolver.
+PyTwoBoneIKSolver -- Python implementation of TwoBoneIKSolver.
+PyNBoneIKSolver -- Python implementation of NBoneIKSolver.
+PyBezierSpineSolver -- Python implementation of BezierSpineSolver.
+PyTentacleSolver -- Python implementation of TentacleSolver.
+
+"""
+
+import math
+
+from kraken.core.kraken_system import SolverArg
+from kraken.core.maths.python_backend import PyVec2
+from kraken.core.maths.python_backend import PyVec3
+from kraken.core.maths.python_backend import PyEuler
+from kraken.core.maths.python_backend import PyQuat
+from kraken.core.maths.python_backend import PyMat33
+from kraken.core.maths.python_backend import PyXfo
+
+
+HALF_PI = math.pi * 0.5
+
+
+def _clamp(value, minValue, maxValue):
+    return max(minValue, min(maxValue, value))
+
+
+def _sq(value):
+    return value * value
+
+
+def _xfoFromMat44(m):
+    return PyXfo().setFromMat44('Xfo', m)
+
+
+def _rotateXfo(q, xfo):
+    # Equivalent to Xfo(q) * xfo.
+    return PyXfo(ori=q.clone()).multiply('Xfo', xfo)
+
+
+class PyKrakenSolver(object):
+    """Base class for all Python solvers."""
+
+    typeName = 'KrakenSolver'
+    arguments = (
+        ('drawDebug', 'in', 'Boolean'),
+        ('rigScale', 'in', 'Scalar')
+    )
+
+
+    def __init__(self):
+        super(PyKrakenSolver, self).__init__()
+        self.drawDebug = False
+
+
+    @classmethod
+    def getArguments(cls):
+        return [SolverArg(*arg) for arg in cls.arguments]
+
+
+    def setDebug(self, returnType, active):
+        self.drawDebug = active
+
+
+    def solve(self, returnType, *args):
+        raise Exception("solve must be implemented by concrete solver classes")
+
+
+# ====================
+# Constraint Solvers
+# ====================
+class PyPoseConstraintSolver(PyKrakenSolver):
+    """Python implementation of the KL PoseConstraintSolver type."""
+
+    typeName = 'PoseConstraintSolver'
+    arguments = PyKrakenSolver.arguments + (
+        ('constrainer', 'in', 'Mat44'),
+        ('constrainee', 'out', 'Mat44')
+    )
+
+
+    def solve(self, returnType, drawDebug, rigScale, constrainer, constrainee):
+        constrainee.copy(constrainer)
+
+
+class PyMultiPoseConstraintSolver(PyKrakenSolver):
+    """Python implementation of the KL MultiPoseConstraintSolver type."""
+
+    typeName = 'MultiPoseConstraintSolver'
+    arguments = PyKrakenSolver.arguments + (
+        ('constrainers', 'in', 'Mat44[]'),
+        ('constrainees', 'out', 'Mat44[]')
+    )
+
+
+    def solve(self, returnType, drawDebug, rigScale, constrainers, constrainees):
+        if len(constrainers) != 1 and len(constrainers) != len(constrainees):
+            raise Exception("Error in MultiPoseConstraintSolver. The number of constrainees must be 1 or match the number of constrainers. constrainers.size:" + str(len(constrainers)) + "; constrainees.size:" + str(len(constrainees)))
+
+        if len(constrainees) == 1:
+            # The sums start from the identity transform, as in KL.
+            xfo = PyXfo()
+            for constrainer in constrainers:
+                constrainerXfo = _xfoFromMat44(constrainer)
+                xfo.tr = xfo.tr.add('Vec3', constrainerXfo.tr)
+                xfo.ori = xfo.ori.add('Quat', constrainerXfo.ori)
+                xfo.sc = xfo.sc.add('Vec3', constrainerXfo.sc)
+
+            count = float(len(constrainers))
+            xfo.tr = xfo.tr.divideScalar('Vec3', count)
+            xfo.ori.setUnit('Scalar')
+            xfo.sc = xfo.sc.divideScalar('Vec3', count)
+            constrainees[0] = xfo.toMat44('Mat44')
+
+        else:
+            for i in xrange(len(constrainers)):
+                constrainees[i] = constrainers[i].clone()
+
+
+class PyDirectionConstraintSolver(PyKrakenSolver):
+    """Python implementation of the KL DirectionConstraintSolver type."""
+
+    typeName = 'DirectionConstraintSolver'
+    arguments = PyKrakenSolver.arguments + (
+        ('position', 'in', 'Mat44'),
+        ('upVector', 'in', 'Mat44'),
+        ('atVector', 'in', 'Mat44'),
+        ('constrainee', 'out', 'Mat44')
+    )
+
+
+    def solve(self, returnType, drawDebug, rigScale, position, upVector, atVector, constrainee):
+        positionTr = position.translation('Vec3')
+        toAtVector = atVector.translation('Vec3').subtract('Vec3', positionTr).unit('Vec3')
+        toUpVector = upVector.translation('Vec3').subtract('Vec3', positionTr).unit('Vec3')
+        normal = toAtVector.cross('Vec3', toUpVector).unit('Vec3')
+        yAxis = normal.cross('Vec3', toAtVector).unit('Vec3')
+
+        outAlignment = PyMat33()
+        outAlignment.setColumns('', toAtVector, yAxis, normal)
+
+        outXfo = PyXfo()
+        outXfo.tr = positionTr
+        outXfo.ori = PyQuat().setFromMat33('Quat', outAlignment)
+
+        constrainee.copy(outXfo.toMat44('Mat44'))
+
+
+class PyRigScaleSolver(PyKrakenSolver):
+    """Python implementation of the KL RigScaleSolver type."""
+
+    typeName = 'RigScaleSolver'
+    arguments = PyKrakenSolver.arguments + (
+        ('target', 'out', 'Mat44'),
+    )
+
+
+    def solve(self, returnType, drawDebug, rigScale, target):
+        scaleXfo = PyXfo()
+        scaleXfo.sc = PyVec3(rigScale, rigScale, rigScale)
+
+        target.copy(scaleXfo.toMat44('Mat44'))
+
+
+# ============
+# IK Solvers
+# ============
+def _solve2BoneIK(bone0Length, bone1Length, rootPosition, upVPosition, goalPosition, bone0Xfo, bone1Xfo):
+    """Port of solve2BoneIK in TwoBoneIKSolver.kl, bone0Xfo and bone1Xfo are
+    updated in place."""
+
+    rootToGoal = goalPosition.subtract('Vec3', rootPosition)
+    rootToUpV = upVPosition.subtract('Vec3', rootPosition)
+
+    bone0Xfo.tr = rootPosition
+
+    xaxis = rootToGoal.unit('Vec3')
+    zaxis = xaxis.cross('Vec3', rootToUpV.unit('Vec3')).cross('Vec3', xaxis).unit('Vec3').negate('Vec3')
+    yaxis = zaxis.cross('Vec3', xaxis).unit('Vec3')
+    bone0Xfo.ori.setFromMat33('Quat', PyMat33(xaxis, yaxis, zaxis).transpose('Mat33'))
+
+    # Law of cosines. a = BoneLength; b = Child BoneLength; c = Distance to the Ik Goal;
+    distToIkGoal = rootToGoal.length('Scalar')
+    ikBoneAngle = math.acos(_clamp((_sq(bone0Length) + _sq(distToIkGoal) - _sq(bone1Length)) / (2.0 * bone0Length * distToIkGoal), -1.0, 1.0))
+
+    offset = PyQuat().setFromAxisAndAngle('Quat', PyVec3(0.0, 1.0, 0.0), ikBoneAngle)
+    bone0Xfo.ori = bone0Xfo.ori.multiply('Quat', offset)
+
+    # transform the vector without applying scale.
+    bone1Xfo.tr = bone0Xfo.tr.add('Vec3', bone0Xfo.ori.rotateVector('Vec3', PyVec3(bone0Length, 0.0, 0.0)))
+    bone1Xfo.ori = bone0Xfo.ori
+
+    offset.setFrom2Vectors('Quat', bone1Xfo.ori.getXaxis('Vec3'), goalPosition.subtract('Vec3', bone1Xfo.tr).unit('Vec3'))
+    bone1Xfo.ori = offset.multiply('Quat', bone1Xfo.ori)
+
+
+def _solveNBoneIK(basePose, goalPosition):
+    """Port of solveNBoneIK in Math.kl."""
+
+    numBones = len(basePose)
+    boneLengths = [0.0] * numBones
+    boneVectors = [PyVec3() for i in xrange(numBones)]
+    ikpose = [PyXfo() for i in xrange(numBones)]
+    remainingChainLength = 0.0
+    for i in xrange(numBones - 1):
+        ikpose[i] = basePose[i].clone()
+        # Note: Scaling of bones is currently not supported.
+        boneVectors[i] = basePose[i].inverse('Xfo').transformVector('Vec3', basePose[i + 1].tr)
+        boneLengths[i] = boneVectors[i].length('Scalar')
+        remainingChainLength += abs(boneLengths[i])
+
+    chainRootPos = basePose[0].tr.clone()
+    lastBoneIndex = numBones - 1
+    fkChainTip = basePose[lastBoneIndex].tr.clone()
+
+    chainOffsetRotation = PyQuat()
+
+    for i in xrange(numBones - 1):
+        boneXfo = basePose[i].clone()
+        if i == 0:
+            vecToFkChainTip = fkChainTip.subtract('Vec3', boneXfo.tr)
+        else:
+            # Transform the bone position by the overall chain offset.
+            offsetBonePos = chainRootPos.add('Vec3', chainOffsetRotation.rotateVector('Vec3', boneXfo.tr.subtract('Vec3', chainRootPos)))
+            vecToFkChainTip = fkChainTip.subtract('Vec3', offsetBonePos)
+
+            # Calculate a new pose position based on the parent bones new orientation
+            boneXfo.tr = ikpose[i - 1].transformVector('Vec3', boneVectors[i - 1])
+
+        distToFkChainTip = vecToFkChainTip.length('Scalar')
+        vecToFkChainTip = vecToFkChainTip.multiplyScalar('Vec3', 1.0 / distToFkChainTip)
+
+        vecToIkGoal = goalPosition.subtract('Vec3', boneXfo.tr)
+        distToIkGoal = vecToIkGoal.length('Scalar')
+        vecToIkGoal = vecToIkGoal.multiplyScalar('Vec3', 1.0 / distToIkGoal)
+        boneLength = abs(boneLengths[i])
+
+        if i == 0:
+            # For the first bone calculate and store the overall chain offset towards the ik target
+            chainOffsetRotation.setFrom2Vectors('Quat', vecToFkChainTip, vecToIkGoal)
+
+            fkChainTip = boneXfo.tr.add('Vec3', vecToIkGoal.multiplyScalar('Vec3', distToFkChainTip))
+            boneXfo.ori = chainOffsetRotation.multiply('Quat', boneXfo.ori)
+        else:
+            # Apply the chain offset, and apply any incremental correction.
+            boneOffsetRotation = PyQuat().setFrom2Vectors('Quat', vecToFkChainTip, vecToIkGoal)
+            boneXfo.ori = boneOffsetRotation.multiply('Quat', chainOffsetRotation).multiply('Quat', boneXfo.ori)
+
+        # Based on the bone index, select an appropriate method to solve
+        if i <= numBones - 3:
+            # Remove the current bones length from the chain.
+            remainingChainLength -= boneLength
+            boneLengthVector = boneXfo.ori.rotateVector('Vec3', boneVectors[i].unit('Vec3'))
+
+            # this is the current angle of the bone.
+            fkBoneAngle = math.acos(_clamp(boneLengthVector.dot('Scalar', vecToIkGoal), -1.0, 1.0))
+
+            if fkBoneAngle < 0.0001:
+                # If the bone is already pointing directly at the target, we can't work with it.
+                continue
+
+            bendAxis = vecToIkGoal.cross('Vec3', boneLengthVector)
+            bendAxis.setUnit('Scalar')
+
+            if i == numBones - 3:
+                # Law of cosines. a = BoneLength; b = Child BoneLength; c = Distance to the Ik Goal;
+                ikBoneAngle = math.acos(_clamp((_sq(boneLength) + _sq(distToIkGoal) - _sq(remainingChainLength)) / (2.0 * boneLength * distToIkGoal), -1.0, 1.0))
+
+            else:
+                if distToFkChainTip > remainingChainLength:
+                    maxFkBoneAngle = math.acos(_clamp((_sq(boneLength) + _sq(distToFkChainTip) - _sq(remainingChainLength)) / (2.0 * boneLength * distToFkChainTip), -1.0, 1.0))
+                else:
+                    # Add on the remaining chain length as radians.
+                    maxFkBoneAngle = math.acos(_clamp((boneLength * 0.5) / remainingChainLength, 0.0, 1.0))
+                    maxFkBoneAngle += (remainingChainLength - distToFkChainTip) / boneLength
+
+                if distToIkGoal > remainingChainLength:
+                    maxIkBoneAngle = math.acos(_clamp((_sq(boneLength) + _sq(distToIkGoal) - _sq(remainingChainLength)) / (2.0 * boneLength * distToIkGoal), -1.0, 1.0))
+                else:
+                    # Add on the remaining chain length as radians.
+                    maxIkBoneAngle = math.acos(_clamp((boneLength * 0.5) / remainingChainLength, 0.0, 1.0))
+                    maxIkBoneAngle += (remainingChainLength - distToIkGoal) / boneLength
+
+                ikBoneAngle = maxIkBoneAngle * (fkBoneAngle / maxFkBoneAngle)
+
+            # Subtract off the current angle the bone has with the vecToIkGoal to keep the delta
+            deltaBoneAngle = ikBoneAngle - fkBoneAngle
+
+            # Apply the rotation to the current bones
+            offset = PyQuat().setFromAxisAndAngle('Quat', bendAxis, deltaBoneAngle)
+            boneXfo.ori = offset.multiply('Quat', boneXfo.ori)
+
+        ikpose[i] = boneXfo
+
+    ikpose[lastBoneIndex].tr = ikpose[lastBoneIndex - 1].transformVector('Vec3', boneVectors[lastBoneIndex - 1])
+
+    return ikpose
+
+
+def _solveNBoneIKWithUpVector(basePose, goalPosition, upVPosition, upVector):
+    """Port of solveNBoneIKWithUpVector in Math.kl."""
+
+    chainRootPos = basePose[0].tr.clone()
+    lastBoneIndex = len(basePose) - 1
+    fkChainTip = basePose[lastBoneIndex].tr
+    vecToFkChainTip = fkChainTip.subtract('Vec3', chainRootPos).unit('Vec3')
+    vecToIkGoal = goalPosition.subtract('Vec3', chainRootPos).unit('Vec3')
+
+    chainOffsetRotation = PyQuat().setFrom2Vectors('Quat', vecToFkChainTip, vecToIkGoal)
+
+    # Compute the current upvector of the chain using the first joints xfo.
+    fkChainUp = chainOffsetRotation.multiply('Quat', basePose[0].ori).rotateVector('Vec3', upVector)
+    vecToUpVPos = upVPosition.subtract('Vec3', chainRootPos)
+
+    # project the vectors onto the plane defined by the root and root to goal vector
+    vecToUpVPos = vecToUpVPos.subtract('Vec3', vecToIkGoal.multiplyScalar('Vec3', vecToUpVPos.dot('Scalar', vecToIkGoal))).unit('Vec3')
+    fkChainUp = fkChainUp.subtract('Vec3', vecToIkGoal.multiplyScalar('Vec3', fkChainUp.dot('Scalar', vecToIkGoal))).unit('Vec3')
+
+    angle = fkChainUp.angleTo('Scalar', vecToUpVPos)
+    if fkChainUp.cross('Vec3', vecToUpVPos).dot('Scalar', vecToIkGoal) < 0.0:
+        angle = -angle
+
+    # Apply the upvector alignment to the chain rotation.
+    upVectorOffset = PyQuat().setFromAxisAndAngle('Quat', vecToIkGoal, angle)
+    chainOffsetRotation = upVectorOffset.multiply('Quat', chainOffsetRotation)
+
+    # compute a new aligned chain that includes the re-orientation using the upvector.
+    alignedPose = []
+    for i in xrange(len(basePose)):
+        alignedXfo = _rotateXfo(chainOffsetRotation, basePose[i])
+        if i == 0:
+            alignedXfo.tr = chainRootPos
+        else:
+            localTr = basePose[i - 1].inverse('Xfo').transformVector('Vec3', basePose[i].tr)
+            alignedXfo.tr = alignedPose[i - 1].transformVector('Vec3', localTr)
+        alignedPose.append(alignedXfo)
+
+    # Now solve the chain like normal.
+    return _solveNBoneIK(alignedPose, goalPosition)
+
+
+class PyTwoBoneIKSolver(PyKrakenSolver):
+    """Python implementation of the KL TwoBoneIKSolver type."""
+
+    typeName = 'TwoBoneIKSolver'
+    arguments = PyKrakenSolver.arguments + (
+        ('rightSide', 'in', 'Boolean'),
+        ('ikblend', 'in', 'Scalar'),
+        ('softIK', 'in', 'Boolean'),
+        ('softDist', 'in', 'Scalar'),
+        ('stretch', 'in', 'Boolean'),
+        ('stretchBlend', 'in', 'Scalar'),
+        ('root', 'in', 'Mat44'),
+        ('bone0FK', 'in', 'Mat44'),
+        ('bone1FK', 'in', 'Mat44'),
+        ('ikHandle', 'in', 'Mat44'),
+        ('upV', 'in', 'Mat44'),
+        ('bone0Len', 'in', 'Scalar'),
+        ('bone1Len', 'in', 'Scalar'),
+        ('bone0Out', 'out', 'Mat44'),
+        ('bone1Out', 'out', 'Mat44'),
+        ('bone2Out', 'out', 'Mat44')
+    )
+
+
+    def solve(self, returnType, drawDebug, rigScale, rightSide, ikblend, softIK,
+              softDist, stretch, stretchBlend, root, bone0FK, bone1FK, ikHandle,
+              upV, bone0Len, bone1Len, bone0Out, bone1Out, bone2Out):
+
+        bone0FkXfo = _xfoFromMat44(bone0FK)
+        bone1FkXfo = _xfoFromMat44(bone1FK)
+        bone0Xfo = bone0FkXfo.clone()
+        bone1Xfo = bone1FkXfo.clone()
+
+        scaledBone0Len = bone0Len * rigScale
+        scaledBone1Len = bone1Len * rigScale
+
+        if ikblend > 0.0:
+            _solve2BoneIK(scaledBone0Len, scaledBone1Len,
+                          root.translation('Vec3'),
+                          upV.translation('Vec3'),
+                          ikHandle.translation('Vec3'),
+                          bone0Xfo, bone1Xfo)
+
+            bone0Xfo.ori = bone0FkXfo.ori.sphericalLinearInterpolate('Quat', bone0Xfo.ori, ikblend)
+            bone1Xfo.tr = bone0Xfo.transformVector('Vec3', PyVec3(bone0Len, 0.0, 0.0))
+            bone1Xfo.ori = bone1FkXfo.ori.sphericalLinearInterpolate('Quat', bone1Xfo.ori, ikblend)
+
+        # project bone2 to the end of bone 1
+        bone2Xfo = bone1Xfo.clone()
+        bone2Xfo.tr = bone1Xfo.transformVector('Vec3', PyVec3(bone1Len, 0.0, 0.0))
+
+        outScaling = PyVec3(rigScale, rigScale, rigScale)
+        bone0Xfo.sc = outScaling
+        bone1Xfo.sc = outScaling
+        bone2Xfo.sc = outScaling
+
+        bone0Out.copy(bone0Xfo.toMat44('Mat44'))
+        bone1Out.copy(bone1Xfo.toMat44('Mat44'))
+        bone2Out.copy(bone2Xfo.toMat44('Mat44'))
+
+
+class PyNBoneIKSolver(PyKrakenSolver):
+    """Python implementation of the KL NBoneIKSolver type."""
+
+    typeName = 'NBoneIKSolver'
+    arguments = PyKrakenSolver.arguments + (
+        ('useInitPose', 'in', 'Boolean'),
+        ('ikblend', 'in', 'Scalar'),
+        ('chainBase', 'in', 'Mat44'),
+        ('ikgoal', 'in', 'Mat44'),
+        ('upVector', 'in', 'Mat44'),
+        ('fkcontrols', 'in', 'Mat44[]'),
+        ('tipBoneLen', 'in', 'Scalar'),
+        ('rootIndex', 'in', 'Integer'),
+        ('pose', 'out', 'Mat44[]'),
+        ('legEnd', 'out', 'Mat44')
+    )
+
+
+    def __init__(self):
+        super(PyNBoneIKSolver, self).__init__()
+        self.initPose = []
+
+
+    def solve(self, returnType, drawDebug, rigScale, useInitPose, ikblend,
+              chainBase, ikgoal, upVector, fkcontrols, tipBoneLen, rootIndex,
+              pose, legEnd):
+
+        if len(fkcontrols) != len(pose):
+            raise Exception("Error in NBoneIKSolver. The number of FKControls does not match the number of joints")
+
+        numControls = len(fkcontrols)
+
+        if len(self.initPose) == 0:
+            fkPose = [_xfoFromMat44(m) for m in fkcontrols]
+            tipXfo = fkPose[numControls - 1].clone()
+            tipXfo.tr = fkPose[numControls - 1].transformVector('Vec3', PyVec3(tipBoneLen, 0.0, 0.0))
+            fkPose.append(tipXfo)
+            self.initPose = fkPose
+
+        xfoPose = [_xfoFromMat44(m) for m in fkcontrols]
+        boneVectors = []
+        for i in xrange(1, numControls):
+            boneVectors.append(xfoPose[i - 1].inverse('Xfo').transformVector('Vec3', xfoPose[i].tr))
+        boneVectors.append(PyVec3(tipBoneLen, 0.0, 0.0))
+
+        tipXfo = xfoPose[numControls - 1].clone()
+        tipXfo.tr = xfoPose[numControls - 1].transformVector('Vec3', boneVectors[-1])
+        xfoPose.append(tipXfo)
+
+        if ikblend > 0.0:
+            if rootIndex > len(self.initPose) - 3:
+                print 'rootIndex has to leave at least 2 joints at the end of the chain!'
+                ikIndex = len(self.initPose) - 3
+            else:
+                ikIndex = rootIndex
+
+            if useInitPose:
+                # Calculate the initpose offset by the chain base input
+                chainBaseXfo = _xfoFromMat44(chainBase)
+                initPoseRootInv = self.initPose[0].inverse('Xfo')
+                offsetInitPose = [chainBaseXfo.multiply('Xfo', initPoseRootInv.multiply('Xfo', x)) for x in self.initPose]
+                initPose = offsetInitPose[ikIndex:len(xfoPose)]
+                ikPose = _solveNBoneIKWithUpVector(initPose, ikgoal.translation('Vec3'), upVector.translation('Vec3'), PyVec3(0.0, 1.0, 0.0))
+            else:
+                initPose = [x.clone() for x in xfoPose[ikIndex:]]
+                ikPose = _solveNBoneIK(initPose, ikgoal.translation('Vec3'))
+
+            # Now blend the IK result with the FK result
+            for i in xrange(ikIndex, len(xfoPose)):
+                xfoPose[i].ori = xfoPose[i].ori.sphericalLinearInterpolate('Quat', ikPose[i - ikIndex].ori, ikblend)
+                if i > 0:
+                    xfoPose[i].tr = xfoPose[i - 1].transformVector('Vec3', boneVectors[i - 1])
+
+        # Convert the Xfos back to Mat44s
+        for i in xrange(len(pose)):
+            pose[i] = xfoPose[i].toMat44('Mat44')
+        legEnd.copy(xfoPose[-1].toMat44('Mat44'))
+
+
+# ================
+# Spline Solvers
+# ================
+def _bezierCoeffs(p0, p1, p2, p3):
+    return (
+        p3.subtract('Vec3', p0).subtract('Vec3', p2.multiplyScalar('Vec3', 3.0)).add('Vec3', p1.multiplyScalar('Vec3', 3.0)),
+        p0.subtract('Vec3', p1.multiplyScalar('Vec3', 2.0)).add('Vec3', p2),
+        p1.subtract('Vec3', p0),
+        p0.clone()
+    )
+
+
+def _evalBezier(coeffs, t):
+    t2 = t * t
+    t3 = t2 * t
+
+    return (coeffs[0].multiplyScalar('Vec3', t3)
+            .add('Vec3', coeffs[1].multiplyScalar('Vec3', 3.0 * t2))
+            .add('Vec3', coeffs[2].multiplyScalar('Vec3', 3.0 * t))
+            .add('Vec3', coeffs[3]))
+
+
+def _measureBezierLength(coeffs, numSamples):
+    distances = [0.0] * numSamples
+    prevPoint = None
+    for i in xrange(numSamples):
+        point = _evalBezier(coeffs, float(i) / float(numSamples - 1))
+        if i > 0:
+            distances[i] = distances[i - 1] + point.distanceTo('Scalar', prevPoint)
+        prevPoint = point
+
+    return distances
+
+
+class PyBezierSpineSolver(PyKrakenSolver):
+    """Python implementation of the KL BezierSpineSolver type."""
+
+    typeName = 'BezierSpineSolver'
+    arguments = PyKrakenSolver.arguments + (
+        ('length', 'in', 'Scalar'),
+        ('base', 'in', 'Mat44'),
+        ('baseHandle', 'in', 'Mat44'),
+        ('tipHandle', 'in', 'Mat44'),
+        ('tip', 'in', 'Mat44'),
+        ('outputs', 'out', 'Mat44[]')
+    )
+
+
+    def solve(self, returnType, drawDebug, rigScale, length, base, baseHandle,
+              tipHandle, tip, outputs):
+
+        numOutputs = len(outputs)
+
+        coeffs = _bezierCoeffs(base.translation('Vec3'), baseHandle.translation('Vec3'),
+                               tipHandle.translation('Vec3'), tip.translation('Vec3'))
+
+        # sample the curve 2x for every output joint
+        distances = _measureBezierLength(coeffs, numOutputs * 2)
+        chainLength = distances[-1]
+        segLength = (length * rigScale) / float(numOutputs)
+        currIndex = 1
+        baseXfo = _xfoFromMat44(base)
+        tipXfo = _xfoFromMat44(tip)
+
+        # Adding an offset to align the output's x axis down the length of the spine.
+        xAlignmentOffset = PyQuat().setFromAxisAndAngle('Quat', PyVec3(0.0, 1.0, 0.0), HALF_PI)
+        baseXfo.ori = baseXfo.ori.multiply('Quat', xAlignmentOffset)
+        tipXfo.ori = tipXfo.ori.multiply('Quat', xAlignmentOffset)
+
+        tipDirection = tipXfo.tr.subtract('Vec3', tipHandle.translation('Vec3')).unit('Vec3')
+        outScaling = PyVec3(rigScale, rigScale, rigScale)
+
+        preXfo = None
+        for i in xrange(numOutputs):
+            outXfo = PyXfo()
+
+            # Compute the translation by projecting the local vector by the parent matrix.
+            if i == 0:
+                outXfo.tr = base.translation('Vec3')
+            else:
+                # transform the vector without applying scale.
+                outXfo.tr = preXfo.tr.add('Vec3', preXfo.ori.rotateVector('Vec3', PyVec3(segLength, 0.0, 0.0)))
+
+            # Compute the rotation by linear interpolating the base and tip controllers.
+            fractVal = (i + 0.5) / float(numOutputs)
+            outXfo.ori = baseXfo.ori.sphericalLinearInterpolate('Quat', tipXfo.ori, fractVal)
+
+            # Determine the curve parameter for the tip of the joint by walking
+            # the curve's distance values.
+            tipDist = segLength * (i + 1)
+            curveTipParam = 0.0
+            if tipDist < chainLength:
+                for j in xrange(int(currIndex), len(distances)):
+                    if distances[j] > tipDist:
+                        currIndex = j - 1
+                        curveTipParam = (float(currIndex) / float(len(distances))) + (((tipDist - distances[j - 1]) / segLength) * (1.0 / float(len(distances))))
+                        break
+            else:
+                curveTipParam = 1.0 + (((tipDist - chainLength) / segLength) * numOutputs)
+
+            # Compute the position on the curve of the tip of the spine.
+            if curveTipParam < 1.0:
+                # Measure the exact position on the curve using the computed parameter.
+                targ = _evalBezier(coeffs, curveTipParam)
+            else:
+                # project a position off the end of the bezier curve
+                targ = tipXfo.tr.add('Vec3', tipDirection.multiplyScalar('Vec3', (curveTipParam - 1.0) * segLength))
+
+            # Align the joint so it points at the target position computed.
+            alignment = PyQuat().setFrom2Vectors('Quat', outXfo.ori.getXaxis('Vec3'), targ.subtract('Vec3', outXfo.tr).unit('Vec3'))
+            outXfo.ori = alignment.multiply('Quat', outXfo.ori)
+
+            outXfo.sc = outScaling
+
+            preXfo = outXfo
+            outputs[i] = outXfo.toMat44('Mat44')
+
+
+def _interpolateKeyframes(time0, value0, outTangent, time1, value1, inTangent, time):
+    """Evaluates the Bezier curve between two keyframes, the tangents are
+    offsets of the inner control points from their keys."""
+
+    x = (time0, time0 + outTangent.x, time1 + inTangent.x, time1)
+    y = (value0, value0 + outTangent.y, value1 + inTangent.y, value1)
+
+    def bezier(p, t):
+        u = 1.0 - t
+        return u * u * u * p[0] + 3.0 * u * u * t * p[1] + 3.0 * u * t * t * p[2] + t * t * t * p[3]
+
+    # Find the curve parameter of the time, the curve is monotonic in time.
+    low = 0.0
+    high = 1.0
+    for i in xrange(32):
+        t = (low + high) * 0.5
+        if bezier(x, t) < time:
+            low = t
+        else:
+            high = t
+
+    return bezier(y, (low + high) * 0.5)
+
+
+def _softTentacleLimit(val, maxVal, maxValSoftening):
+    if val > (maxVal - maxValSoftening.x):
+        if val > (maxVal + maxValSoftening.y):
+            return maxVal
+
+        return _interpolateKeyframes(
+            maxVal - maxValSoftening.x, maxVal - maxValSoftening.x,
+            PyVec2(maxValSoftening.x * 0.5, maxValSoftening.x * 0.5),
+            maxVal + maxValSoftening.y, maxVal,
+            PyVec2(maxValSoftening.y * -0.5, 0.0),
+            val)
+
+    return val
+
+
+def _solveTentacleIK(basePose, goalPosition):
+    """Port of solveTentacleIK in TentacleSolver.kl."""
+
+    numBones = len(basePose)
+    boneVectors = [PyVec3() for i in xrange(numBones)]
+    ikpose = [PyXfo() for i in xrange(numBones)]
+    for i in xrange(numBones - 1):
+        ikpose[i] = basePose[i].clone()
+        # Note: Scaling of bones is currently not supported.
+        boneVectors[i] = basePose[i].inverse('Xfo').transformVector('Vec3', basePose[i + 1].tr)
+
+    lastBoneIndex = numBones - 1
+    fkChainTip = basePose[lastBoneIndex].tr.clone()
+
+    chainOffsetRotation = PyQuat()
+    for i in xrange(numBones - 1):
+        boneXfo = basePose[i].clone()
+        if i > 0:
+            # Calculate a new pose position based on the parent bones new orientation
+            boneXfo.tr = ikpose[i - 1].transformVector('Vec3', boneVectors[i - 1])
+
+        vecToFkChainTip = fkChainTip.subtract('Vec3', boneXfo.tr)
+        distToFkChainTip = vecToFkChainTip.length('Scalar')
+        vecToFkChainTip = vecToFkChainTip.multiplyScalar('Vec3', 1.0 / distToFkChainTip)
+
+        vecToIkGoal = goalPosition.subtract('Vec3', boneXfo.tr)
+        distToIkGoal = vecToIkGoal.length('Scalar')
+        vecToIkGoal = vecToIkGoal.multiplyScalar('Vec3', 1.0 / distToIkGoal)
+
+        if i == 0:
+            # For the first bone calculate and store the overall chain offset towards the ik target
+            chainOffsetRotation.setFrom2Vectors('Quat', vecToFkChainTip, vecToIkGoal)
+
+        # Apply the chain offset, and apply any incremental correction.
+        boneOffsetRotation = PyQuat().setFrom2Vectors('Quat', vecToFkChainTip, vecToIkGoal)
+        fraction = float(i) / float(numBones - 1)
+        boneOffsetRotation = PyQuat().sphericalLinearInterpolate('Quat', chainOffsetRotation, fraction).sphericalLinearInterpolate('Quat', boneOffsetRotation, fraction)
+        boneXfo.ori = boneOffsetRotation.multiply('Quat', boneXfo.ori)
+
+        ikpose[i] = boneXfo
+
+    ikpose[lastBoneIndex].tr = ikpose[lastBoneIndex - 1].transformVector('Vec3', boneVectors[lastBoneIndex - 1])
+
+    return ikpose
+
+
+class PyTentacleSolver(PyKrakenSolver):
+    """Python implementation of the KL TentacleSolver type."""
+
+    typeName = 'TentacleSolver'
+    arguments = PyKrakenSolver.arguments + (
+        ('time', 'in', 'Scalar'),
+        ('ikblend', 'in', 'Scalar'),
+        ('waveLength_Y', 'in', 'Scalar'),
+        ('waveAmplitude_Y', 'in', 'Scalar'),
+        ('waveFrequency_Y', 'in', 'Scalar'),
+        ('waveLength_Z', 'in', 'Scalar'),
+        ('waveAmplitude_Z', 'in', 'Scalar'),
+        ('waveFrequency_Z', 'in', 'Scalar'),
+        ('tipBias', 'in', 'Scalar'),
+        ('springStrength', 'in', 'Scalar'),
+        ('dampening', 'in', 'Scalar'),
+        ('simulationWeight', 'in', 'Scalar'),
+        ('softLimitBounds', 'in', 'Scalar'),
+        ('chainBase', 'in', 'Mat44'),
+        ('ikgoal', 'in', 'Mat44'),
+        ('fkcontrols', 'in', 'Mat44[]'),
+        ('tipBoneLen', 'in', 'Scalar'),
+        ('pose', 'out', 'Mat44[]'),
+        ('tentacleEnd', 'out', 'Mat44')
+    )
+
+
+    def __init__(self):
+        super(PyTentacleSolver, self).__init__()
+        self.trCurr = PyVec3()
+        self.trPrev = PyVec3()
+
+
+    def solveDynamics(self, returnType, goalPosition, springStrength, dampening, simulationWeight, softLimitBounds):
+        """Port of TentacleSolver.solveDynamics, returns the new goal position."""
+
+        timeStep = 1.0 / 30.0
+        mass = 1.0
+
+        temp = self.trCurr.clone()
+        self.trPrev = self.trPrev.linearInterpolate('Vec3', self.trCurr, dampening)
+
+        force = goalPosition.subtract('Vec3', self.trCurr).multiplyScalar('Vec3', springStrength)
+        velocity = self.trCurr.subtract('Vec3', self.trPrev)
+        self.trCurr = self.trCurr.add('Vec3', velocity.add('Vec3', force.multiplyScalar('Vec3', (1.0 / mass) * (timeStep * timeStep))))
+
+        # Apply a soft limit to the distance the verlet bone and move from the attach point.
+        vecToAttachXfo = self.trCurr.subtract('Vec3', goalPosition)
+        distToAttachXfo = vecToAttachXfo.length('Scalar')
+        if distToAttachXfo > softLimitBounds * 0.5:
+            limit = _softTentacleLimit(distToAttachXfo, softLimitBounds, PyVec2(softLimitBounds * 0.5, softLimitBounds * 1.5))
+            self.trCurr = goalPosition.add('Vec3', vecToAttachXfo.multiplyScalar('Vec3', limit / distToAttachXfo))
+
+        goalPosition = goalPosition.linearInterpolate('Vec3', self.trCurr, simulationWeight)
+        self.trPrev = temp
+
+        return goalPosition
+
+
+    def solve(self, returnType, drawDebug, rigScale, time, ikblend, waveLength_Y,
+              waveAmplitude_Y, waveFrequency_Y, waveLength_Z, waveAmplitude_Z,
+              waveFrequency_Z, tipBias, springStrength, dampening,
+              simulationWeight, softLimitBounds, chainBase, ikgoal, fkcontrols,
+              tipBoneLen, pose, tentacleEnd):
+
+        if len(fkcontrols) != len(pose):
+            raise Exception("Error in TentacleSolver. The number of FKControls does not match the number of joints")
+
+        numControls = len(fkcontrols)
+
+        xfoPose = []
+        boneVectors = [PyVec3() for i in xrange(numControls)]
+        for i in xrange(numControls):
+            xfo = _xfoFromMat44(fkcontrols[i])
+            localXfo = xfo
+            if i > 0:
+                parentInv = _xfoFromMat44(fkcontrols[i - 1]).inverse('Xfo')
+                localXfo = parentInv.multiply('Xfo', xfo)
+                boneVectors[i - 1] = localXfo.tr.clone()
+
+            fraction = float(i) / float(numControls)
+            bias = 1.0 - (((math.cos(fraction * math.pi) * 0.5) + 0.5) * tipBias)
+
+            wave = PyQuat().setFromEuler('Quat', PyEuler(
+                0.0,
+                math.cos((time * -waveFrequency_Y) + (fraction * waveLength_Y * math.pi)) * waveAmplitude_Y * bias,
+                math.cos((time * -waveFrequency_Z) + (fraction * waveLength_Z * math.pi)) * waveAmplitude_Z * bias
+                ))
+
+            localXfo.ori = localXfo.ori.multiply('Quat', wave)
+
+            if i > 0:
+                xfoPose.append(xfoPose[i - 1].multiply('Xfo', localXfo))
+            else:
+                xfoPose.append(localXfo)
+
+        boneVectors[-1] = PyVec3(tipBoneLen, 0.0, 0.0)
+        tipXfo = xfoPose[numControls - 1].clone()
+        tipXfo.tr = xfoPose[numControls - 1].transformVector('Vec3', boneVectors[-1])
+        xfoPose.append(tipXfo)
+
+        if ikblend > 0.0:
+            goalPosition = self.solveDynamics('Vec3', ikgoal.translation('Vec3'), springStrength, dampening, simulationWeight, softLimitBounds)
+
+            ikPose = _solveTentacleIK(xfoPose, goalPosition)
+
+            # Now blend the IK result with the FK result
+            for i in xrange(len(xfoPose)):
+                xfoPose[i].ori = xfoPose[i].ori.sphericalLinearInterpolate('Quat', ikPose[i].ori, ikblend)
+                if i > 0:
+                    xfoPose[i].tr = xfoPose[i - 1].transformVector('Vec3', boneVectors[i - 1])
+
+        # Convert the Xfos back to Mat44s
+        for i in xrange(len(pose)):
+            pose[i] = xfoPose[i].toMat44('Mat44')
+        tentacleEnd.copy(xfoPose[-1].toMat44('Mat44'))
+
+
+SOLVER_TYPES = {
+    'PoseConstraintSolver': PyPoseConstraintSolver,
+    'MultiPoseConstraintSolver': PyMultiPoseConstraintSolver,
+    'DirectionConstraintSolver': PyDirectionConstraintSolver,
+    'RigScaleSolver': PyRigScaleSolver,
+    'TwoBoneIKSolver': PyTwoBoneIKSolver,
+    'NBoneIKSolver': PyNBoneIKSolver,
+    'BezierSpineSolver': PyBezierSpineSolver,
+    'TentacleSolver': PyTentacleSolver
+}
@@ -5,6 +5,9 @@ SpliceOperator - Splice operator object.
 
 """
 
+import array
+import hashlib
+
 from kraken.core.maths import Mat44
 from kraken.core.objects.object_3d import Object3D
 from kraken.core.objects.operators.operator import Operator
@@ -12,6 +15,22 @@ from kraken.core.objects.attributes.attribute import Attribute
 from kraken.core.kraken_system import ks
 
 
+# Stub operator source code shared by the operators, source code key -> source.
+_sourceCodeCache = {}
+
+# Number of buffer values per element of the types supported by evaluateFrames.
+_bufferSizes = {
+    'Mat44': 16,
+    'Boolean': 1,
+    'Scalar': 1,
+    'Float32': 1,
+    'Float64': 1,
+    'Integer': 1,
+    'SInt32': 1,
+    'UInt32': 1
+}
+
+
 class SpliceOperator(Operator):
     """Splice Operator representation."""
 
@@ -28,13 +47,12 @@ class SpliceOperator(Operator):
         self.extension = extension
         self.alwaysEval = alwaysEval # This is for Softimage only to force eval.
 
-        # Load the Fabric Engine client and construct the RTVal for the Solver
-        ks.loadCoreClient()
-        ks.loadExtension('Kraken')
-        if self.extension != 'Kraken':
-            ks.loadExtension(self.extension)
-        self.solverRTVal = ks.constructRTVal(self.solverTypeName)
-        self.args = self.solverRTVal.getArguments('KrakenSolverArg[]')
+        # The arguments are shared by all the operators of the solver type. The
+        # RTVal of the solver is constructed on the first evaluation, it is a
+        # Python solver when the 'Python' solver backend evaluates the type.
+        self.solverRTVal = None
+        self.solverBackend = None
+        self.args = ks.getSolverArgs(self.solverTypeName, self.extension)
 
         # Initialize the inputs and outputs based on the given args.
         for i in xrange(len(self.args)):
@@ -50,6 +68,12 @@ class SpliceOperator(Operator):
                 else:
                     self.outputs[arg.name] = None
 
+        # Argument buffer reused between evaluations, constructed on the first
+        # evaluation.
+        self._argVals = None
+        self._argKeys = None
+        self._argSlots = None
+
 
     def getSolverTypeName(self):
         """Returns the solver type name for this operator.
@@ -89,21 +113,81 @@ class SpliceOperator(Operator):
         """Returns the args array defined by the KL Operator.
 
         Return:
-        RTValArray, args array defined by the KL Operator.
+        List, SolverArg tuples of the args defined by the KL Operator.
 
         """
 
         return self.args
 
 
+    def getSourceCodeKey(self, arraySizes={}):
+        """Returns the key of the stub operator source code. Operators with the
+        same key share the same stub.
+
+        Arguments:
+        arraySizes -- Dict, sizes of the output arrays resized by the stub.
+
+        Return:
+        Tuple, solver type, extension, arg signature and array sizes.
+
+        """
+
+        signature = tuple([(str(arg.name), str(arg.connectionType), str(arg.dataType)) for arg in self.args])
+
+        return (self.solverTypeName, self.extension, signature, tuple(sorted(arraySizes.iteritems())))
+
+
+    def getKLOperatorName(self, arraySizes={}):
+        """Returns the name of the stub operator. The name only depends on the
+        source code key so identical stubs have identical source code.
+
+        Arguments:
+        arraySizes -- Dict, sizes of the output arrays resized by the stub.
+
+        Return:
+        String, name of the stub operator.
+
+        """
+
+        key = repr(self.getSourceCodeKey(arraySizes=arraySizes))
+
+        return self.solverTypeName + "_" + hashlib.md5(key).hexdigest()[:8]
+
+
+    def hasCachedSourceCode(self, arraySizes={}):
+        """Returns whether the source code of the stub operator has already
+        been generated.
+
+        Arguments:
+        arraySizes -- Dict, sizes of the output arrays resized by the stub.
+
+        Return:
+        Boolean, True if the source code is cached.
+
+        """
+
+        return self.getSourceCodeKey(arraySizes=arraySizes) in _sourceCodeCache
+
+
     def generateSourceCode(self, arraySizes={}):
         """Returns the source code for a stub operator that will invoke the KL operator
 
+        The source code is cached by solver type, extension, arg signature and
+        array sizes, and shared by all the operators with the same key.
+
+        Arguments:
+        arraySizes -- Dict, sizes of the output arrays resized by the stub.
+
         Return:
         String, The source code for the stub operator.
 
         """
 
+        key = self.getSourceCodeKey(arraySizes=arraySizes)
+        opSourceCode = _sourceCodeCache.get(key)
+        if opSourceCode is not None:
+            return opSourceCode
+
         # Start constructing the source code.
         opSourceCode = ""
         opSourceCode += "require Kraken;\n"
@@ -113,14 +197,14 @@ class SpliceOperator(Operator):
 
         opSourceCode += "\n\n"
 
-        opSourceCode += "operator " + self.getName() + "(\n"
+        opSourceCode += "operator " + self.getKLOperatorName(arraySizes=arraySizes) + "(\n"
 
         opSourceCode += "  io " + self.solverTypeName + " solver,\n"
 
         # In SpliceMaya, output arrays are not resized by the system prior to calling into Splice, so we
         # explicily resize the arrays in the generated operator stub code.
         arrayResizing = "";
-        for argName, arraySize in arraySizes.iteritems():
+        for argName, arraySize in sorted(arraySizes.iteritems()):
             arrayResizing += "  "+argName+".resize("+str(arraySize)+");\n"
 
         functionCall = "  solver.solve("
@@ -154,9 +238,146 @@ class SpliceOperator(Operator):
         opSourceCode += functionCall
         opSourceCode += "}\n"
 
+        _sourceCodeCache[key] = opSourceCode
+
         return opSourceCode
 
 
+    # ==================
+    # Argument Buffers
+    # ==================
+    def _bindArgs(self):
+        """Constructs the solver and the argument buffer passed to it.
+
+        The buffer is kept between evaluations. The context values and the
+        arrays are constructed once, and only the slots whose connected values
+        have changed are updated before each solve. The solver and the buffer
+        are constructed again when the solver backend of the type changes.
+
+        Return:
+        True if successful.
+
+        """
+
+        solverBackend = self._getSolverBackend()
+
+        if self.solverRTVal is None or solverBackend != self.solverBackend:
+            if solverBackend == 'Python':
+                self.solverRTVal = ks.getPythonSolverClass(self.solverTypeName)()
+            else:
+                # Load the Fabric Engine client and construct the RTVal for the Solver
+                ks.loadCoreClient()
+                ks.loadExtension('Kraken')
+                if self.extension != 'Kraken':
+                    ks.loadExtension(self.extension)
+                self.solverRTVal = ks.constructRTVal(self.solverTypeName)
+
+            self.solverBackend = solverBackend
+
+        self._argVals = []
+        self._argKeys = []
+        self._argSlots = []
+
+        for i in xrange(len(self.args)):
+            arg = self.args[i]
+            dataType = str(arg.dataType)
+            name = str(arg.name)
+
+            if dataType == 'EvalContext' or name == 'time' or name == 'frame':
+                if solverBackend == 'Python':
+                    if dataType == 'EvalContext':
+                        self._argVals.append(None)
+                    else:
+                        self._argVals.append(ks.constructPyVal(dataType))
+                else:
+                    self._argVals.append(ks.constructRTVal(dataType))
+                self._argKeys.append(None)
+                continue
+
+            isInput = arg.connectionType == 'in'
+            if dataType.endswith('[]'):
+                if solverBackend == 'Python':
+                    self._argVals.append([])
+                else:
+                    self._argVals.append(ks.rtVal(dataType[:-2] + 'Array'))
+                self._argKeys.append([])
+                self._argSlots.append((i, name, isInput, True))
+            else:
+                self._argVals.append(None)
+                self._argKeys.append(None)
+                self._argSlots.append((i, name, isInput, False))
+
+        return True
+
+
+    def _updateArgs(self):
+        """Updates the slots of the argument buffer whose connected values have
+        changed since the last evaluation.
+
+        Changes are detected with _getValueKey. Transforms are only compared
+        when they hold Python math values, with the 'KL' math backend their
+        slots are converted on every evaluation as comparing the RTVals would
+        cost as much as converting them.
+
+        Return:
+        List, the argument values to pass to the solver.
+
+        """
+
+        if self._argVals is None or self.solverBackend != self._getSolverBackend():
+            self._bindArgs()
+
+        argVals = self._argVals
+        argKeys = self._argKeys
+        if self.solverBackend == 'Python':
+            getValue = _getPyVal
+        else:
+            getValue = _getRTVal
+
+        for i, name, isInput, isArray in self._argSlots:
+            if isInput:
+                connected = self.inputs[name]
+            else:
+                connected = self.outputs[name]
+
+            if isArray:
+                rtValArray = argVals[i]
+                keys = argKeys[i]
+                if len(keys) != len(connected):
+                    _resizeArray(rtValArray, len(connected))
+                    keys = [None] * len(connected)
+                    argKeys[i] = keys
+
+                for j in xrange(len(connected)):
+                    key = _getValueKey(connected[j])
+                    if key is None or key != keys[j]:
+                        rtValArray[j] = getValue(connected[j])
+                        keys[j] = key
+
+            else:
+                key = _getValueKey(connected)
+                if key is None or key != argKeys[i]:
+                    argVals[i] = getValue(connected)
+                    argKeys[i] = key
+
+        return argVals
+
+
+    def _getSolverBackend(self):
+        """Returns the backend evaluating the solver of the operator.
+
+        Return:
+        String, 'Python' if the solver type has a Python implementation and
+        the 'Python' solver backend evaluates it, 'KL' otherwise.
+
+        """
+
+        if ks.getPythonSolverClass(self.solverTypeName) is not None:
+            return 'Python'
+
+        return 'KL'
+
+
     def evaluate(self):
         """invokes the Splice operator causing the output values to be computed.
 
@@ -165,60 +386,374 @@ class SpliceOperator(Operator):
 
         """
 
-        def getRTVal(obj):
-            if isinstance(obj, Object3D):
-                return obj.xfo.getRTVal().toMat44('Mat44')
-            elif isinstance(obj, Attribute):
-                return obj.getRTVal()
+        argVals = self._updateArgs()
+
+        self.solverRTVal.solve('', *argVals)
+
+        # Now put the computed values out to the connected output objects and
+        # record their new values so they aren't uploaded again next time.
+        argKeys = self._argKeys
+        for i, name, isInput, isArray in self._argSlots:
+            if isInput:
+                continue
+
+            connected = self.outputs[name]
+            if isArray:
+                rtValArray = argVals[i]
+                keys = argKeys[i]
+                for j in xrange(len(rtValArray)):
+                    _setRTVal(connected[j], rtValArray[j])
+                    keys[j] = _getValueKey(connected[j])
+            else:
+                _setRTVal(connected, argVals[i])
+                argKeys[i] = _getValueKey(connected)
+
+        return True
+
+    # =================
+    # Batch Evaluation
+    # =================
+    def evaluateFrames(self, numFrames, inputs={}, times=None):
+        """Evaluates the solver over a range of frames without setting the
+        connected output objects.
+
+        Input buffers hold the values of all the frames contiguously, 16
+        values per Mat44 in row major order and 1 value per Boolean, Scalar or
+        Integer. Array buffers hold the elements of each frame one after the
+        other, the number of elements is derived from the size of the buffer.
+        Any sequence of numbers can be used as a buffer, e.g. lists, arrays or
+        NumPy arrays. Inputs without a buffer keep the value of the connected
+        object for all the frames.
+
+        The frames are solved in order with the solver of the operator, so
+        solvers keeping state between evaluations behave as during playback.
+        Both the KL and the Python solver backends are supported.
+
+        Arguments:
+        numFrames -- Integer, the number of frames to evaluate.
+        inputs -- Dict, input name -> buffer of the values of the input.
+        times -- List, time of each frame passed to the 'time' and 'frame'
+                 arguments of the solver, None to keep the current time.
+
+        Return:
+        Dict, output name -> array.array of the values of the output for all
+        the frames, laid out as the input buffers.
+
+        """
 
-        argVals = []
+        for name in inputs:
+            if name not in self.inputs:
+                raise Exception("Operator '" + self.getName() + "' has no input named '" + name + "'.")
+
+        if times is not None and len(times) != numFrames:
+            raise Exception("The number of times doesn't match the number of frames:" + str(len(times)))
+
+        argVals = self._updateArgs()
+        argKeys = self._argKeys
+        solverBackend = self.solverBackend
+
+        # Find the slots to set each frame and the slots to read back.
+        inputSlots = []
+        outputSlots = []
+        timeSlots = []
         for i in xrange(len(self.args)):
             arg = self.args[i]
-            if arg.dataType == 'EvalContext':
-                argVals.append(ks.constructRTVal(arg.dataType))
+            name = str(arg.name)
+            dataType = str(arg.dataType)
+            if name == 'time' or name == 'frame':
+                if times is not None:
+                    timeSlots.append((i, dataType))
                 continue
-            if arg.name == 'time':
-                argVals.append(ks.constructRTVal(arg.dataType))
-                continue
-            if arg.name == 'frame':
-                argVals.append(ks.constructRTVal(arg.dataType))
+
+            isArray = dataType.endswith('[]')
+            if isArray:
+                dataType = dataType[:-2]
+
+            if arg.connectionType == 'in' and name not in inputs:
                 continue
 
+            if dataType not in _bufferSizes:
+                raise Exception("Batch evaluation doesn't support argument '" + name + "' of type '" + str(arg.dataType) + "'.")
+
+            size = _bufferSizes[dataType]
+
             if arg.connectionType == 'in':
-                if str(arg.dataType).endswith('[]'):
-                    rtValArray = ks.rtVal(arg.dataType[:-2]+'Array')
-                    rtValArray.resize(len(self.inputs[arg.name]))
-                    for j in xrange(len(self.inputs[arg.name])):
-                        rtValArray[j] = getRTVal(self.inputs[arg.name][j])
-                    argVals.append(rtValArray)
-                else:
-                    argVals.append(getRTVal(self.inputs[arg.name]))
+                buffer = inputs[name]
+                frameSize = size
+                if isArray and numFrames > 0:
+                    frameSize = len(buffer) / numFrames / size * size
+
+                if len(buffer) != numFrames * frameSize:
+                    raise Exception("Invalid buffer size for input '" + name + "':" + str(len(buffer)) + ". Expected " + str(size) + " values per element and frame.")
+
+                if isArray:
+                    _resizeArray(argVals[i], frameSize / size)
+
+                inputSlots.append((i, dataType, isArray, frameSize, buffer))
+
             else:
-                if str(arg.dataType).endswith('[]'):
-                    rtValArray = ks.rtVal(arg.dataType[:-2]+'Array')
-                    rtValArray.resize(len(self.outputs[arg.name]))
-                    for j in xrange(len(self.outputs[arg.name])):
-                        rtValArray[j] = getRTVal(self.outputs[arg.name][j])
-                    argVals.append(rtValArray)
+                if not isArray and argVals[i] is None:
+                    argVals[i] = _readBufferValue(dataType, _getDefaultBuffer(dataType), 0, solverBackend)
+
+                outputSlots.append((i, name, dataType, isArray))
+
+        results = {}
+        for i, name, dataType, isArray in outputSlots:
+            results[name] = array.array(_getBufferTypeCode(dataType))
+
+        timeVals = [argVals[i] for i, dataType in timeSlots]
+
+        try:
+            for frame in xrange(numFrames):
+                for i, dataType in timeSlots:
+                    if solverBackend == 'Python':
+                        argVals[i] = ks.constructPyVal(dataType, times[frame])
+                    else:
+                        argVals[i] = ks.constructRTVal(dataType, times[frame])
+
+                for i, dataType, isArray, frameSize, buffer in inputSlots:
+                    offset = frame * frameSize
+                    if isArray:
+                        values = argVals[i]
+                        size = _bufferSizes[dataType]
+                        for j in xrange(len(values)):
+                            values[j] = _readBufferValue(dataType, buffer, offset + j * size, solverBackend)
+                    else:
+                        argVals[i] = _readBufferValue(dataType, buffer, offset, solverBackend)
+
+                self.solverRTVal.solve('', *argVals)
+
+                for i, name, dataType, isArray in outputSlots:
+                    if isArray:
+                        values = argVals[i]
+                        for j in xrange(len(values)):
+                            _writeBufferValue(dataType, values[j], results[name])
+                    else:
+                        _writeBufferValue(dataType, argVals[i], results[name])
+
+        finally:
+            # Restore the time and convert the values of the connected objects
+            # again on the next evaluation.
+            for j in xrange(len(timeSlots)):
+                argVals[timeSlots[j][0]] = timeVals[j]
+
+            for i, dataType, isArray, frameSize, buffer in inputSlots:
+                if isArray:
+                    _resizeArray(argVals[i], len(argKeys[i]))
+                    argKeys[i] = [None] * len(argKeys[i])
                 else:
-                    argVals.append(getRTVal(self.outputs[arg.name]))
+                    argKeys[i] = None
 
-        self.solverRTVal.solve('', *argVals)
+            for i, name, dataType, isArray in outputSlots:
+                if isArray:
+                    argKeys[i] = [None] * len(argKeys[i])
+                else:
+                    argKeys[i] = None
 
-        # Now put the computed values out to the connected output objects.
-        def setRTVal(obj, rtval):
-            if isinstance(obj, Object3D):
-                obj.xfo.setFromMat44(Mat44(rtval))
-            elif isinstance(obj, Attribute):
-                obj.setValue(rtval)
+        return results
 
-        for i in xrange(len(argVals)):
-            arg = self.args[i]
-            if arg.connectionType != 'in':
-                if str(arg.dataType).endswith('[]'):
-                    for j in xrange(len(argVals[i])):
-                        setRTVal(self.outputs[arg.name][j], argVals[i][j])
-                else:
-                    setRTVal(self.outputs[arg.name], argVals[i])
 
-        return True
\ No newline at end of file
+def _getValueKey(obj):
+    """Returns a key used to test whether the value of a connected object has
+    changed.
+
+    Only transforms holding Python math values and attributes with simple
+    values have keys. The transforms of the 'KL' math backend hold RTVals,
+    which can't be compared without reading them back from KL.
+
+    Arguments:
+    obj -- Object, the connected object.
+
+    Return:
+    Tuple, the key, None if the value can't be compared without converting it.
+
+    """
+
+    if isinstance(obj, Object3D):
+        rtval = obj.xfo._rtval
+        if ks.isPyVal(rtval):
+            return (Object3D, rtval._values())
+
+    elif isinstance(obj, Attribute):
+        value = obj.getValue()
+        if type(value) in (bool, int, long, float, str, unicode):
+            return (obj.__class__, value)
+
+    return None
+
+
+def _getRTVal(obj):
+    """Returns the RTVal passed to the solver for a connected object.
+
+    Arguments:
+    obj -- Object, the connected object.
+
+    Return:
+    RTVal, the value of the object.
+
+    """
+
+    if isinstance(obj, Object3D):
+        return obj.xfo.getRTVal().toMat44('Mat44')
+    elif isinstance(obj, Attribute):
+        return obj.getRTVal()
+
+
+def _getPyVal(obj):
+    """Returns the Python value passed to a Python solver for a connected
+    object.
+
+    Arguments:
+    obj -- Object, the connected object.
+
+    Return:
+    Object, the value of the object.
+
+    """
+
+    if isinstance(obj, Object3D):
+        return ks.constructPyVal('Xfo', obj.xfo).toMat44('Mat44')
+    elif isinstance(obj, Attribute):
+        return obj.getValue()
+
+
+def _resizeArray(array, size):
+    """Resizes an array of the argument buffer.
+
+    Arguments:
+    array -- Object, the RTVal array or the list passed to a Python solver.
+    size -- Integer, the new size of the array.
+
+    Return:
+    True if successful.
+
+    """
+
+    if isinstance(array, list):
+        del array[size:]
+        array.extend([None] * (size - len(array)))
+    else:
+        array.resize(size)
+
+    return True
+
+
+def _setRTVal(obj, rtval):
+    """Sets a connected output object from the value computed by the solver.
+
+    Arguments:
+    obj -- Object, the connected object.
+    rtval -- RTVal, the computed value.
+
+    Return:
+    True if successful.
+
+    """
+
+    if isinstance(obj, Object3D):
+        obj.xfo.setFromMat44(Mat44(rtval))
+    elif isinstance(obj, Attribute):
+        obj.setValue(rtval)
+
+    return True
+
+
+def _getBufferTypeCode(dataType):
+    """Returns the array type code of the output buffers of a type.
+
+    Arguments:
+    dataType -- String, the KL type of the values.
+
+    Return:
+    String, the type code.
+
+    """
+
+    if dataType == 'Boolean':
+        return 'B'
+    elif dataType in ('Integer', 'SInt32', 'UInt32'):
+        return 'l'
+
+    return 'd'
+
+
+def _getDefaultBuffer(dataType):
+    """Returns a buffer holding the default value of a type.
+
+    Arguments:
+    dataType -- String, the KL type of the value.
+
+    Return:
+    List, the buffer values.
+
+    """
+
+    if dataType == 'Mat44':
+        return [1.0, 0.0, 0.0, 0.0,
+                0.0, 1.0, 0.0, 0.0,
+                0.0, 0.0, 1.0, 0.0,
+                0.0, 0.0, 0.0, 1.0]
+
+    return [0]
+
+
+def _readBufferValue(dataType, buffer, offset, solverBackend):
+    """Constructs the value passed to a solver from a batch buffer.
+
+    Arguments:
+    dataType -- String, the KL type of the value.
+    buffer -- List, the buffer to read from.
+    offset -- Integer, the index of the first value in the buffer.
+    solverBackend -- String, the solver backend, 'KL' or 'Python'.
+
+    Return:
+    Object, the RTVal or Python value.
+
+    """
+
+    if dataType == 'Mat44':
+        PyVec4 = ks.getPythonBackend().PyVec4
+        value = ks.getPythonBackend().PyMat44(
+            PyVec4(*[float(x) for x in buffer[offset:offset + 4]]),
+            PyVec4(*[float(x) for x in buffer[offset + 4:offset + 8]]),
+            PyVec4(*[float(x) for x in buffer[offset + 8:offset + 12]]),
+            PyVec4(*[float(x) for x in buffer[offset + 12:offset + 16]]))
+
+        if solverBackend == 'Python':
+            return value
+
+        return value.toRTVal()
+
+    if solverBackend == 'Python':
+        return ks.constructPyVal(dataType, buffer[offset])
+
+    return ks.constructRTVal(dataType, ks.constructPyVal(dataType, buffer[offset]))
+
+
+def _writeBufferValue(dataType, value, buffer):
+    """Appends a value computed by a solver to a batch buffer.
+
+    Arguments:
+    dataType -- String, the KL type of the value.
+    value -- Object, the RTVal or Python value.
+    buffer -- array.array, the buffer to append to.
+
+    Return:
+    True if successful.
+
+    """
+
+    if dataType == 'Mat44':
+        if ks.isRTVal(value):
+            value = ks.getPythonBackend().PyMat44.fromRTVal(value)
+
+        for row in value._values():
+            buffer.extend(row)
+
+    else:
+        if ks.isRTVal(value):
+            value = ks.getPythonBackend().SIMPLE_TYPES[dataType](value)
+
+        buffer.append(value)
+
+    return True
@@ -12,8 +12,12 @@ import os
 from container import Container
 from kraken.core.kraken_system import KrakenSystem
 from kraken.core.profiler import Profiler
+from kraken.core.io.rig_definition_reader import RigDefinitionReader
+from kraken.core.io.rig_definition_binary import isBinaryRigDefinition
+from kraken.core.io.rig_definition_binary import writeBinaryRigDefinition
+from kraken.core.io.rig_definition_binary import RigDefinitionBinaryReader
 from kraken.core.objects.layer import Layer
-from kraken.helpers.utility_methods import prepareToSave, prepareToLoad
+from kraken.helpers.utility_methods import prepareToSave
 
 
 class Rig(Container):
@@ -22,11 +26,12 @@ class Rig(Container):
     def __init__(self, name='rig'):
         super(Rig, self).__init__(name)
 
-    def writeRigDefinitionFile(self, filepath):
+    def writeRigDefinitionFile(self, filepath, binary=False):
         """Load a rig definition from a file on disk.
 
         Arguments:
         filepath -- string, the file path of the rig definition file.
+        binary -- bool, write the compact binary format instead of JSON.
 
         Return:
         True if successful.
@@ -37,18 +42,30 @@ class Rig(Container):
 
         jsonData = self.getData()
 
-        # now preprocess the data ready for saving to disk.
-        pureJSON = prepareToSave(jsonData)
+        if binary is True:
+            writeBinaryRigDefinition(filepath, jsonData)
+        else:
+            # now preprocess the data ready for saving to disk.
+            pureJSON = prepareToSave(jsonData)
 
-        with open(filepath,'w') as rigFile:
-            rigFile.write(json.dumps(pureJSON, indent=2))
+            with open(filepath,'w') as rigFile:
+                rigFile.write(json.dumps(pureJSON, indent=2))
 
         Profiler.getInstance().pop()
 
+        return True
+
 
     def loadRigDefinitionFile(self, filepath):
         """Load a rig definition from a file on disk.
 
+        Both JSON and binary rig definitions are supported, the format is
+        detected from the file. JSON files are read incrementally. Math objects
+        are decoded while parsing and each component is constructed as soon as
+        its data has been read, so the whole file is never held in memory at
+        once. Subclasses overriding loadRigDefinition are given the whole rig
+        definition instead.
+
         Arguments:
         filepath -- string, the file path of the rig definition file.
 
@@ -62,37 +79,103 @@ class Rig(Container):
         if not os.path.exists(filepath):
             raise Exception("File not found:" + filepath)
 
-        with open(filepath) as rigFile:
-            jsonData = json.load(rigFile)
+        if isBinaryRigDefinition(filepath):
+            reader = RigDefinitionBinaryReader(filepath)
+        else:
+            reader = RigDefinitionReader(filepath)
 
-        # now preprocess the data ready for loading.
-        jsonData = prepareToLoad(jsonData)
+        if type(self).loadRigDefinition.im_func is Rig.loadRigDefinition.im_func:
+            self._loadRigDefinitionItems(reader.iterItems(streamKeys=('components', )))
+        else:
+            self.loadRigDefinition(dict(reader.iterItems()))
 
-        self.loadRigDefinition(jsonData)
         Profiler.getInstance().pop()
 
+        return True
+
+
+    def _loadRigDefinitionItems(self, items):
+        """Loads a rig definition from its top level keys and values.
+
+        Each component is given as a separate 'components' item and is
+        constructed as soon as it is read. The rig is renamed before the first
+        component is constructed, components read before the name are held
+        back until it has been read. Connections and graph positions are
+        applied once all the components exist.
+
+        Arguments:
+        items -- iterator, (key, value) tuples of the rig definition.
+
+        Return:
+        True if successful.
 
-    def _loadComponents(self, componentsJson):
+        """
 
         Profiler.getInstance().push("__loadComponents")
 
-        krakenSystem = KrakenSystem.getInstance()
+        hasName = False
+        hasComponents = False
+        heldComponents = []
+        jsonData = {}
+        for key, value in items:
+            if key == 'components':
+                hasComponents = True
+                if hasName is True:
+                    self._loadComponent(value)
+                else:
+                    heldComponents.append(value)
+
+            elif key == 'name':
+                self.setName(value)
+                hasName = True
 
-        for componentData in componentsJson:
-            # trim off the class name to get the module path.
-            modulePath = '.'.join(componentData['class'].split('.')[:-1])
-            if modulePath is not "":
-                importlib.import_module(modulePath)
+                for componentData in heldComponents:
+                    self._loadComponent(componentData)
+
+                heldComponents = []
 
-            componentClass = krakenSystem.getComponentClass(componentData['class'])
-            if 'name' in componentData:
-                component = componentClass(name=componentData['name'], parent=self)
             else:
-                component = componentClass(parent=self)
-            component.loadData(componentData)
+                jsonData[key] = value
+
+        for componentData in heldComponents:
+            self._loadComponent(componentData)
 
         Profiler.getInstance().pop()
 
+        if hasComponents is True and 'connections' in jsonData:
+            self._makeConnections(jsonData['connections'])
+
+        if 'graphPositions' in jsonData:
+            self._loadGraphPositions(jsonData['graphPositions'])
+
+        return True
+
+
+    def _loadComponent(self, componentData):
+        """Constructs a component from its data and adds it to the rig.
+
+        Arguments:
+        componentData -- dict, the JSON data of the component.
+
+        Return:
+        The constructed component.
+
+        """
+
+        # trim off the class name to get the module path.
+        modulePath = '.'.join(componentData['class'].split('.')[:-1])
+        if modulePath is not "":
+            importlib.import_module(modulePath)
+
+        componentClass = KrakenSystem.getInstance().getComponentClass(componentData['class'])
+        if 'name' in componentData:
+            component = componentClass(name=componentData['name'], parent=self)
+        else:
+            component = componentClass(parent=self)
+        component.loadData(componentData)
+
+        return component
+
 
     def _makeConnections(self, connectionsJson):
 
@@ -149,30 +232,19 @@ class Rig(Container):
 
         Profiler.getInstance().push("loadRigDefinition:" + self.getName())
 
-        krakenSystem = KrakenSystem.getInstance()
-
-        if 'name' in jsonData:
-            self.setName(jsonData['name'])
-
-        if 'components' in jsonData:
-            self._loadComponents(jsonData['components'])
-
-            if 'connections' in jsonData:
-                self._makeConnections(jsonData['connections'])
-
-
-        if 'graphPositions' in jsonData:
-            self._loadGraphPositions(jsonData['graphPositions'])
+        self._loadRigDefinitionItems(_iterRigDefinitionItems(jsonData))
 
         Profiler.getInstance().pop()
 
+        return True
 
 
-    def writeGuideDefinitionFile(self, filepath):
+    def writeGuideDefinitionFile(self, filepath, binary=False):
         """Writes a rig definition to a file on disk.
 
         Arguments:
         filepath -- string, the file path of the rig definition file.
+        binary -- bool, write the compact binary format instead of JSON.
 
         Return:
         True if successful.
@@ -183,14 +255,19 @@ class Rig(Container):
 
         guideData = self.getRigBuildData()
 
-        # now preprocess the data ready for saving to disk.
-        pureJSON = prepareToSave(guideData)
+        if binary is True:
+            writeBinaryRigDefinition(filepath, guideData)
+        else:
+            # now preprocess the data ready for saving to disk.
+            pureJSON = prepareToSave(guideData)
 
-        with open(filepath,'w') as rigDef:
-            rigDef.write(json.dumps(pureJSON, indent=2))
+            with open(filepath,'w') as rigDef:
+                rigDef.write(json.dumps(pureJSON, indent=2))
 
         Profiler.getInstance().pop()
 
+        return True
+
 
     def getData(self):
         """Get the graph definition of the rig. This method is used to save the state of the guide itself.
@@ -272,3 +349,24 @@ class Rig(Container):
         guideData['graphPositions'] = graphPositions
 
         return guideData
+
+
+def _iterRigDefinitionItems(jsonData):
+    """Iterates over the top level keys and values of a rig definition the
+    way they are read from a file, one item per component.
+
+    Arguments:
+    jsonData -- dict, the JSON data containing the rig definition.
+
+    Return:
+    Iterator returning (key, value) tuples.
+
+    """
+
+    for key, value in jsonData.iteritems():
+        if key == 'components':
+            for componentData in value:
+                yield key, componentData
+
+        else:
+            yield key, value
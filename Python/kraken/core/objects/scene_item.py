@@ -13,6 +13,12 @@ class SceneItem(object):
         super(SceneItem, self).__init__()
         self._parent = parent
         self._name = name
+        self._pathCache = None
+        self._decoratedPathCache = None
+        self._pathDependents = set()
+
+        if parent is not None:
+            parent._addPathDependent(self)
 
 
     # ==============
@@ -29,21 +35,37 @@ class SceneItem(object):
         return self.__class__.__name__
 
 
-    def getTypeHierarchyNames(self):
-        """Returns the class name of this object.
+    @classmethod
+    def _getTypeHierarchy(cls):
+        """Returns the cached type hierarchy of the class.
+
+        The hierarchy is computed once per class and stored on the class itself
+        so reloaded classes (e.g. in Maya) get a new cache.
 
         Return:
-        True if successful.
+        Tuple of the ordered type names and a frozenset of the same names.
 
         """
 
-        khierarchy = []
-        for cls in type.mro(type(self)):
-            if cls == object:
-                break;
-            khierarchy.append(cls.__name__)
+        typeHierarchy = cls.__dict__.get('_typeHierarchy')
+        if typeHierarchy is None:
+            mro = type.mro(cls)
+            typeNames = tuple([x.__name__ for x in mro if x is not object])
+            typeHierarchy = (typeNames, frozenset([x.__name__ for x in mro]))
+            cls._typeHierarchy = typeHierarchy
+
+        return typeHierarchy
+
 
-        return khierarchy
+    def getTypeHierarchyNames(self):
+        """Returns the class names of this object's type hierarchy.
+
+        Return:
+        List of the class names, starting with this object's class.
+
+        """
+
+        return list(self._getTypeHierarchy()[0])
 
 
     def isTypeOf(self, typeName):
@@ -54,11 +76,7 @@ class SceneItem(object):
 
         """
 
-        for cls in type.mro(type(self)):
-            if cls.__name__ == typeName:
-                return True
-
-        return False
+        return typeName in self._getTypeHierarchy()[1]
 
 
     # =============
@@ -88,21 +106,32 @@ class SceneItem(object):
 
         self._name = name
 
+        self._clearPathCache()
+
         return True
 
 
     def getPath(self):
         """Returns the full hierarchical path to this object.
 
+        The path is cached and cleared when the object or one of its parents is
+        renamed or re-parented.
+
         Return:
         String, full name of the object.
 
         """
 
-        if self.getParent() is not None:
-            return self.getParent().getPath() + '.' + self.getName()
+        path = self._pathCache
+        if path is None:
+            if self.getParent() is not None:
+                path = self.getParent().getPath() + '.' + self.getName()
+            else:
+                path = self.getName()
 
-        return self.getName()
+            self._pathCache = path
+
+        return path
 
 
     def getNameDecoration(self):
@@ -130,16 +159,76 @@ class SceneItem(object):
     def getDecoratedPath(self):
         """Gets the decorated path of the object.
 
+        The path is cached and cleared when the object or one of its parents is
+        renamed or re-parented.
+
         Return:
         String, decorated path  of the object.
 
         """
 
+        decoratedPath = self._decoratedPathCache
+        if decoratedPath is None:
+            if self.getParent() is not None:
+                decoratedPath = self.getParent().getDecoratedPath() + '.' + self.getDecoratedName()
+            else:
+                decoratedPath = self.getDecoratedName()
+
+            self._decoratedPathCache = decoratedPath
+
+        return decoratedPath
+
 
-        if self.getParent() is not None:
-            return self.getParent().getDecoratedPath() + '.' + self.getDecoratedName()
+    def _addPathDependent(self, sceneItem):
+        """Adds an item whose path depends on the name or path of this one.
 
-        return self.getDecoratedName()
+        Arguments:
+        sceneItem -- Object, item to clear the path cache of when the path of
+                     this item changes.
+
+        Return:
+        True if successful.
+
+        """
+
+        self._pathDependents.add(sceneItem)
+
+        return True
+
+
+    def _removePathDependent(self, sceneItem):
+        """Removes an item added with _addPathDependent.
+
+        Arguments:
+        sceneItem -- Object, item to remove.
+
+        Return:
+        True if successful.
+
+        """
+
+        self._pathDependents.discard(sceneItem)
+
+        return True
+
+
+    def _clearPathCache(self):
+        """Clears the cached paths of this object and all the items depending
+        on it.
+
+        Return:
+        True if successful.
+
+        """
+
+        stack = [self]
+        while len(stack) > 0:
+            sceneItem = stack.pop()
+            sceneItem._pathCache = None
+            sceneItem._decoratedPathCache = None
+            stack.extend(sceneItem._pathDependents)
+
+        return True
 
 
     # ===============
@@ -167,6 +256,14 @@ class SceneItem(object):
 
         """
 
+        if self._parent is not None:
+            self._parent._removePathDependent(self)
+
         self._parent = parent
 
+        if parent is not None:
+            parent._addPathDependent(self)
+
+        self._clearPathCache()
+
         return True
@@ -5,38 +5,228 @@ Profiler - Profiler Object.
 
 """
 
+import gc
+import os
+import sys
+import json
 import time
-import operator
+import timeit
+import functools
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+
+# High resolution clock. time.perf_counter is monotonic, Python 2 falls back to
+# the best timer available on the platform.
+_clock = getattr(time, 'perf_counter', timeit.default_timer)
+
+try:
+    _pageSize = os.sysconf('SC_PAGE_SIZE')
+except (AttributeError, ValueError, OSError):
+    _pageSize = 4096
+
+
+def _getMemoryUsage():
+    """Returns the current and peak memory use of the process.
+
+    The traced memory is used when tracemalloc is tracing, the resident set
+    size of the process otherwise. Values that can't be determined on the
+    platform are None.
+
+    Returns:
+        tuple: Current and peak memory use in bytes.
+
+    """
+
+    if tracemalloc is not None and tracemalloc.is_tracing():
+        return tracemalloc.get_traced_memory()
+
+    current = None
+    try:
+        with open('/proc/self/statm', 'r') as statmFile:
+            current = int(statmFile.read().split()[1]) * _pageSize
+    except (IOError, OSError, ValueError, IndexError):
+        pass
+
+    peak = None
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        if sys.platform != 'darwin':
+            peak *= 1024
+
+    return (current, peak)
+
+
+def _countKrakenObjects():
+    """Returns the number of live objects of each kraken type.
+
+    Returns:
+        dict: Type names and the number of objects of the type.
+
+    """
+
+    counts = {}
+    for obj in gc.get_objects():
+        objType = type(obj)
+        if getattr(objType, '__module__', '').startswith('kraken'):
+            typeName = objType.__name__
+            counts[typeName] = counts.get(typeName, 0) + 1
+
+    return counts
+
+
+def _getDelta(start, end):
+    if start is None or end is None:
+        return None
+
+    return end - start
 
 
 class _ProfilerItem(object):
 
-    def __init__(self, label):
+    def __init__(self, label, start=None):
         super(_ProfilerItem, self).__init__()
 
-        t = time.time()
+        if start is None:
+            start = _clock()
+
         self.label = label
-        self.start = t
-        self.end = t
+        self.start = start
+        self.end = start
         self.children = []
 
+        # (net, peak) bytes and object count changes when memory is tracked.
+        self.memory = None
+        self.objects = None
+
 
     def addChild(self, item):
         self.children.append(item)
 
 
-    def endProfiling(self):
-        self.end = time.time()
+    def endProfiling(self, end=None):
+        if end is None:
+            end = _clock()
+
+        self.end = end
+
+
+class _ProfilerStats(object):
+    """Aggregated timings of all the sections with the same label."""
+
+    __slots__ = ('label', 'count', 'total', 'selfTotal', 'min', 'max',
+                 'net', 'peak', 'objects')
+
+    def __init__(self, label):
+        super(_ProfilerStats, self).__init__()
+
+        self.label = label
+        self.count = 0
+        self.total = 0.0
+        self.selfTotal = 0.0
+        self.min = None
+        self.max = None
+        self.net = None
+        self.peak = None
+        self.objects = None
+
+
+    def add(self, duration, selfDuration):
+        self.count += 1
+        self.total += duration
+        self.selfTotal += selfDuration
+
+        if self.min is None or duration < self.min:
+            self.min = duration
+
+        if self.max is None or duration > self.max:
+            self.max = duration
+
+
+    def addMemory(self, net, peak, objects):
+        if net is not None:
+            self.net = (self.net or 0) + net
+
+        if peak is not None and (self.peak is None or peak > self.peak):
+            self.peak = peak
+
+        if objects is not None:
+            if self.objects is None:
+                self.objects = {}
+
+            for typeName, count in objects.iteritems():
+                self.objects[typeName] = self.objects.get(typeName, 0) + count
+
+
+class _NullSection(object):
+    """Context manager used for sections when the profiler is disabled."""
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, excType, excValue, traceback):
+        return False
+
+
+_nullSection = _NullSection()
+
+
+class _ProfilerSection(object):
+    """Context manager that pushes a label on enter and pops it on exit."""
+
+    __slots__ = ('profiler', 'label')
+
+    def __init__(self, profiler, label):
+        self.profiler = profiler
+        self.label = label
+
+
+    def __enter__(self):
+        self.profiler.push(self.label)
+        return self
+
+
+    def __exit__(self, excType, excValue, traceback):
+        self.profiler.pop()
+        return False
 
 
 class Profiler(object):
-    """Kraken profiler object for debugging performance issues."""
+    """Kraken profiler object for debugging performance issues.
+
+    Each push/pop section is timed with a high resolution clock and added to
+    per label statistics (count, total, self, min and max time). The call tree
+    is recorded as well unless tree recording is turned off.
+
+    Sections can also record the change of the process' memory use and, as
+    counting them walks all live objects, optionally the change in the number
+    of objects of each kraken type.
+
+    The singleton instance is disabled unless the KRAKEN_PROFILE environment
+    variable is set to a non zero value. A disabled profiler returns from push
+    and pop straight away and records nothing.
+
+    """
 
     __instance = None
 
 
-    def __init__(self):
+    def __init__(self, enabled=True, recordTree=True, trackMemory=False, countObjects=False):
         super(Profiler, self).__init__()
+
+        self._enabled = enabled
+        self._recordTree = recordTree
+        self._trackMemory = trackMemory
+        self._countObjects = countObjects
         self.reset()
 
 
@@ -45,8 +235,111 @@ class Profiler(object):
 
         self.__roots = []
         self.__stack = []
+        self.__stats = {}
+        self.__startTime = _clock()
+
+
+    # ==================
+    # Settings Methods
+    # ==================
+    def isEnabled(self):
+        """Returns whether the profiler is recording.
+
+        Returns:
+            bool: True if push and pop record sections.
+
+        """
+
+        return self._enabled
+
+
+    def setEnabled(self, enabled):
+        """Enables or disables the profiler.
 
+        Sections that are open when the profiler is disabled are discarded.
+
+        Args:
+            enabled (bool): Whether push and pop record sections.
+
+        Returns:
+            bool: True if successful.
 
+        """
+
+        if not enabled:
+            self.__stack = []
+
+        self._enabled = enabled
+
+        return True
+
+
+    def getRecordTree(self):
+        """Returns whether the call tree is recorded.
+
+        Returns:
+            bool: True if the call tree is recorded.
+
+        """
+
+        return self._recordTree
+
+
+    def setRecordTree(self, recordTree):
+        """Sets whether the call tree is recorded in addition to the per label
+        statistics. Turning it off keeps memory use constant for long
+        sessions.
+
+        Args:
+            recordTree (bool): Whether the call tree is recorded.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        self._recordTree = recordTree
+
+        return True
+
+
+    def getTrackMemory(self):
+        """Returns whether sections record the change in memory use.
+
+        Returns:
+            bool: True if memory use is tracked.
+
+        """
+
+        return self._trackMemory
+
+
+    def setTrackMemory(self, trackMemory, countObjects=False):
+        """Sets whether sections record the change in memory use.
+
+        Memory is measured with tracemalloc when it is tracing and from the
+        resident set size of the process otherwise. Measuring adds overhead to
+        push and pop, so the timings of sections with many children grow.
+
+        Args:
+            trackMemory (bool): Whether memory use is tracked.
+            countObjects (bool): Whether the number of live objects of each
+                kraken type is counted as well. This is slow for large scenes.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        self._trackMemory = trackMemory
+        self._countObjects = trackMemory and countObjects
+
+        return True
+
+
+    # ==================
+    # Profiling Methods
+    # ==================
     def push(self, label):
 
         """Adds a new child to the profiling tree and activates it.
@@ -56,26 +349,119 @@ class Profiler(object):
 
         """
 
+        if not self._enabled:
+            return
+
+        memoryStart = None
+        objectsStart = None
+        if self._trackMemory:
+            memoryStart = _getMemoryUsage()
+            if self._countObjects:
+                objectsStart = _countKrakenObjects()
+
         item = _ProfilerItem(label)
-        if len(self.__stack) == 0:
-            self.__roots.append(item)
-        else:
-            self.__stack[-1].addChild(item)
+        if self._recordTree:
+            if len(self.__stack) == 0:
+                self.__roots.append(item)
+            else:
+                self.__stack[-1][0].addChild(item)
 
-        self.__stack.append(item)
+        # Stack entries hold the item, the time spent in its children and the
+        # memory use when the section started.
+        self.__stack.append([item, 0.0, memoryStart, objectsStart])
 
 
     def pop(self):
         """Deactivates the current item in the tree and returns the profiler to
         the parent item"""
 
-        end = time.time()
+        if not self._enabled:
+            return
+
+        end = _clock()
         if len(self.__stack) == 0:
             raise Exception("""Unable to close bracket. Pop has been called more """+
                             """times than push.""")
 
-        self.__stack[-1].endProfiling()
-        self.__stack.pop()
+        item, childDuration, memoryStart, objectsStart = self.__stack.pop()
+        item.endProfiling(end)
+
+        duration = end - item.start
+        if len(self.__stack) > 0:
+            self.__stack[-1][1] += duration
+
+        stats = self.__stats.get(item.label)
+        if stats is None:
+            stats = _ProfilerStats(item.label)
+            self.__stats[item.label] = stats
+
+        stats.add(duration, duration - childDuration)
+
+        if memoryStart is not None:
+            memoryEnd = _getMemoryUsage()
+            item.memory = (_getDelta(memoryStart[0], memoryEnd[0]),
+                           _getDelta(memoryStart[1], memoryEnd[1]))
+
+            if objectsStart is not None:
+                objectsEnd = _countKrakenObjects()
+                item.objects = {}
+                for typeName in set(objectsStart).union(objectsEnd):
+                    count = objectsEnd.get(typeName, 0) - objectsStart.get(typeName, 0)
+                    if count != 0:
+                        item.objects[typeName] = count
+
+            stats.addMemory(item.memory[0], item.memory[1], item.objects)
+
+
+    def section(self, label):
+        """Returns a context manager that profiles the enclosed block.
+
+        Args:
+            label (str): The label of the section.
+
+        Returns:
+            object: Context manager pushing the label on enter and popping it
+                on exit.
+
+        """
+
+        if not self._enabled:
+            return _nullSection
+
+        return _ProfilerSection(self, label)
+
+
+    def getStats(self):
+        """Returns the aggregated statistics of the recorded sections.
+
+        Returns:
+            dict: Labels and dictionaries with the 'count', 'total', 'self',
+                'min' and 'max' times of the sections with the label. When
+                memory is tracked 'net' holds the summed change in bytes,
+                'peak' the largest rise of the peak memory use and 'objects'
+                the change in the number of objects of each kraken type. They
+                are None otherwise.
+
+        """
+
+        result = {}
+        for label, stats in self.__stats.iteritems():
+            objects = None
+            if stats.objects is not None:
+                objects = dict(stats.objects)
+
+            result[label] = {
+                'count': stats.count,
+                'total': stats.total,
+                'self': stats.selfTotal,
+                'min': stats.min,
+                'max': stats.max,
+                'net': stats.net,
+                'peak': stats.peak,
+                'objects': objects
+            }
+
+        return result
 
 
     def generateReport(self, listFunctionTotals=False):
@@ -90,23 +476,18 @@ class Profiler(object):
 
         """
 
-        if len(self.__stack) != 0:
-            raise Exception("""Profiler brackets not closed properly. """+
-                            """Pop must be called for every call to push. Pop """+
-                            """needs to be called another """ +
-                             str(len(self.__stack)) + """ times""")
+        self._checkBrackets()
 
         report = []
         report.append("--callstack--")
 
-        functions = {}
         def reportItem(item, indent):
             duration = item.end - item.start
-            report.append(indent + item.label + ' duration: ' + str(duration))
-            if item.label not in functions:
-                functions[item.label] = duration
-            else:
-                functions[item.label] += duration
+            line = indent + item.label + ' duration: ' + str(duration)
+            if item.memory is not None:
+                line += ' net: ' + str(item.memory[0]) + ' peak: ' + str(item.memory[1])
+
+            report.append(line)
 
             for childItem in item.children:
                 reportItem(childItem, indent + '  ')
@@ -117,28 +498,240 @@ class Profiler(object):
         if listFunctionTotals:
             report.append("--functions--")
 
-            def reverse_numeric(x, y):
-                return y < x
+            sortedStats = sorted(self.__stats.values(), key=lambda stats: stats.total, reverse=True)
+            for stats in sortedStats:
+                report.append(str(stats.total) + ': ' + stats.label +
+                              ' count: ' + str(stats.count) +
+                              ' self: ' + str(stats.selfTotal) +
+                              ' min: ' + str(stats.min) +
+                              ' max: ' + str(stats.max))
+
+        return '\n'.join(report)
+
+
+    def generateMemoryReport(self):
+        """Returns a report string listing the memory recorded for each label,
+        the labels growing memory use the most first.
 
-            sorted_fns = sorted(functions.items(), key=operator.itemgetter(1),
-                                cmp=reverse_numeric)
+        Returns:
+            str: The memory report.
 
-            for fn_tuple in sorted_fns:
-                report.append(str(fn_tuple[1]) +': ' + fn_tuple[0])
+        """
+
+        self._checkBrackets()
+
+        report = []
+        report.append("--memory--")
+
+        memoryStats = [stats for stats in self.__stats.values() if stats.net is not None or stats.objects is not None]
+        memoryStats.sort(key=lambda stats: (stats.net or 0, stats.peak or 0), reverse=True)
+
+        for stats in memoryStats:
+            report.append(stats.label +
+                          ' net: ' + str(stats.net) +
+                          ' peak: ' + str(stats.peak) +
+                          ' count: ' + str(stats.count))
+
+            if stats.objects is not None:
+                for typeName in sorted(stats.objects, key=lambda name: (-abs(stats.objects[name]), name)):
+                    count = stats.objects[typeName]
+                    report.append('  ' + typeName + ': ' + ('+' if count > 0 else '') + str(count))
 
         return '\n'.join(report)
 
 
+    # ===============
+    # Export Methods
+    # ===============
+    def _checkBrackets(self):
+        """Raises an exception if sections are still open.
+
+        Returns:
+            bool: True if all the sections are closed.
+
+        """
+
+        if len(self.__stack) != 0:
+            raise Exception("""Profiler brackets not closed properly. """+
+                            """Pop must be called for every call to push. Pop """+
+                            """needs to be called another """ +
+                             str(len(self.__stack)) + """ times""")
+
+        return True
+
+
+    def generateChromeTrace(self, pid=1, tid=1):
+        """Returns the call tree as Chrome trace event data.
+
+        Every section is a complete ('X') event with its start time and
+        duration in microseconds since the profiler was reset. The result can
+        be loaded in chrome://tracing or any viewer of the trace event format.
+
+        Args:
+            pid (int): Process id to use for the events.
+            tid (int): Thread id to use for the events.
+
+        Returns:
+            dict: Trace data with the events in the 'traceEvents' list.
+
+        """
+
+        self._checkBrackets()
+
+        events = []
+        startTime = self.__startTime
+
+        stack = list(reversed(self.__roots))
+        while len(stack) > 0:
+            item = stack.pop()
+            event = {
+                'name': item.label,
+                'cat': 'kraken',
+                'ph': 'X',
+                'ts': (item.start - startTime) * 1000000.0,
+                'dur': (item.end - item.start) * 1000000.0,
+                'pid': pid,
+                'tid': tid
+            }
+
+            if item.memory is not None:
+                event['args'] = {'net': item.memory[0], 'peak': item.memory[1]}
+                if item.objects is not None:
+                    event['args']['objects'] = item.objects
+
+            events.append(event)
+
+            stack.extend(reversed(item.children))
+
+        return {
+            'traceEvents': events,
+            'displayTimeUnit': 'ms'
+        }
+
+
+    def writeChromeTrace(self, filePath):
+        """Writes the call tree to a Chrome trace event JSON file.
+
+        Args:
+            filePath (str): Path of the file to write.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        with open(filePath, 'w') as traceFile:
+            json.dump(self.generateChromeTrace(), traceFile)
+
+        return True
+
+
+    def generateCollapsedStacks(self):
+        """Returns the call tree in the collapsed stack format used by
+        flamegraph tools.
+
+        Each line holds the labels of a call stack separated by semicolons and
+        the self time spent in it in microseconds. Stacks that occur more than
+        once are summed.
+
+        Returns:
+            str: The collapsed stacks, one per line, sorted by stack.
+
+        """
+
+        self._checkBrackets()
+
+        stacks = {}
+
+        stack = [(item, ()) for item in reversed(self.__roots)]
+        while len(stack) > 0:
+            item, parentPath = stack.pop()
+            path = parentPath + (item.label.replace(';', ':'), )
+
+            selfDuration = item.end - item.start
+            for childItem in item.children:
+                selfDuration -= childItem.end - childItem.start
+
+            key = ';'.join(path)
+            stacks[key] = stacks.get(key, 0.0) + max(selfDuration, 0.0)
+
+            stack.extend([(childItem, path) for childItem in reversed(item.children)])
+
+        lines = [key + ' ' + str(int(round(stacks[key] * 1000000.0))) for key in sorted(stacks)]
+
+        return '\n'.join(lines)
+
+
+    def writeCollapsedStacks(self, filePath):
+        """Writes the call tree to a collapsed stack file.
+
+        Args:
+            filePath (str): Path of the file to write.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        with open(filePath, 'w') as stacksFile:
+            stacksFile.write(self.generateCollapsedStacks())
+            stacksFile.write('\n')
+
+        return True
+
+
     @classmethod
     def getInstance(cls):
         """This class method returns the singleton instance for the Profiler
 
+        The instance is only enabled if the KRAKEN_PROFILE environment
+        variable is set to a non zero value, and only tracks memory if
+        KRAKEN_PROFILE_MEMORY is.
+
         Returns:
             object: The singleton profiler instance.
 
         """
 
         if cls.__instance is None:
-            cls.__instance = Profiler()
+            enabled = os.environ.get('KRAKEN_PROFILE', '0') not in ('', '0')
+            trackMemory = os.environ.get('KRAKEN_PROFILE_MEMORY', '0') not in ('', '0')
+            cls.__instance = Profiler(enabled=enabled, trackMemory=trackMemory)
 
         return cls.__instance
+
+
+def profiled(label=None):
+    """Decorator that profiles each call of the decorated function with the
+    singleton profiler.
+
+    When the profiler is disabled the function is called directly.
+
+    Args:
+        label (str): Label of the sections, the function name by default.
+
+    Returns:
+        function: The decorator.
+
+    """
+
+    def decorator(func):
+        sectionLabel = label
+        if sectionLabel is None:
+            sectionLabel = func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            profiler = Profiler.getInstance()
+            if not profiler._enabled:
+                return func(*args, **kwargs)
+
+            profiler.push(sectionLabel)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                profiler.pop()
+
+        return wrapper
+
+    return decorator
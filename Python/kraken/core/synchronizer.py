@@ -1,3 +1,4 @@
+from kraken.core.maths.xfo_array import XfoArray
 
 
 class Synchronizer(object):
@@ -17,6 +18,10 @@ class Synchronizer(object):
         super(Synchronizer, self).__init__()
         self._hrcMap = {}
         self._target = None
+        self._dirtyItems = set()
+        self._trackingChanges = False
+        self._syncedCount = 0
+        self._skippedCount = 0
 
         if target is not None:
             self.setTarget(target)
@@ -47,11 +52,31 @@ class Synchronizer(object):
 
         """
 
+        prevHrcMap = self._hrcMap
+        prevDirtyItems = self._dirtyItems
+
         self.clearHierarchyMap()
 
         self._target = target
 
-        self.createHierarchyMap(self.getTarget())
+        self.createHierarchyMap(self.getTarget(), prevHrcMap=prevHrcMap)
+
+        # Keep the sync state of the items that still map to the same DCC item
+        # so incremental syncs don't have to sync them again.
+        for kObject, mapEntry in self._hrcMap.iteritems():
+            prevEntry = prevHrcMap.get(kObject)
+            if prevEntry is None or 'changeId' not in prevEntry:
+                continue
+
+            if prevEntry['dccItem'] is None or prevEntry['dccItem'] != mapEntry['dccItem']:
+                continue
+
+            mapEntry['changeId'] = prevEntry['changeId']
+
+        self._dirtyItems = prevDirtyItems.intersection(self._hrcMap.keys())
+
+        if self._trackingChanges is True:
+            self.startChangeTracking()
 
         return True
 
@@ -70,7 +95,18 @@ class Synchronizer(object):
         return self._hrcMap
 
 
-    def createHierarchyMap(self, kObject):
+    def createHierarchyMap(self, kObject, prevHrcMap=None):
+        """Maps the kObject and its descendants to their DCC items.
+
+        DCC items found in the previous map are reused when the object's
+        decorated path hasn't changed and the item is still valid, so the DCC
+        items are only looked up by name once.
+
+        Args:
+            kObject (object): object to map.
+            prevHrcMap (dict): previous hierarchy map to reuse DCC items from.
+
+        """
 
         # ==============
         # Map Hierarchy
@@ -78,10 +114,21 @@ class Synchronizer(object):
 
         # Skip components in the mapping as they are not built into the DCC
         if kObject.isTypeOf('Component') is False:
-            dccItem = self.getDCCItem(kObject)
+            path = kObject.getDecoratedPath()
+
+            dccItem = None
+            if prevHrcMap is not None and kObject in prevHrcMap:
+                prevEntry = prevHrcMap[kObject]
+                if prevEntry['path'] == path and prevEntry['dccItem'] is not None:
+                    if self.isDCCItemValid(prevEntry['dccItem']):
+                        dccItem = prevEntry['dccItem']
+
+            if dccItem is None:
+                dccItem = self.getDCCItem(kObject)
 
             self._hrcMap[kObject] = {
-                           "dccItem": dccItem
+                           "dccItem": dccItem,
+                           "path": path
                           }
 
         # =======================
@@ -91,24 +138,95 @@ class Synchronizer(object):
             # Iterate over attribute groups
             for i in xrange(kObject.getNumAttributeGroups()):
                 attrGrp = kObject.getAttributeGroupByIndex(i)
-                self.createHierarchyMap(attrGrp)
+                self.createHierarchyMap(attrGrp, prevHrcMap=prevHrcMap)
 
         # Iterate over attributes
         if kObject.isTypeOf('AttributeGroup'):
             for i in xrange(kObject.getNumAttributes()):
                 attr = kObject.getAttributeByIndex(i)
-                self.createHierarchyMap(attr)
+                self.createHierarchyMap(attr, prevHrcMap=prevHrcMap)
 
         if kObject.isTypeOf('Object3D'):
 
             # Iterate over children
             for i in xrange(kObject.getNumChildren()):
                 child = kObject.getChildByIndex(i)
-                self.createHierarchyMap(child)
+                self.createHierarchyMap(child, prevHrcMap=prevHrcMap)
 
         return
 
 
+    def isHierarchyMapCurrent(self):
+        """Checks that the hierarchy map still matches the target hierarchy.
+
+        The map is out of date when objects were added to or removed from the
+        hierarchy, were renamed or moved, or when the DCC items they are mapped
+        to no longer exist, e.g. after the DCC objects were built again.
+
+        Returns:
+            bool: True if the hierarchy map is up to date.
+
+        """
+
+        target = self.getTarget()
+        if target is None:
+            return len(self._hrcMap) == 0
+
+        numMapped = 0
+        stack = [target]
+        while len(stack) > 0:
+            item = stack.pop()
+
+            if item.isTypeOf('Component') is False:
+                mapEntry = self._hrcMap.get(item)
+                if mapEntry is None or mapEntry['path'] != item.getDecoratedPath():
+                    return False
+
+                dccItem = mapEntry['dccItem']
+                if dccItem is not None and self.isDCCItemValid(dccItem) is False:
+                    return False
+
+                numMapped += 1
+
+            if item.isTypeOf('Object3D'):
+                for i in xrange(item.getNumAttributeGroups()):
+                    stack.append(item.getAttributeGroupByIndex(i))
+
+                for i in xrange(item.getNumChildren()):
+                    stack.append(item.getChildByIndex(i))
+
+            if item.isTypeOf('AttributeGroup'):
+                for i in xrange(item.getNumAttributes()):
+                    stack.append(item.getAttributeByIndex(i))
+
+        return numMapped == len(self._hrcMap)
+
+
+    def getMappedDCCItem(self, kObject):
+        """Gets the DCC item mapped to the object, looking it up again if the
+        mapped item is no longer valid.
+
+        Args:
+            kObject (object): The Kraken object to get the DCC item for.
+
+        Returns:
+            object: The DCC item, None if the object isn't mapped or its DCC
+                item can't be found.
+
+        """
+
+        mapEntry = self._hrcMap.get(kObject)
+        if mapEntry is None:
+            return None
+
+        dccItem = mapEntry['dccItem']
+        if dccItem is None or self.isDCCItemValid(dccItem) is False:
+            dccItem = self.getDCCItem(kObject)
+            mapEntry['dccItem'] = dccItem
+
+        return dccItem
+
+
     def clearHierarchyMap(self):
         """Clears the hierarhcy map data.
 
@@ -118,82 +236,304 @@ class Synchronizer(object):
         """
 
         self._hrcMap = {}
+        self._dirtyItems = set()
+
+        return True
+
+
+    # ===================
+    # Dirty State Methods
+    # ===================
+    def markDirty(self, kObject):
+        """Marks an item as changed in the DCC so the next incremental sync
+        syncs it.
+
+        DCC change notifications should call this method.
+
+        Args:
+            kObject (object): The Kraken object whose DCC item changed.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        self._dirtyItems.add(kObject)
 
         return True
 
 
+    def markAllDirty(self):
+        """Marks all the items of the hierarchy map as changed.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        self._dirtyItems.update(self._hrcMap.keys())
+
+        return True
+
+
+    def isDirty(self, kObject):
+        """Returns whether the item has to be synced.
+
+        Items are dirty if they were never synced, were marked dirty, or their
+        DCC change id differs from the one recorded when they were last synced.
+        When the DCC provides no change id the item is only clean if change
+        notifications are being tracked.
+
+        Args:
+            kObject (object): The Kraken object to test.
+
+        Returns:
+            bool: True if the item has to be synced.
+
+        """
+
+        mapEntry = self._hrcMap.get(kObject)
+        if mapEntry is None or 'changeId' not in mapEntry:
+            return True
+
+        if kObject in self._dirtyItems:
+            return True
+
+        changeId = self.getChangeId(kObject)
+        if changeId is None:
+            return self._trackingChanges is False
+
+        return changeId != mapEntry['changeId']
+
+
+    def _setSynced(self, kObject, changeId):
+        """Records that the item was synced.
+
+        Items that aren't mapped to a DCC item couldn't be synced, they are
+        neither counted nor cleaned so the next sync tries them again.
+
+        Args:
+            kObject (object): The Kraken object that was synced.
+            changeId (object): The change id of the DCC item when it was synced.
+
+        Returns:
+            bool: True if successful, False if the item isn't mapped.
+
+        """
+
+        mapEntry = self._hrcMap.get(kObject)
+        if mapEntry is None or mapEntry['dccItem'] is None:
+            return False
+
+        mapEntry['changeId'] = changeId
+
+        self._dirtyItems.discard(kObject)
+        self._syncedCount += 1
+
+        return True
+
+
+    def getSyncedCount(self):
+        """Returns the number of items synced by the last sync.
+
+        Returns:
+            int: Number of items that were synced.
+
+        """
+
+        return self._syncedCount
+
+
+    def getSkippedCount(self):
+        """Returns the number of clean items the last sync skipped.
+
+        Returns:
+            int: Number of items that were skipped.
+
+        """
+
+        return self._skippedCount
+
+
+    def isTrackingChanges(self):
+        """Returns whether DCC change notifications are being tracked.
+
+        Returns:
+            bool: True if change notifications are tracked.
+
+        """
+
+        return self._trackingChanges
+
+
     # ========================
     # Synchronization Methods
     # ========================
-    def sync(self):
+    def sync(self, incremental=False):
         """Synchronizes the target hierarchy with the matching objects in the DCC.
 
+        Args:
+            incremental (bool): Only sync the items that are dirty.
+
         Returns:
             bool: True if successful.
 
         """
 
-        self.synchronize(self.getTarget())
+        self._syncedCount = 0
+        self._skippedCount = 0
 
-        return True
+        return self.synchronize(self.getTarget(), incremental=incremental)
+
+
+    def collectSyncItems(self, kObject, incremental=False):
+        """Collects the items of the hierarchy that have to be synced.
+
+        Args:
+            kObject (object): top object to collect the items from.
+            incremental (bool): Only collect the items that are dirty.
 
+        Returns:
+            list: The 3D objects and attributes to sync, in hierarchy order.
+
+        """
+
+        items = []
+
+        stack = [kObject]
+        while len(stack) > 0:
+            item = stack.pop()
+
+            isObject3D = item.isTypeOf('Object3D')
+            syncedItem = (isObject3D and item.isTypeOf('Component') is False) or item.isTypeOf('Attribute')
+
+            if syncedItem:
+                if incremental is True and self.isDirty(item) is False:
+                    self._skippedCount += 1
+                else:
+                    items.append(item)
+
+            # Push the children in reverse so they are popped in hierarchy
+            # order: attribute groups first, then children.
+            if isObject3D:
+                for i in reversed(xrange(item.getNumChildren())):
+                    stack.append(item.getChildByIndex(i))
 
-    def synchronize(self, kObject):
-        """Iteration method that traverses the hierarchy and syncs the different
-        object types.
+                for i in reversed(xrange(item.getNumAttributeGroups())):
+                    stack.append(item.getAttributeGroupByIndex(i))
+
+            if item.isTypeOf('AttributeGroup'):
+                for i in reversed(xrange(item.getNumAttributes())):
+                    stack.append(item.getAttributeByIndex(i))
+
+        return items
+
+
+    def synchronize(self, kObject, incremental=False):
+        """Syncs the object and its descendants from the DCC.
+
+        The transforms and attribute values of the items mapped to a DCC item
+        are read in one step with readXfos and readAttributeValues, then the
+        items are updated in hierarchy order. Items without a DCC item, or all
+        of them if the DCC can't read them in bulk, are synced with syncXfo and
+        syncAttribute.
 
         Args:
             kObject (object): object to synchronize.
+            incremental (bool): Only sync the items that are dirty.
 
         Returns:
             bool: True if successful.
 
         """
 
-        # =================
-        # Synchronize Data
-        # =================
-        if kObject.isTypeOf('Object3D'):
+        items = self.collectSyncItems(kObject, incremental=incremental)
 
-            # Sync Xfo if it's not a Component
-            if kObject.isTypeOf('Component') is False:
-                self.syncXfo(kObject)
+        # Record the change ids before reading so changes made while syncing
+        # are picked up by the next sync.
+        changeIds = [(item, self.getChangeId(item)) for item in items]
 
-            # Sync Curves / Controls
-            if kObject.isTypeOf('Curve') is True:
-                self.syncCurveData(kObject)
+        xfos = self._readMappedXfos([item for item in items if item.isTypeOf('Object3D')])
+        values = self._readMappedAttributeValues([item for item in items if item.isTypeOf('Attribute')])
 
-        elif kObject.isTypeOf('Attribute'):
-            self.syncAttribute(kObject)
+        for item in items:
+            if item.isTypeOf('Object3D'):
+                if item in xfos:
+                    item.xfo = xfos[item]
+                else:
+                    self.syncXfo(item)
 
-        else:
-            pass
+                # Sync Curves / Controls
+                if item.isTypeOf('Curve') is True:
+                    self.syncCurveData(item)
 
-        # =======================
-        # Iterate over hierarchy
-        # =======================
-        if kObject.isTypeOf('Object3D'):
-            # Iterate over attribute groups
-            for i in xrange(kObject.getNumAttributeGroups()):
-                attrGrp = kObject.getAttributeGroupByIndex(i)
-                self.synchronize(attrGrp)
+            elif item in values:
+                item.setValue(values[item])
 
-        # Iterate over attributes
-        if kObject.isTypeOf('AttributeGroup'):
-            for i in xrange(kObject.getNumAttributes()):
-                attr = kObject.getAttributeByIndex(i)
-                self.synchronize(attr)
+            else:
+                self.syncAttribute(item)
 
-        if kObject.isTypeOf('Object3D'):
-
-            # Iterate over children
-            for i in xrange(kObject.getNumChildren()):
-                child = kObject.getChildByIndex(i)
-                self.synchronize(child)
+        for item, changeId in changeIds:
+            self._setSynced(item, changeId)
 
         return True
 
 
+    def _readMappedXfos(self, kObjects):
+        """Reads the xfos of the objects mapped to a DCC item in one step.
+
+        Args:
+            kObjects (list): objects to read the xfos for.
+
+        Returns:
+            dict: The xfo of each object that was read, objects without a DCC
+                item are left out. Empty if the DCC can't read them in bulk.
+
+        """
+
+        mapped = [kObject for kObject in kObjects if self.getMappedDCCItem(kObject) is not None]
+        if len(mapped) == 0:
+            return {}
+
+        values = self.readXfos(mapped)
+        if values is None:
+            return {}
+
+        xfos = XfoArray()
+        xfos.setFromValues(values)
+        if len(xfos) != len(mapped):
+            raise Exception("readXfos returned " + str(len(xfos)) + " transforms for " + str(len(mapped)) + " objects.")
+
+        return dict([(kObject, xfos[i]) for i, kObject in enumerate(mapped)])
+
+
+    def _readMappedAttributeValues(self, kObjects):
+        """Reads the values of the attributes mapped to a DCC item in one step.
+
+        Args:
+            kObjects (list): attributes to read the values for.
+
+        Returns:
+            dict: The value of each attribute that was read, attributes without
+                a DCC item are left out. Empty if the DCC can't read them in
+                bulk.
+
+        """
+
+        mapped = [kObject for kObject in kObjects if self.getMappedDCCItem(kObject) is not None]
+        if len(mapped) == 0:
+            return {}
+
+        values = self.readAttributeValues(mapped)
+        if values is None:
+            return {}
+
+        if len(values) != len(mapped):
+            raise Exception("readAttributeValues returned " + str(len(values)) + " values for " + str(len(mapped)) + " attributes.")
+
+        return dict(zip(mapped, values))
+
+
     # ============
     # DCC Methods
     # ============
@@ -216,6 +556,114 @@ class Synchronizer(object):
         return dccItem
 
 
+    def isDCCItemValid(self, dccItem):
+        """Checks that a DCC item returned by getDCCItem still refers to an
+        existing DCC object. This test must be cheap; it should not look the
+        item up by name.
+
+        **This should be re-implemented in the sub-classed synchronizer for each
+        plugin.**
+
+        Args:
+            dccItem (object): The DCC item to check.
+
+        Returns:
+            bool: True if the DCC item can still be used.
+
+        """
+
+        return True
+
+
+    def getChangeId(self, kObject):
+        """Gets a value that changes whenever the DCC item of the object
+        changes, e.g. a change counter.
+
+        **This should be re-implemented in the sub-classed synchronizer for each
+        plugin that can provide one.**
+
+        Args:
+            kObject (object): The Kraken object to get the change id for.
+
+        Returns:
+            object: The change id, None if the DCC doesn't provide one.
+
+        """
+
+        return None
+
+
+    def startChangeTracking(self):
+        """Starts listening to DCC change notifications for the mapped items
+        and marks the items dirty when they change.
+
+        **This should be re-implemented in the sub-classed synchronizer for each
+        plugin that supports change notifications.**
+
+        Returns:
+            bool: True if change notifications are tracked.
+
+        """
+
+        return False
+
+
+    def stopChangeTracking(self):
+        """Stops listening to DCC change notifications.
+
+        **This should be re-implemented in the sub-classed synchronizer for each
+        plugin that supports change notifications.**
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        self._trackingChanges = False
+
+        return True
+
+
+    def readXfos(self, kObjects):
+        """Reads the local transforms of the DCC items of the objects in one
+        go.
+
+        **This should be re-implemented in the sub-classed synchronizer for each
+        plugin that can read transforms in bulk.**
+
+        Args:
+            kObjects (list): objects to read the transforms for. All of them
+                are mapped to a DCC item.
+
+        Returns:
+            list: Flat list of floats, 10 per object in the layout used by
+                XfoArray.setFromValues. None if the DCC can't read transforms in
+                bulk.
+
+        """
+
+        return None
+
+
+    def readAttributeValues(self, kObjects):
+        """Reads the values of the DCC items of the attributes in one go.
+
+        **This should be re-implemented in the sub-classed synchronizer for each
+        plugin that can read attribute values in bulk.**
+
+        Args:
+            kObjects (list): attributes to read the values for. All of them are
+                mapped to a DCC item.
+
+        Returns:
+            list: One value per attribute. None if the DCC can't read attribute
+                values in bulk.
+
+        """
+
+        return None
+
+
     def syncXfo(self, kObject):
         """Syncs the xfo from the DCC object to the Kraken object.
 
@@ -1,8 +1,12 @@
 
+from kraken.core.kraken_system import ks
 from kraken.core.maths.math_object import MathObject
+from kraken.core.maths.vec2 import Vec2
 from kraken.core.maths.vec3 import Vec3
+from kraken.core.maths.vec4 import Vec4
 from kraken.core.maths.xfo import Xfo
 from kraken.core.maths.quat import Quat
+from kraken.core.maths.python_backend import PyVec2, PyVec3, PyVec4, PyQuat, PyXfo
 
 from kraken.core.maths import decodeValue
 
@@ -21,24 +25,189 @@ def logHierarchy(kObject):
         logHierarchy(child)
 
 
-def __convertFromJSON(jsonData):
+# ======================
+# Math Encoding Methods
+# ======================
+# The encoders produce the same dictionaries as MathObject.jsonEncode without
+# looking the members up through dir(). Values of the Python math backend are
+# read straight from the backend value instead of through the wrappers.
+def _encodeVec2(value):
+    rtval = value._rtval
+    if type(rtval) is not PyVec2:
+        rtval = value
+
+    return {'__mathObjectClass__': 'Vec2', 'x': rtval.x, 'y': rtval.y}
+
+
+def _encodeVec3(value):
+    rtval = value._rtval
+    if type(rtval) is not PyVec3:
+        rtval = value
+
+    return {'__mathObjectClass__': 'Vec3', 'x': rtval.x, 'y': rtval.y, 'z': rtval.z}
+
+
+def _encodeVec4(value):
+    rtval = value._rtval
+    if type(rtval) is not PyVec4:
+        rtval = value
+
+    return {'__mathObjectClass__': 'Vec4', 'x': rtval.x, 'y': rtval.y, 'z': rtval.z, 't': rtval.t}
+
+
+def _encodeQuat(value):
+    rtval = value._rtval
+    if type(rtval) is not PyQuat:
+        rtval = value
+
+    v = rtval.v
+    return {
+        '__mathObjectClass__': 'Quat',
+        'w': rtval.w,
+        'v': {'__mathObjectClass__': 'Vec3', 'x': v.x, 'y': v.y, 'z': v.z}
+    }
+
+
+def _encodeXfo(value):
+    rtval = value._rtval
+    if type(rtval) is not PyXfo:
+        rtval = value
+
+    tr = rtval.tr
+    ori = rtval.ori
+    v = ori.v
+    sc = rtval.sc
+    return {
+        'sc': {'__mathObjectClass__': 'Vec3', 'x': sc.x, 'y': sc.y, 'z': sc.z},
+        '__mathObjectClass__': 'Xfo',
+        'tr': {'__mathObjectClass__': 'Vec3', 'x': tr.x, 'y': tr.y, 'z': tr.z},
+        'ori': {
+            '__mathObjectClass__': 'Quat',
+            'w': ori.w,
+            'v': {'__mathObjectClass__': 'Vec3', 'x': v.x, 'y': v.y, 'z': v.z}
+        }
+    }
+
+
+_mathEncoders = {
+    Vec2: _encodeVec2,
+    Vec3: _encodeVec3,
+    Vec4: _encodeVec4,
+    Quat: _encodeQuat,
+    Xfo: _encodeXfo
+}
+
+
+def _vec3Values(jsonData):
+    if type(jsonData) is dict:
+        return (float(jsonData['x']), float(jsonData['y']), float(jsonData['z']))
+
+    return (jsonData.x, jsonData.y, jsonData.z)
+
+
+def _quatValues(jsonData):
+    if type(jsonData) is dict:
+        return (_vec3Values(jsonData['v']), float(jsonData['w']))
+
+    return ((jsonData.v.x, jsonData.v.y, jsonData.v.z), jsonData.w)
+
+
+def _decodeVec2(jsonData, python):
+    x = float(jsonData['x'])
+    y = float(jsonData['y'])
+    if python:
+        return Vec2(PyVec2(x, y))
+
+    return Vec2(x, y)
+
+
+def _decodeVec3(jsonData, python):
+    x, y, z = _vec3Values(jsonData)
+    if python:
+        return Vec3(PyVec3(x, y, z))
+
+    return Vec3(x, y, z)
+
+
+def _decodeVec4(jsonData, python):
+    x = float(jsonData['x'])
+    y = float(jsonData['y'])
+    z = float(jsonData['z'])
+    t = float(jsonData['t'])
+    if python:
+        return Vec4(PyVec4(x, y, z, t))
+
+    return Vec4(x, y, z, t)
+
+
+def _decodeQuat(jsonData, python):
+    v, w = _quatValues(jsonData)
+    if python:
+        return Quat(PyQuat(PyVec3(*v), w))
+
+    return Quat(v=Vec3(*v), w=w)
+
+
+def _decodeXfo(jsonData, python):
+    tr = _vec3Values(jsonData['tr'])
+    v, w = _quatValues(jsonData['ori'])
+    sc = _vec3Values(jsonData['sc'])
+    if python:
+        return Xfo(PyXfo(PyVec3(*tr), PyQuat(PyVec3(*v), w), PyVec3(*sc)))
+
+    return Xfo(tr=Vec3(*tr), ori=Quat(v=Vec3(*v), w=w), sc=Vec3(*sc))
+
+
+_mathDecoders = {
+    'Vec2': _decodeVec2,
+    'Vec3': _decodeVec3,
+    'Vec4': _decodeVec4,
+    'Quat': _decodeQuat,
+    'Xfo': _decodeXfo
+}
+
+
+def __convertFromJSON(jsonData, python):
+
+    dataType = type(jsonData)
+    if dataType is dict:
+        mathClass = jsonData.get('__mathObjectClass__')
+        if mathClass is not None:
+            decoder = _mathDecoders.get(mathClass)
+            if decoder is not None:
+                return decoder(jsonData, python)
 
-    if type(jsonData) is list:
-        newList = []
-        for item in jsonData:
-            newList.append(__convertFromJSON(item))
-        return newList
-    elif type(jsonData) is dict:
-        if '__mathObjectClass__' in jsonData.keys():
             return decodeValue(jsonData)
+
         for key, value in jsonData.iteritems():
-            jsonData[key] = __convertFromJSON(value)
+            if type(value) in (dict, list):
+                newValue = __convertFromJSON(value, python)
+                if newValue is not value:
+                    jsonData[key] = newValue
+
+    elif dataType is list:
+        # Lists are only copied if they contain math objects.
+        newList = None
+        for i, item in enumerate(jsonData):
+            if type(item) in (dict, list):
+                newItem = __convertFromJSON(item, python)
+                if newItem is not item:
+                    if newList is None:
+                        newList = list(jsonData)
+                    newList[i] = newItem
+
+        if newList is not None:
+            return newList
+
     return jsonData
 
 
 def prepareToLoad(jsonData):
     """Prepares the json data for loading into kraken.
 
+    Math objects are decoded in place, lists are copied if they contain math
+    objects.
+
     Arguments:
     jsonData -- dict, the JSON data to be prepared.
 
@@ -47,29 +216,65 @@ def prepareToLoad(jsonData):
 
     """
 
-    return __convertFromJSON(jsonData)
+    python = ks.getMathBackend() == 'Python'
+    if python:
+        # The math objects only accept backend values once the backend has
+        # been loaded by the system.
+        ks.getPythonBackend()
+
+    return __convertFromJSON(jsonData, python)
 
 
 def __convertToJSON(jsonData):
 
-    if isinstance(jsonData, MathObject):
-        return jsonData.jsonEncode()
-    elif type(jsonData) is list:
-        newList = []
-        for item in jsonData:
-            newList.append(__convertToJSON(item))
-        return newList
-    elif type(jsonData) is dict:
-        newDict = {}
+    dataType = type(jsonData)
+    encoder = _mathEncoders.get(dataType)
+    if encoder is not None:
+        return encoder(jsonData)
+
+    elif dataType is dict:
+        # Dictionaries and lists are only copied if they contain math objects.
+        items = []
+        changed = False
         for key, value in jsonData.iteritems():
-            newDict[key] = __convertToJSON(value)
-        return newDict
+            newValue = __convertToJSON(value)
+            if newValue is not value:
+                changed = True
+            items.append((key, newValue))
+
+        if changed:
+            # Insert the keys one at a time, as dict() would copy the table
+            # layout and change the key order of the saved files.
+            newDict = {}
+            for key, value in items:
+                newDict[key] = value
+
+            return newDict
+
+    elif dataType is list:
+        newList = None
+        for i, item in enumerate(jsonData):
+            newItem = __convertToJSON(item)
+            if newItem is not item:
+                if newList is None:
+                    newList = list(jsonData)
+                newList[i] = newItem
+
+        if newList is not None:
+            return newList
+
+    elif isinstance(jsonData, MathObject):
+        return jsonData.jsonEncode()
+
     return jsonData
 
 
 def prepareToSave(jsonData):
     """Prepares the json data for serialization.
 
+    Dictionaries and lists that don't contain math objects are not copied, so
+    the result can share them with the input data.
+
     Arguments:
     jsonData -- dict, the JSON data to be prepared.
 
@@ -13,6 +13,7 @@ from kraken.core.objects.object_3d import Object3D
 from kraken.core.objects.attributes.attribute import Attribute
 from kraken.core.objects.constraints.pose_constraint import PoseConstraint
 from kraken.plugins.maya_plugin.utils import *
+from kraken.plugins.maya_plugin.command_buffer import CommandBuffer
 
 import FabricEngine.Core as core
 
@@ -23,6 +24,21 @@ class Builder(Builder):
     def __init__(self):
         super(Builder, self).__init__()
 
+        # Attribute edits and connections are recorded and executed in one go
+        # instead of one DCC call per object.
+        self._commandBuffer = CommandBuffer()
+
+
+    def getCommandBuffer(self):
+        """Returns the buffer the deferred DCC commands are recorded in.
+
+        Return:
+        CommandBuffer, the builder's command buffer.
+
+        """
+
+        return self._commandBuffer
+
 
     # ========================
     # Object3D Build Methods
@@ -47,8 +63,6 @@ class Builder(Builder):
 
         self._registerSceneItemPair(kSceneItem, dccSceneItem)
 
-        pm.refresh()
-
         return dccSceneItem
 
 
@@ -72,8 +86,6 @@ class Builder(Builder):
 
         self._registerSceneItemPair(kSceneItem, dccSceneItem)
 
-        pm.refresh()
-
         return dccSceneItem
 
 
@@ -97,8 +109,6 @@ class Builder(Builder):
 
         self._registerSceneItemPair(kSceneItem, dccSceneItem)
 
-        pm.refresh()
-
         return dccSceneItem
 
 
@@ -122,8 +132,6 @@ class Builder(Builder):
 
         self._registerSceneItemPair(kSceneItem, dccSceneItem)
 
-        pm.refresh()
-
         return dccSceneItem
 
 
@@ -147,8 +155,6 @@ class Builder(Builder):
 
         self._registerSceneItemPair(kSceneItem, dccSceneItem)
 
-        pm.refresh()
-
         return dccSceneItem
 
 
@@ -172,8 +178,6 @@ class Builder(Builder):
 
         self._registerSceneItemPair(kSceneItem, dccSceneItem)
 
-        pm.refresh()
-
         return dccSceneItem
 
 
@@ -223,8 +227,6 @@ class Builder(Builder):
 
         self._registerSceneItemPair(kSceneItem, dccSceneItem)
 
-        pm.refresh()
-
         return dccSceneItem
 
 
@@ -274,8 +276,6 @@ class Builder(Builder):
 
         self._registerSceneItemPair(kSceneItem, dccSceneItem)
 
-        pm.refresh()
-
         return dccSceneItem
 
 
@@ -414,7 +414,7 @@ class Builder(Builder):
         groupName = kAttributeGroup.getName()
         parentDCCSceneItem.addAttr(groupName, niceName=groupName, attributeType="enum", enumName="-----", keyable=True)
         dccSceneItem = parentDCCSceneItem.attr(groupName)
-        pm.setAttr(parentDCCSceneItem + "." + groupName, lock=True)
+        self._commandBuffer.append('setAttr', _getDCCPath(dccSceneItem), lock=True)
 
         self._registerSceneItemPair(kAttributeGroup, dccSceneItem)
 
@@ -456,7 +456,7 @@ class Builder(Builder):
             driver = self.getDCCSceneItem(kAttribute.getConnection())
             driven = self.getDCCSceneItem(kAttribute)
 
-            pm.connectAttr(driver, driven, force=True)
+            self._commandBuffer.append('connectAttr', _getDCCPath(driver), _getDCCPath(driven), force=True)
 
         return True
 
@@ -568,7 +568,7 @@ class Builder(Builder):
         connectionTargetDCCSceneItem = self.getDCCSceneItem(connectionTarget)
         targetDCCSceneItem = self.getDCCSceneItem(inputTarget)
 
-        pm.connectAttr(connectionTargetDCCSceneItem, targetDCCSceneItem, force=True)
+        self._commandBuffer.append('connectAttr', _getDCCPath(connectionTargetDCCSceneItem), _getDCCPath(targetDCCSceneItem), force=True)
 
         return True
 
@@ -695,9 +695,10 @@ class Builder(Builder):
                         connectOutput(str(spliceNode.attr(arg.name)), connectionTargets['opObject'], connectionTargets['dccSceneItem'])
 
             # Generate the operator source code.
-            opSourceCode = kOperator.generateSourceCode(arraySizes=arraySizes)
+            # Operators of the same shape share the stub name and source code.
+            opName, opSourceCode = self.getKLOperatorSourceCode(kOperator, arraySizes=arraySizes)
 
-            cmds.fabricSplice('addKLOperator', spliceNode, '{"opName": "' + kOperator.getName() + '"}', opSourceCode)
+            cmds.fabricSplice('addKLOperator', spliceNode, '{"opName": "' + opName + '"}', opSourceCode)
 
         finally:
             pass
@@ -721,37 +722,21 @@ class Builder(Builder):
 
         dccSceneItem = self.getDCCSceneItem(kSceneItem)
 
-        # Lock Rotation
-        if kSceneItem.testFlag("lockXRotation") is True:
-            pm.setAttr(dccSceneItem.longName() + "." + 'rx', lock=True, keyable=False, channelBox=False)
-
-        if kSceneItem.testFlag("lockYRotation") is True:
-            pm.setAttr(dccSceneItem.longName() + "." + 'ry', lock=True, keyable=False, channelBox=False)
-
-        if kSceneItem.testFlag("lockZRotation") is True:
-            pm.setAttr(dccSceneItem.longName() + "." + 'rz', lock=True, keyable=False, channelBox=False)
-
-
-        # Lock Scale
-        if kSceneItem.testFlag("lockXScale") is True:
-            pm.setAttr(dccSceneItem.longName() + "." + 'sx', lock=True, keyable=False, channelBox=False)
-
-        if kSceneItem.testFlag("lockYScale") is True:
-            pm.setAttr(dccSceneItem.longName() + "." + 'sy', lock=True, keyable=False, channelBox=False)
-
-        if kSceneItem.testFlag("lockZScale") is True:
-            pm.setAttr(dccSceneItem.longName() + "." + 'sz', lock=True, keyable=False, channelBox=False)
-
-
-        # Lock Translation
-        if kSceneItem.testFlag("lockXTranslation") is True:
-            pm.setAttr(dccSceneItem.longName() + "." + 'tx', lock=True, keyable=False, channelBox=False)
-
-        if kSceneItem.testFlag("lockYTranslation") is True:
-            pm.setAttr(dccSceneItem.longName() + "." + 'ty', lock=True, keyable=False, channelBox=False)
-
-        if kSceneItem.testFlag("lockZTranslation") is True:
-            pm.setAttr(dccSceneItem.longName() + "." + 'tz', lock=True, keyable=False, channelBox=False)
+        lockFlags = [
+            ("lockXRotation", 'rx'),
+            ("lockYRotation", 'ry'),
+            ("lockZRotation", 'rz'),
+            ("lockXScale", 'sx'),
+            ("lockYScale", 'sy'),
+            ("lockZScale", 'sz'),
+            ("lockXTranslation", 'tx'),
+            ("lockYTranslation", 'ty'),
+            ("lockZTranslation", 'tz')
+        ]
+
+        lockedParams = [param for flag, param in lockFlags if kSceneItem.testFlag(flag) is True]
+        if len(lockedParams) > 0:
+            self._commandBuffer.lockAttributes(dccSceneItem.longName(), lockedParams)
 
         return True
 
@@ -777,7 +762,7 @@ class Builder(Builder):
             # Get shape node, if it exists, hide it.
             shape = dccSceneItem.getShape()
             if shape is not None:
-                shape.visibility.set(False)
+                self._commandBuffer.append('setAttr', _getDCCPath(shape.visibility), False)
 
         return True
 
@@ -801,8 +786,8 @@ class Builder(Builder):
         buildColor = self.getBuildColor(kSceneItem)
 
         if buildColor is not None:
-            dccSceneItem.overrideEnabled.set(True)
-            dccSceneItem.overrideColor.set(colors[buildColor][0])
+            self._commandBuffer.append('setAttr', _getDCCPath(dccSceneItem.overrideEnabled), True)
+            self._commandBuffer.append('setAttr', _getDCCPath(dccSceneItem.overrideColor), colors[buildColor][0])
 
         return True
 
@@ -849,15 +834,92 @@ class Builder(Builder):
 
         """
 
+        self._commandBuffer.clear()
+
+        return True
+
+
+    def _buildObjects(self, buildPlan):
+        """Builds the objects of the build plan and executes the attribute
+        edits recorded while building them.
+
+        The parameters are locked before the operators and constraints are
+        built, as they were when the edits were executed immediately.
+
+        Arguments:
+        buildPlan -- BuildPlan, plan with the objects to build.
+
+        Return:
+        True if successful.
+
+        """
+
+        super(Builder, self)._buildObjects(buildPlan)
+
+        self._commandBuffer.flush()
+
+        return True
+
+
+    def _buildInputConnections(self, buildPlan):
+        """Builds the connections of the component inputs and executes the
+        recorded attribute and input connections.
+
+        The connections are made before the operators and constraints are
+        built, so constraint offsets are computed from the connected pose.
+
+        Arguments:
+        buildPlan -- BuildPlan, plan with the connections to build.
+
+        Return:
+        True if successful.
+
+        """
+
+        super(Builder, self)._buildInputConnections(buildPlan)
+
+        self._commandBuffer.flush()
+
         return True
 
 
     def _postBuild(self):
         """Post-Build commands.
 
+        Executes the remaining recorded commands and refreshes the viewport
+        once.
+
         Return:
         True if successful.
 
         """
 
+        self._commandBuffer.flush()
+
+        pm.refresh()
+
         return True
+
+
+def _getDCCPath(dccSceneItem):
+    """Returns the unique path of a Maya node or attribute.
+
+    Recorded commands are executed after more nodes have been created, so the
+    nodes are referenced by their full DAG path as short names can become
+    ambiguous.
+
+    Arguments:
+    dccSceneItem -- Object, PyMEL node or attribute.
+
+    Return:
+    String, full path of the node or attribute.
+
+    """
+
+    if isinstance(dccSceneItem, pm.Attribute):
+        return dccSceneItem.name(fullDagPath=True)
+
+    elif isinstance(dccSceneItem, pm.nt.DagNode):
+        return dccSceneItem.longName()
+
+    return str(dccSceneItem)
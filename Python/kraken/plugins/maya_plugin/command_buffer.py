@@ -0,0 +1,273 @@
+"""Kraken Maya - Maya Command Buffer module.
+
+Classes:
+CommandBuffer -- Records DCC commands and executes them in one go.
+CommandRecorder -- Stand-in for maya.cmds that records the commands it is sent.
+
+"""
+
+
+class CommandBuffer(object):
+    """Records Maya commands so they can be executed together.
+
+    Commands are recorded as a command name, positional arguments and keyword
+    arguments. In Maya, flushing the buffer applies the recorded connectAttr
+    and setAttr commands through a single MDGModifier, the lock, keyable and
+    channel box states of the plugs are set once the modifier is done. Other
+    commands are executed through maya.cmds in the order they were recorded.
+
+    When another command module is supplied, e.g. a CommandRecorder for
+    running without Maya, the commands are sent to it one by one in the order
+    they were recorded.
+
+    """
+
+    def __init__(self, commands=None):
+        super(CommandBuffer, self).__init__()
+
+        self._commands = commands
+        self._queue = []
+
+
+    def getCommands(self):
+        """Returns the module the commands are executed through.
+
+        Return:
+        Module or object that provides the commands, maya.cmds by default.
+
+        """
+
+        if self._commands is None:
+            from maya import cmds
+            return cmds
+
+        return self._commands
+
+
+    def setCommands(self, commands):
+        """Sets the module the commands are executed through.
+
+        Arguments:
+        commands -- Object, module or object that provides the commands.
+
+        Return:
+        True if successful.
+
+        """
+
+        self._commands = commands
+
+        return True
+
+
+    def getNumCommands(self):
+        """Returns the number of commands waiting to be executed.
+
+        Return:
+        Integer, number of recorded commands.
+
+        """
+
+        return len(self._queue)
+
+
+    def getQueue(self):
+        """Returns the recorded commands.
+
+        Return:
+        List, (command, args, kwargs) tuples in the order they were recorded.
+
+        """
+
+        return list(self._queue)
+
+
+    def append(self, command, *args, **kwargs):
+        """Records a command.
+
+        Arguments:
+        command -- String, name of the command to execute.
+        args -- Positional arguments of the command.
+        kwargs -- Keyword arguments of the command.
+
+        Return:
+        True if successful.
+
+        """
+
+        self._queue.append((command, args, kwargs))
+
+        return True
+
+
+    def lockAttributes(self, nodeName, attributeNames):
+        """Records the commands locking and hiding the attributes of a node.
+
+        Arguments:
+        nodeName -- String, name of the node.
+        attributeNames -- List, names of the attributes to lock.
+
+        Return:
+        True if successful.
+
+        """
+
+        for attributeName in attributeNames:
+            self._queue.append(('setAttr', (nodeName + "." + attributeName, ),
+                                {'lock': True, 'keyable': False, 'channelBox': False}))
+
+        return True
+
+
+    def clear(self):
+        """Discards the recorded commands.
+
+        Return:
+        True if successful.
+
+        """
+
+        self._queue = []
+
+        return True
+
+
+    def flush(self):
+        """Executes the recorded commands and clears the buffer.
+
+        Return:
+        Integer, number of commands executed.
+
+        """
+
+        if len(self._queue) == 0:
+            return 0
+
+        queue = self._queue
+        self._queue = []
+
+        if self._commands is None:
+            self._applyCommands(queue)
+        else:
+            for command, args, kwargs in queue:
+                getattr(self._commands, command)(*args, **kwargs)
+
+        return len(queue)
+
+
+    def _applyCommands(self, queue):
+        """Applies the recorded commands in Maya.
+
+        Connections and attribute values are applied with one MDGModifier.
+        Commands the modifier can't apply are executed through maya.cmds after
+        the modifier has applied the commands recorded before them.
+
+        Arguments:
+        queue -- List, (command, args, kwargs) tuples to apply.
+
+        Return:
+        True if successful.
+
+        """
+
+        from maya import OpenMaya as om
+
+        commands = self.getCommands()
+        modifier = om.MDGModifier()
+        plugStates = []
+
+        for command, args, kwargs in queue:
+            if command == 'connectAttr' and len(args) == 2 and set(kwargs.keys()) <= set(['force']):
+                srcPlug = _getPlug(args[0])
+                dstPlug = _getPlug(args[1])
+
+                if kwargs.get('force', False) is True:
+                    sources = om.MPlugArray()
+                    dstPlug.connectedTo(sources, True, False)
+                    for i in xrange(sources.length()):
+                        modifier.disconnect(sources[i], dstPlug)
+
+                modifier.connect(srcPlug, dstPlug)
+
+            elif command == 'setAttr' and len(args) in (1, 2) and set(kwargs.keys()) <= set(['lock', 'keyable', 'channelBox']) \
+                    and (len(args) == 1 or type(args[1]) in (bool, int, long, float)):
+                plug = _getPlug(args[0])
+
+                if len(args) == 2:
+                    if type(args[1]) is bool:
+                        modifier.newPlugValueBool(plug, args[1])
+                    elif type(args[1]) in (int, long):
+                        modifier.newPlugValueInt(plug, args[1])
+                    else:
+                        modifier.newPlugValueDouble(plug, args[1])
+
+                if len(kwargs) > 0:
+                    plugStates.append((plug, kwargs))
+
+            else:
+                modifier.doIt()
+                modifier = om.MDGModifier()
+
+                getattr(commands, command)(*args, **kwargs)
+
+        modifier.doIt()
+
+        # Locking is done last so the plugs can still be connected and set.
+        for plug, states in plugStates:
+            if 'keyable' in states:
+                plug.setKeyable(states['keyable'])
+
+            if 'channelBox' in states:
+                plug.setChannelBox(states['channelBox'])
+
+            if 'lock' in states:
+                plug.setLocked(states['lock'])
+
+        return True
+
+
+def _getPlug(name):
+    """Returns the plug of an attribute.
+
+    Arguments:
+    name -- String, full path of the attribute.
+
+    Return:
+    MPlug, the plug of the attribute.
+
+    """
+
+    from maya import OpenMaya as om
+
+    selectionList = om.MSelectionList()
+    selectionList.add(name)
+
+    plug = om.MPlug()
+    selectionList.getPlug(0, plug)
+
+    return plug
+
+
+class CommandRecorder(object):
+    """Stand-in for maya.cmds that records the commands it is sent.
+
+    Any attribute of the recorder is a callable that stores the command name
+    and arguments in the calls list. Used to test command buffers without
+    Maya.
+
+    """
+
+    def __init__(self):
+        super(CommandRecorder, self).__init__()
+
+        self.calls = []
+
+
+    def __getattr__(self, name):
+        if name.startswith('__'):
+            raise AttributeError(name)
+
+        def record(*args, **kwargs):
+            self.calls.append((name, args, kwargs))
+
+        return record
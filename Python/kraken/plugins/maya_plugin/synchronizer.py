@@ -1,3 +1,5 @@
+from maya import OpenMaya as om
+
 from kraken.core.maths import Xfo, Vec3, Quat
 
 from kraken.core.synchronizer import Synchronizer
@@ -12,6 +14,8 @@ class Synchronizer(Synchronizer):
     def __init__(self):
         super(Synchronizer, self).__init__()
 
+        self._callbackIds = []
+
 
     # ============
     # DCC Methods
@@ -62,6 +66,156 @@ class Synchronizer(Synchronizer):
         return foundItem
 
 
+    def isDCCItemValid(self, dccItem):
+        """Checks that the DCC item still exists.
+
+        PyNodes and PyNode attributes hold an MObjectHandle to the node, so this
+        doesn't look the item up by name.
+
+        Arguments:
+        dccItem -- Object, PyNode or Attribute to check.
+
+        Return:
+        True if the DCC item still exists.
+
+        """
+
+        return dccItem.exists()
+
+
+    def startChangeTracking(self):
+        """Registers attribute changed callbacks on the DCC nodes of the mapped
+        items. The items are marked dirty whenever an attribute of their node,
+        or of one of its shapes, changes.
+
+        Return:
+        True if change notifications are tracked.
+
+        """
+
+        self.stopChangeTracking()
+
+        nodeItems = {}
+        for kObject, mapEntry in self.getHierarchyMap().iteritems():
+            dccItem = mapEntry['dccItem']
+            if dccItem is None:
+                continue
+
+            if isinstance(dccItem, pm.Attribute):
+                dccNode = dccItem.node()
+            else:
+                dccNode = dccItem
+
+            nodeItems.setdefault(dccNode, []).append(kObject)
+
+        def attributeChanged(msg, plug, otherPlug, kObjects):
+            for kObject in kObjects:
+                self.markDirty(kObject)
+
+        for dccNode, kObjects in nodeItems.iteritems():
+            nodes = [dccNode]
+            if isinstance(dccNode, pm.nodetypes.Transform):
+                nodes.extend(dccNode.getShapes())
+
+            for node in nodes:
+                callbackId = om.MNodeMessage.addAttributeChangedCallback(node.__apimobject__(), attributeChanged, kObjects)
+                self._callbackIds.append(callbackId)
+
+        self._trackingChanges = True
+
+        return True
+
+
+    def stopChangeTracking(self):
+        """Removes the callbacks registered by startChangeTracking.
+
+        Return:
+        True if successful.
+
+        """
+
+        for callbackId in self._callbackIds:
+            om.MMessage.removeCallback(callbackId)
+
+        self._callbackIds = []
+
+        return super(Synchronizer, self).stopChangeTracking()
+
+
+    def readXfos(self, kObjects):
+        """Reads the local transforms of the DCC nodes of the objects.
+
+        The transforms are read through the API from the nodes' dag paths
+        instead of querying each node through PyMEL. The same MFnTransform
+        queries as syncXfo are used, in transform space, so joint orients are
+        handled the same way.
+
+        Arguments:
+        kObjects -- List, objects to read the transforms for.
+
+        Return:
+        List, flat list of floats, 10 per object.
+
+        """
+
+        hrcMap = self.getHierarchyMap()
+
+        scaleUtil = om.MScriptUtil()
+        scaleUtil.createFromList([0.0, 0.0, 0.0], 3)
+        scalePtr = scaleUtil.asDoublePtr()
+
+        values = []
+        for kObject in kObjects:
+            dagPath = hrcMap[kObject]['dccItem'].__apimdagpath__()
+            transform = om.MFnTransform(dagPath)
+
+            pos = transform.getTranslation(om.MSpace.kTransform)
+            quat = om.MQuaternion()
+            transform.getRotation(quat, om.MSpace.kTransform)
+            transform.getScale(scalePtr)
+
+            values.extend((pos.x, pos.y, pos.z,
+                           quat.x, quat.y, quat.z, quat.w,
+                           om.MScriptUtil.getDoubleArrayItem(scalePtr, 0),
+                           om.MScriptUtil.getDoubleArrayItem(scalePtr, 1),
+                           om.MScriptUtil.getDoubleArrayItem(scalePtr, 2)))
+
+        return values
+
+
+    def readAttributeValues(self, kObjects):
+        """Reads the values of the DCC attributes of the attributes through
+        their plugs.
+
+        Arguments:
+        kObjects -- List, attributes to read the values for.
+
+        Return:
+        List, one value per attribute.
+
+        """
+
+        hrcMap = self.getHierarchyMap()
+
+        values = []
+        for kObject in kObjects:
+            dccItem = hrcMap[kObject]['dccItem']
+            plug = dccItem.__apimplug__()
+
+            if kObject.isTypeOf('BoolAttribute'):
+                values.append(plug.asBool())
+            elif kObject.isTypeOf('IntegerAttribute'):
+                values.append(plug.asInt())
+            elif kObject.isTypeOf('ScalarAttribute'):
+                values.append(plug.asDouble())
+            elif kObject.isTypeOf('StringAttribute'):
+                values.append(plug.asString())
+            else:
+                values.append(dccItem.get())
+
+        return values
+
+
     def syncXfo(self, kObject):
         """Syncs the xfo from the DCC object to the Kraken object.
 
@@ -75,11 +229,11 @@ class Synchronizer(Synchronizer):
 
         hrcMap = self.getHierarchyMap()
 
-        if kObject not in hrcMap.keys():
+        if kObject not in hrcMap:
             print "Warning! 3D Object '" + kObject.getName() + "' was not found in the mapping!"
             return False
 
-        dccItem = hrcMap[kObject]['dccItem']
+        dccItem = self.getMappedDCCItem(kObject)
 
         if dccItem is None:
             print "Warning Syncing. No DCC Item for :" + kObject.getPath()
@@ -113,11 +267,11 @@ class Synchronizer(Synchronizer):
 
         hrcMap = self.getHierarchyMap()
 
-        if kObject not in hrcMap.keys():
+        if kObject not in hrcMap:
             print "Warning! Attribute '" + kObject.getName() + "' was not found in the mapping!"
             return False
 
-        dccItem = hrcMap[kObject]['dccItem']
+        dccItem = self.getMappedDCCItem(kObject)
 
         if dccItem is None:
             print "Warning Syncing. No DCC Item for :" + kObject.getPath()
@@ -141,11 +295,11 @@ class Synchronizer(Synchronizer):
 
         hrcMap = self.getHierarchyMap()
 
-        if kObject not in hrcMap.keys():
+        if kObject not in hrcMap:
             print "Warning! 3D Object '" + kObject.getName() + "' was not found in the mapping!"
             return False
 
-        dccItem = hrcMap[kObject]['dccItem']
+        dccItem = self.getMappedDCCItem(kObject)
 
         if dccItem is None:
             print "Warning Syncing. No DCC Item for :" + kObject.getPath()
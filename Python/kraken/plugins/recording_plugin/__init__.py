@@ -0,0 +1,10 @@
+"""Kraken Recording Plug-in.
+
+Builds rigs in memory without a DCC. The recording builder is never picked by
+plugins.getBuilder() and has to be created explicitly.
+
+"""
+
+
+def dccTest():
+    return False
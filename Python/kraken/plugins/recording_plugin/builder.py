@@ -0,0 +1,882 @@
+"""Kraken Recording - Recording Builder module.
+
+Classes:
+RecordingNode -- In memory stand-in for a DCC node.
+RecordingAttribute -- In memory stand-in for a DCC attribute.
+Builder -- Builder that records the build in memory.
+
+"""
+
+import json
+from collections import OrderedDict
+
+from kraken.core.builder import Builder
+
+
+class RecordingNode(object):
+    """In memory stand-in for a DCC node."""
+
+    def __init__(self, name, nodeType, parent=None):
+        super(RecordingNode, self).__init__()
+
+        self.name = name
+        self.nodeType = nodeType
+        self.parent = parent
+        self.children = []
+        self.attributes = OrderedDict()
+        self.data = OrderedDict()
+
+        if parent is not None:
+            parent.children.append(self)
+
+
+    def __str__(self):
+        return self.getPath()
+
+
+    def getPath(self):
+        """Returns the full path of the node.
+
+        Return:
+        String, path of the node.
+
+        """
+
+        if self.parent is not None:
+            return self.parent.getPath() + '|' + self.name
+
+        return '|' + self.name
+
+
+    def jsonEncode(self):
+        """Returns the node as data that can be written to json.
+
+        Return:
+        OrderedDict, the node's data.
+
+        """
+
+        data = OrderedDict()
+        data['path'] = self.getPath()
+        data['type'] = self.nodeType
+        data.update(self.data)
+
+        if len(self.attributes) > 0:
+            data['attributes'] = [x.jsonEncode() for x in self.attributes.values()]
+
+        return data
+
+
+class RecordingAttribute(object):
+    """In memory stand-in for a DCC attribute."""
+
+    def __init__(self, node, name, attributeType, value=None):
+        super(RecordingAttribute, self).__init__()
+
+        self.node = node
+        self.name = name
+        self.attributeType = attributeType
+        self.value = value
+        self.data = OrderedDict()
+        self.connection = None
+
+        node.attributes[name] = self
+
+
+    def __str__(self):
+        return self.getPath()
+
+
+    def getPath(self):
+        """Returns the full path of the attribute.
+
+        Return:
+        String, path of the attribute.
+
+        """
+
+        return self.node.getPath() + '.' + self.name
+
+
+    def jsonEncode(self):
+        """Returns the attribute as data that can be written to json.
+
+        Return:
+        OrderedDict, the attribute's data.
+
+        """
+
+        data = OrderedDict()
+        data['name'] = self.name
+        data['type'] = self.attributeType
+        data['value'] = self.value
+        data.update(self.data)
+
+        if self.connection is not None:
+            data['connection'] = self.connection.getPath()
+
+        return data
+
+
+class Builder(Builder):
+    """Builder object that builds Kraken objects in to in memory stand-in
+    nodes and records each operation.
+
+    The result can be dumped to json to time and compare builds without a DCC.
+
+    """
+
+    def __init__(self):
+        super(Builder, self).__init__()
+
+        self._nodes = []
+        self._operations = []
+
+
+    # ====================
+    # Recording Methods
+    # ====================
+    def getNodes(self):
+        """Returns the nodes created by the builder.
+
+        Return:
+        List, RecordingNode objects in creation order.
+
+        """
+
+        return self._nodes
+
+
+    def getOperations(self):
+        """Returns the recorded operations.
+
+        Return:
+        List, one OrderedDict per operation in the order they were executed.
+
+        """
+
+        return self._operations
+
+
+    def clearRecording(self):
+        """Clears the recorded nodes and operations.
+
+        Return:
+        True if successful.
+
+        """
+
+        self._nodes = []
+        self._operations = []
+        self.clearBuildElements()
+
+        return True
+
+
+    def _record(self, operation, **kwargs):
+        """Records an operation.
+
+        Arguments:
+        operation -- String, name of the operation.
+        kwargs -- Values describing the operation, sorted by name.
+
+        Return:
+        True if successful.
+
+        """
+
+        data = OrderedDict()
+        data['op'] = operation
+        for key in sorted(kwargs.keys()):
+            data[key] = kwargs[key]
+
+        self._operations.append(data)
+
+        return True
+
+
+    def _createNode(self, kSceneItem, buildName, nodeType):
+        """Creates, records and registers a node for the kSceneItem.
+
+        Arguments:
+        kSceneItem -- Object, kSceneItem that the node represents.
+        buildName -- String, The name to use on the node.
+        nodeType -- String, type of the node.
+
+        Return:
+        RecordingNode, the created node.
+
+        """
+
+        parentNode = None
+        if kSceneItem.getParent() is not None:
+            parentNode = self.getDCCSceneItem(kSceneItem.getParent())
+
+        node = RecordingNode(buildName, nodeType, parent=parentNode)
+        self._nodes.append(node)
+
+        self._record('createNode', type=nodeType, path=node.getPath())
+        self._registerSceneItemPair(kSceneItem, node)
+
+        return node
+
+
+    def _createAttribute(self, kAttribute, attributeType):
+        """Creates, records and registers an attribute for the kAttribute.
+
+        Arguments:
+        kAttribute -- Object, kAttribute that the attribute represents.
+        attributeType -- String, type of the attribute.
+
+        Return:
+        RecordingAttribute, the created attribute.
+
+        """
+
+        parentNode = self.getDCCSceneItem(kAttribute.getParent().getParent())
+        attribute = RecordingAttribute(parentNode, kAttribute.getName(), attributeType, kAttribute.getValue())
+        attribute.data['lock'] = kAttribute.getLock()
+
+        self._record('addAttr', type=attributeType, path=attribute.getPath(), value=attribute.value)
+        self._registerSceneItemPair(kAttribute, attribute)
+
+        return attribute
+
+
+    def _createConstraint(self, kConstraint, nodeType):
+        """Creates, records and registers a constraint node.
+
+        Arguments:
+        kConstraint -- Object, kraken constraint object to build.
+        nodeType -- String, type of the constraint node.
+
+        Return:
+        RecordingNode, the created constraint node.
+
+        """
+
+        constraineeNode = self.getDCCSceneItem(kConstraint.getConstrainee())
+        constrainerNodes = [self.getDCCSceneItem(x) for x in kConstraint.getConstrainers()]
+
+        node = RecordingNode(kConstraint.getName() + "_" + nodeType, nodeType, parent=constraineeNode)
+        node.data['constrainers'] = [x.getPath() for x in constrainerNodes]
+        node.data['maintainOffset'] = kConstraint.getMaintainOffset()
+        self._nodes.append(node)
+
+        self._record('constrain', type=nodeType, path=node.getPath(),
+                     constrainers=node.data['constrainers'],
+                     maintainOffset=node.data['maintainOffset'])
+
+        self._registerSceneItemPair(kConstraint, node)
+
+        return node
+
+
+    def _connect(self, source, target):
+        """Connects two recorded attributes.
+
+        Arguments:
+        source -- RecordingAttribute, the driving attribute.
+        target -- RecordingAttribute, the driven attribute.
+
+        Return:
+        True if successful.
+
+        """
+
+        target.connection = source
+        self._record('connectAttr', source=source.getPath(), target=target.getPath())
+
+        return True
+
+
+    def jsonEncode(self):
+        """Returns the recorded nodes and operations as data that can be
+        written to json.
+
+        Return:
+        OrderedDict, the recording.
+
+        """
+
+        data = OrderedDict()
+        data['nodes'] = [x.jsonEncode() for x in self._nodes]
+        data['operations'] = self._operations
+
+        return data
+
+
+    def dumpJSON(self, filePath=None):
+        """Dumps the recording to json.
+
+        Arguments:
+        filePath -- String, path of the file to write, if None the json is only
+                    returned.
+
+        Return:
+        String, the json.
+
+        """
+
+        jsonData = json.dumps(self.jsonEncode(), indent=2)
+
+        if filePath is not None:
+            with open(filePath, 'w') as f:
+                f.write(jsonData)
+
+        return jsonData
+
+
+    # ========================
+    # Object3D Build Methods
+    # ========================
+    def buildContainer(self, kSceneItem, buildName):
+        """Builds a container / namespace object.
+
+        Arguments:
+        kSceneItem -- Object, kSceneItem that represents a container to be built.
+        buildName -- String, The name to use on the built object.
+
+        Return:
+        Node that is created.
+
+        """
+
+        return self._createNode(kSceneItem, buildName, 'container')
+
+
+    def buildLayer(self, kSceneItem, buildName):
+        """Builds a layer object.
+
+        Arguments:
+        kSceneItem -- Object, kSceneItem that represents a layer to be built.
+        buildName -- String, The name to use on the built object.
+
+        Return:
+        Node that is created.
+
+        """
+
+        return self._createNode(kSceneItem, buildName, 'layer')
+
+
+    def buildHierarchyGroup(self, kSceneItem, buildName):
+        """Builds a hierarchy group object.
+
+        Arguments:
+        kSceneItem -- Object, kSceneItem that represents a group to be built.
+        buildName -- String, The name to use on the built object.
+
+        Return:
+        Node that is created.
+
+        """
+
+        return self._createNode(kSceneItem, buildName, 'hierarchyGroup')
+
+
+    def buildGroup(self, kSceneItem, buildName):
+        """Builds a group object.
+
+        Arguments:
+        kSceneItem -- Object, kSceneItem that represents a group to be built.
+        buildName -- String, The name to use on the built object.
+
+        Return:
+        Node that is created.
+
+        """
+
+        return self._createNode(kSceneItem, buildName, 'group')
+
+
+    def buildJoint(self, kSceneItem, buildName):
+        """Builds a joint object.
+
+        Arguments:
+        kSceneItem -- Object, kSceneItem that represents a joint to be built.
+        buildName -- String, The name to use on the built object.
+
+        Return:
+        Node that is created.
+
+        """
+
+        return self._createNode(kSceneItem, buildName, 'joint')
+
+
+    def buildLocator(self, kSceneItem, buildName):
+        """Builds a locator / null object.
+
+        Arguments:
+        kSceneItem -- Object, locator / null object to be built.
+        buildName -- String, The name to use on the built object.
+
+        Return:
+        Node that is created.
+
+        """
+
+        return self._createNode(kSceneItem, buildName, 'locator')
+
+
+    def buildCurve(self, kSceneItem, buildName):
+        """Builds a Curve object.
+
+        Arguments:
+        kSceneItem -- Object, kSceneItem that represents a curve to be built.
+        buildName -- String, The name to use on the built object.
+
+        Return:
+        Node that is created.
+
+        """
+
+        node = self._createNode(kSceneItem, buildName, 'curve')
+        node.data['subCurves'] = [len(x['points']) for x in kSceneItem.getCurveData()]
+
+        return node
+
+
+    def buildControl(self, kSceneItem, buildName):
+        """Builds a Control object.
+
+        Arguments:
+        kSceneItem -- Object, kSceneItem that represents a control to be built.
+        buildName -- String, The name to use on the built object.
+
+        Return:
+        Node that is created.
+
+        """
+
+        node = self._createNode(kSceneItem, buildName, 'control')
+        node.data['subCurves'] = [len(x['points']) for x in kSceneItem.getCurveData()]
+
+        return node
+
+
+    # ========================
+    # Attribute Build Methods
+    # ========================
+    def buildBoolAttribute(self, kAttribute):
+        """Builds a Bool attribute.
+
+        Arguments:
+        kAttribute -- Object, kAttribute that represents a boolean attribute to be built.
+
+        Return:
+        True if successful.
+
+        """
+
+        self._createAttribute(kAttribute, 'bool')
+
+        return True
+
+
+    def buildScalarAttribute(self, kAttribute):
+        """Builds a Float attribute.
+
+        Arguments:
+        kAttribute -- Object, kAttribute that represents a float attribute to be built.
+
+        Return:
+        True if successful.
+
+        """
+
+        attribute = self._createAttribute(kAttribute, 'float')
+        attribute.data['min'] = kAttribute.getMin()
+        attribute.data['max'] = kAttribute.getMax()
+
+        return True
+
+
+    def buildIntegerAttribute(self, kAttribute):
+        """Builds a Integer attribute.
+
+        Arguments:
+        kAttribute -- Object, kAttribute that represents a integer attribute to be built.
+
+        Return:
+        True if successful.
+
+        """
+
+        attribute = self._createAttribute(kAttribute, 'integer')
+        attribute.data['min'] = kAttribute.getMin()
+        attribute.data['max'] = kAttribute.getMax()
+
+        return True
+
+
+    def buildStringAttribute(self, kAttribute):
+        """Builds a String attribute.
+
+        Arguments:
+        kAttribute -- Object, kAttribute that represents a string attribute to be built.
+
+        Return:
+        True if successful.
+
+        """
+
+        self._createAttribute(kAttribute, 'string')
+
+        return True
+
+
+    def buildAttributeGroup(self, kAttributeGroup):
+        """Builds attribute groups on the DCC object.
+
+        Arguments:
+        kAttributeGroup -- SceneItem, kraken object to build the attribute group on.
+
+        Return:
+        True if successful.
+
+        """
+
+        parentNode = self.getDCCSceneItem(kAttributeGroup.getParent())
+
+        attribute = RecordingAttribute(parentNode, kAttributeGroup.getName(), 'group')
+        self._record('addAttr', type='group', path=attribute.getPath(), value=None)
+        self._registerSceneItemPair(kAttributeGroup, attribute)
+
+        for i in xrange(kAttributeGroup.getNumAttributes()):
+            kAttribute = kAttributeGroup.getAttributeByIndex(i)
+
+            if kAttribute.isTypeOf("BoolAttribute"):
+                self.buildBoolAttribute(kAttribute)
+
+            elif kAttribute.isTypeOf("ScalarAttribute"):
+                self.buildScalarAttribute(kAttribute)
+
+            elif kAttribute.isTypeOf("IntegerAttribute"):
+                self.buildIntegerAttribute(kAttribute)
+
+            elif kAttribute.isTypeOf("StringAttribute"):
+                self.buildStringAttribute(kAttribute)
+
+            else:
+                raise NotImplementedError(kAttribute.getName() + ' has an unsupported type: ' + str(type(kAttribute)))
+
+        return True
+
+
+    def connectAttribute(self, kAttribute):
+        """Connects the driver attribute to this one.
+
+        Arguments:
+        kAttribute -- Object, attribute to connect.
+
+        Return:
+        True if successful.
+
+        """
+
+        if kAttribute.isConnected() is True:
+            driver = self.getDCCSceneItem(kAttribute.getConnection())
+            driven = self.getDCCSceneItem(kAttribute)
+
+            self._connect(driver, driven)
+
+        return True
+
+
+    # =========================
+    # Constraint Build Methods
+    # =========================
+    def buildOrientationConstraint(self, kConstraint):
+        """Builds an orientation constraint represented by the kConstraint.
+
+        Arguments:
+        kConstraint -- Object, kraken constraint object to build.
+
+        Return:
+        dccSceneItem that was created.
+
+        """
+
+        return self._createConstraint(kConstraint, 'orientationConstraint')
+
+
+    def buildPoseConstraint(self, kConstraint):
+        """Builds an pose constraint represented by the kConstraint.
+
+        Arguments:
+        kConstraint -- Object, kraken constraint object to build.
+
+        Return:
+        dccSceneItem that was created.
+
+        """
+
+        return self._createConstraint(kConstraint, 'poseConstraint')
+
+
+    def buildPositionConstraint(self, kConstraint):
+        """Builds an position constraint represented by the kConstraint.
+
+        Arguments:
+        kConstraint -- Object, kraken constraint object to build.
+
+        Return:
+        dccSceneItem that was created.
+
+        """
+
+        return self._createConstraint(kConstraint, 'positionConstraint')
+
+
+    def buildScaleConstraint(self, kConstraint):
+        """Builds an scale constraint represented by the kConstraint.
+
+        Arguments:
+        kConstraint -- Object, kraken constraint object to build.
+
+        Return:
+        dccSceneItem that was created.
+
+        """
+
+        return self._createConstraint(kConstraint, 'scaleConstraint')
+
+
+    # ========================
+    # Component Build Methods
+    # ========================
+    def buildAttributeConnection(self, connectionInput):
+        """Builds the connection between the attribute and the connection.
+
+        Arguments:
+        connectionInput -- Object, kraken connection to build.
+
+        Return:
+        True if successful.
+
+        """
+
+        if connectionInput.isConnected() is False:
+            return False
+
+        connection = connectionInput.getConnection()
+
+        if connection.getDataType().endswith('[]'):
+            connectionTarget = connection.getTarget()[connectionInput.getIndex()]
+        else:
+            connectionTarget = connection.getTarget()
+
+        source = self.getDCCSceneItem(connectionTarget)
+        target = self.getDCCSceneItem(connectionInput.getTarget())
+
+        self._connect(source, target)
+
+        return True
+
+
+    # =========================
+    # Operator Builder Methods
+    # =========================
+    def buildSpliceOperators(self, kOperator):
+        """Builds Splice Operators on the components.
+
+        Arguments:
+        kOperator -- Object, kraken operator that represents a Splice operator.
+
+        Return:
+        True if successful.
+
+        """
+
+        node = RecordingNode(kOperator.getName() + "_SpliceOp", 'spliceOperator')
+        node.data['solverTypeName'] = kOperator.getSolverTypeName()
+        node.data['extension'] = kOperator.getExtension()
+        node.data['ports'] = []
+        self._nodes.append(node)
+
+        self._record('createNode', type=node.nodeType, path=node.getPath())
+
+        arraySizes = {}
+        args = kOperator.getSolverArgs()
+        for i in xrange(len(args)):
+            arg = args[i]
+
+            connections = []
+            if arg.connectionType == 'in':
+                connectedObjects = kOperator.getInput(arg.name)
+            elif arg.connectionType in ['io', 'out']:
+                connectedObjects = kOperator.getOutput(arg.name)
+            else:
+                connectedObjects = None
+
+            if connectedObjects is not None:
+                if not isinstance(connectedObjects, list):
+                    connectedObjects = [connectedObjects]
+
+                for opObject in connectedObjects:
+                    dccSceneItem = self.getDCCSceneItem(opObject)
+                    if dccSceneItem is None:
+                        raise Exception("Operator '" + kOperator.getName() + "' of type '" + kOperator.getSolverTypeName() + "' arg '" + arg.name + "' dcc item not found for item:" + opObject.getPath())
+
+                    connections.append(dccSceneItem.getPath())
+
+            port = OrderedDict()
+            port['name'] = arg.name
+            port['dataType'] = arg.dataType
+            port['connectionType'] = arg.connectionType
+            port['connections'] = connections
+            node.data['ports'].append(port)
+
+            self._record('addPort', path=node.getPath(), name=arg.name,
+                         dataType=arg.dataType, connectionType=arg.connectionType,
+                         connections=connections)
+
+            if arg.dataType.endswith('[]') and arg.connectionType in ['io', 'out']:
+                arraySizes[arg.name] = len(connections)
+
+        opName = self.getKLOperatorSourceCode(kOperator, arraySizes=arraySizes)[0]
+        node.data['klOperator'] = opName
+
+        self._record('addKLOperator', path=node.getPath(), opName=opName)
+
+        self._registerSceneItemPair(kOperator, node)
+
+        return True
+
+
+    # ==================
+    # Parameter Methods
+    # ==================
+    def lockParameters(self, kSceneItem):
+        """Locks flagged SRT parameters.
+
+        Arguments:
+        kSceneItem -- Object, kraken object to lock the SRT parameters on.
+
+        Return:
+        True if successful.
+
+        """
+
+        lockFlags = [
+            ("lockXRotation", 'rx'),
+            ("lockYRotation", 'ry'),
+            ("lockZRotation", 'rz'),
+            ("lockXScale", 'sx'),
+            ("lockYScale", 'sy'),
+            ("lockZScale", 'sz'),
+            ("lockXTranslation", 'tx'),
+            ("lockYTranslation", 'ty'),
+            ("lockZTranslation", 'tz')
+        ]
+
+        lockedParams = [param for flag, param in lockFlags if kSceneItem.testFlag(flag) is True]
+        if len(lockedParams) > 0:
+            node = self.getDCCSceneItem(kSceneItem)
+            node.data['locked'] = lockedParams
+            self._record('lock', path=node.getPath(), params=lockedParams)
+
+        return True
+
+
+    # ===================
+    # Visibility Methods
+    # ===================
+    def setVisibility(self, kSceneItem):
+        """Sets the visibility of the object after its been created.
+
+        Arguments:
+        kSceneItem -- Object, the scene item to set the visibility on.
+
+        Return:
+        True if successful.
+
+        """
+
+        if kSceneItem.getShapeVisibility() is False:
+            node = self.getDCCSceneItem(kSceneItem)
+            node.data['shapeVisibility'] = False
+            self._record('hideShape', path=node.getPath())
+
+        return True
+
+
+    # ================
+    # Display Methods
+    # ================
+    def setObjectColor(self, kSceneItem):
+        """Sets the color on the dccSceneItem.
+
+        Arguments:
+        kSceneItem -- Object, kraken object to set the color on.
+
+        Return:
+        True if successful.
+
+        """
+
+        buildColor = self.getBuildColor(kSceneItem)
+
+        if buildColor is not None:
+            node = self.getDCCSceneItem(kSceneItem)
+            node.data['color'] = buildColor
+            self._record('setColor', path=node.getPath(), color=buildColor)
+
+        return True
+
+
+    # ==================
+    # Transform Methods
+    # ==================
+    def setTransform(self, kSceneItem):
+        """Records the transform of the object.
+
+        Arguments:
+        kSceneItem -- Object: object to set the transform on.
+
+        Return:
+        True if successful.
+
+        """
+
+        node = self.getDCCSceneItem(kSceneItem)
+
+        xfo = kSceneItem.xfo
+        tr = xfo.tr
+        ori = xfo.ori
+        sc = xfo.sc
+
+        node.data['xfo'] = OrderedDict([
+            ('tr', [tr.x, tr.y, tr.z]),
+            ('ori', [ori.v.x, ori.v.y, ori.v.z, ori.w]),
+            ('sc', [sc.x, sc.y, sc.z])
+        ])
+        node.data['rotationOrder'] = kSceneItem.ro.order
+
+        self._record('setTransform', path=node.getPath())
+
+        return True
+
+
+    # ==============
+    # Build Methods
+    # ==============
+    def _preBuild(self, kSceneItem):
+        """Pre-Build commands.
+
+        Clears the recording of the previous build so each build records only
+        its own nodes and operations.
+
+        Arguments:
+        kSceneItem -- Object, kraken kSceneItem object to build.
+
+        Return:
+        True if successful.
+
+        """
+
+        self.clearRecording()
+
+        return True
@@ -781,9 +781,9 @@ class Builder(Builder):
 
 
             # Generate the operator source code.
-            opSourceCode = kOperator.generateSourceCode()
+            opName, opSourceCode = self.getKLOperatorSourceCode(kOperator)
 
-            si.fabricSplice('addKLOperator', spliceOpPath, '{"opName": "' + kOperator.getName() + '"}', opSourceCode)
+            si.fabricSplice('addKLOperator', spliceOpPath, '{"opName": "' + opName + '"}', opSourceCode)
 
             # Check for Time and Frame arguments and set expressions
             spliceOp = si.Dictionary.GetObject(spliceOpPath, False)
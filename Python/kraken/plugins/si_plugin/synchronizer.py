@@ -58,6 +58,25 @@ class Synchronizer(Synchronizer):
         return findItem
 
 
+    def isDCCItemValid(self, dccItem):
+        """Checks that the DCC item still refers to an existing Softimage object.
+
+        Arguments:
+        dccItem -- Object, Softimage object to check.
+
+        Return:
+        True if the DCC item still exists.
+
+        """
+
+        try:
+            dccItem.FullName
+        except:
+            return False
+
+        return True
+
+
     def syncXfo(self, kObject):
         """Syncs the xfo from the DCC object to the Kraken object.
 
@@ -71,11 +90,11 @@ class Synchronizer(Synchronizer):
 
         hrcMap = self.getHierarchyMap()
 
-        if kObject not in hrcMap.keys():
+        if kObject not in hrcMap:
             log("Warning! 3D Object '" + kObject.getName() + "' was not found in the mapping!", 8)
             return False
 
-        dccItem = hrcMap[kObject]['dccItem']
+        dccItem = self.getMappedDCCItem(kObject)
 
         if dccItem is None:
             log("Warning Syncing. No DCC Item for :" + kObject.getPath(), 8)
@@ -110,11 +129,11 @@ class Synchronizer(Synchronizer):
 
         hrcMap = self.getHierarchyMap()
 
-        if kObject not in hrcMap.keys():
+        if kObject not in hrcMap:
             log("Warning! Attribute '" + kObject.getName() + "' was not found in the mapping!", 8)
             return False
 
-        dccItem = hrcMap[kObject]['dccItem']
+        dccItem = self.getMappedDCCItem(kObject)
 
         if dccItem is None:
             log("Warning Syncing. No DCC Item for :" + kObject.getPath(), 8)
@@ -138,11 +157,11 @@ class Synchronizer(Synchronizer):
 
         hrcMap = self.getHierarchyMap()
 
-        if kObject not in hrcMap.keys():
+        if kObject not in hrcMap:
             log("Warning! 3D Object '" + kObject.getName() + "' was not found in the mapping!", 8)
             return False
 
-        dccItem = hrcMap[kObject]['dccItem']
+        dccItem = self.getMappedDCCItem(kObject)
 
         if dccItem is None:
             log("Warning Syncing. No DCC Item for :" + kObject.getPath(), 8)
@@ -59,8 +59,7 @@ class ContextualNodeList(QtGui.QWidget):
 
         self.componentClassNames = []
         for componentClassName in sorted(self.ks.getComponentClassNames()):
-            cmpCls = self.ks.getComponentClass(componentClassName)
-            if cmpCls.getComponentType() != 'Guide':
+            if self.ks.getComponentType(componentClassName) != 'Guide':
                 continue
 
             self.componentClassNames.append(componentClassName)
@@ -46,6 +46,10 @@ class KGraphViewWidget(GraphViewWidget):
 
         self.setGraphView(graphView)
 
+        # The synchronizer is kept between syncs so only the guide items that
+        # changed in the DCC are synced again.
+        self.synchronizer = None
+
         #########################
         ## Setup hotkeys for the following actions.
 
@@ -126,6 +130,11 @@ class KGraphViewWidget(GraphViewWidget):
 
             builder.build(self.guideRig)
 
+            # The guide's DCC items were built again, the next sync has to map
+            # them from scratch.
+            if self.synchronizer is not None:
+                self.synchronizer.clearHierarchyMap()
+
         except Exception as e:
             print traceback.format_exc()
 
@@ -157,9 +166,19 @@ class KGraphViewWidget(GraphViewWidget):
 
 
     def synchGuideRig(self):
-        synchronizer = plugins.getSynchronizer()
-        synchronizer.setTarget(self.guideRig)
-        synchronizer.sync()
+        if self.synchronizer is None:
+            self.synchronizer = plugins.getSynchronizer()
+
+        # Map the guide rig again when it was replaced, its hierarchy changed
+        # or it was built again, this also moves the change tracking to the
+        # new DCC items.
+        if self.synchronizer.getTarget() is not self.guideRig or self.synchronizer.isHierarchyMapCurrent() is False:
+            self.synchronizer.setTarget(self.guideRig)
+
+        if self.synchronizer.isTrackingChanges() is False:
+            self.synchronizer.startChangeTracking()
+
+        self.synchronizer.sync(incremental=True)
 
 
     def buildRig(self):
@@ -65,8 +65,7 @@ class ComponentLibrary(QtGui.QWidget):
 
         self.componentClassNames = []
         for componentClassName in sorted(self.ks.getComponentClassNames()):
-            cmpCls = self.ks.getComponentClass(componentClassName)
-            if cmpCls.getComponentType() != 'Guide':
+            if self.ks.getComponentType(componentClassName) != 'Guide':
                 continue
 
             self.componentClassNames.append(componentClassName)
@@ -1,7 +1,8 @@
 import math
 
 from kraken.core.maths import Vec3
-from kraken.core.maths.xfo import Xfo
+from kraken.core.maths.vec3_array import Vec3Array
+from kraken.core.maths.xfo_array import XfoArray
 
 from kraken.core.objects.components.base_example_component import BaseExampleComponent
 
@@ -151,22 +152,20 @@ class TentacleComponentGuide(TentacleComponent):
         fw = toTip.cross(toFirst).unit()
 
         # Calculate Xfos
-        boneXfos = []
-        boneLengths = []
-        for i in xrange(numJoints):
-            boneVec = self.jointCtrls[i + 1].xfo.tr.subtract(self.jointCtrls[i].xfo.tr)
-            boneLengths.append(boneVec.length())
-            bone1Normal = fw.cross(boneVec).unit()
-            bone1ZAxis = boneVec.cross(bone1Normal).unit()
+        jointPositions = Vec3Array([ctrl.xfo.tr for ctrl in self.jointCtrls[:numJoints + 1]])
+        bonePositions = jointPositions[:-1]
+        boneVecs = jointPositions[1:].subtract(bonePositions)
 
-            xfo = Xfo()
-            xfo.setFromVectors(boneVec.unit(), bone1Normal, bone1ZAxis, self.jointCtrls[i].xfo.tr)
+        # fw.cross(boneVec) for each of the bones.
+        boneNormals = boneVecs.cross(fw).negate().unit()
+        boneZAxes = boneVecs.cross(boneNormals).unit()
 
-            boneXfos.append(xfo)
+        boneXfos = XfoArray()
+        boneXfos.setFromVectors(boneVecs.unit(), boneNormals, boneZAxes, bonePositions)
 
-        data['boneXfos'] = boneXfos
+        data['boneXfos'] = boneXfos.toList()
         data['endXfo'] = self.jointCtrls[-1].xfo
-        data['boneLengths'] = boneLengths
+        data['boneLengths'] = boneVecs.length()
 
         return data
 
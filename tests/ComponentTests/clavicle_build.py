@@ -7,6 +7,7 @@ from kraken.helpers.utility_methods import logHierarchy
 import json
 
 
+Profiler.getInstance().setEnabled(True)
 Profiler.getInstance().push("clavicle_build")
 
 clavicleGuide = ClavicleComponentGuide("clavicle")
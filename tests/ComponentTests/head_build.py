@@ -7,6 +7,7 @@ from kraken.core.profiler import Profiler
 from kraken.helpers.utility_methods import logHierarchy
 
 
+Profiler.getInstance().setEnabled(True)
 Profiler.getInstance().push("head_build")
 
 headGuide = HeadComponentGuide("head")
@@ -6,6 +6,7 @@ from kraken.core.profiler import Profiler
 from kraken.helpers.utility_methods import logHierarchy
 
 
+Profiler.getInstance().setEnabled(True)
 Profiler.getInstance().push("insectLeg_build")
 
 insectLegGuide = InsectLegComponentGuide("insectLeg")
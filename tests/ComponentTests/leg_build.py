@@ -8,6 +8,7 @@ from kraken.core.profiler import Profiler
 from kraken.helpers.utility_methods import logHierarchy
 
 
+Profiler.getInstance().setEnabled(True)
 Profiler.getInstance().push("leg_build")
 
 legGuide = LegComponentGuide("leg")
@@ -0,0 +1,31 @@
+from kraken.core.kraken_system import ks
+from kraken.core.maths import *
+
+
+prevBackend = ks.getMathBackend()
+ks.setMathBackend('Python')
+
+xfo1 = Xfo(tr=Vec3(1.0, 0.0, 2.0), ori=Quat(v=Vec3(1.0, 0.0, 2.0), w=0.5).unit(), sc=Vec3(2.0, 2.0, 2.0))
+print "rtvalType:" + ks.getRTValTypeName(xfo1._rtval)
+print "xfo:" + str(xfo1)
+
+xfo2 = Xfo()
+xfo2.setFromMat44(xfo1.toMat44())
+print "setFromMat44:" + str(xfo1.tr.almostEqual(xfo2.tr)) + " " + str(xfo1.ori.almostEqual(xfo2.ori)) + " " + str(xfo1.sc.almostEqual(xfo2.sc))
+
+identity = xfo1.multiply(xfo1.inverse())
+print "inverse:" + str(identity.tr.almostEqual(Vec3())) + " " + str(identity.ori.almostEqual(Quat()))
+
+for order in range(6):
+    euler = Euler(0.3, -0.7, 1.1, RotationOrder(order))
+    quat = Quat().setFromEuler(euler)
+    print "toEuler:" + str(order) + " " + str(quat.toEuler(RotationOrder(order)).almostEqual(euler, 0.0001))
+
+quat = Quat(v=Vec3(0.1, 0.2, 0.3), w=0.9)
+mirrored = quat.mirror(0)
+print "mirror:" + str(mirrored)
+print "mirror source:" + str(quat)
+mirrored.w = 0.0
+print "mirror copy:" + str(quat.w)
+
+ks.setMathBackend(prevBackend)
@@ -0,0 +1,37 @@
+from kraken.core.maths import *
+
+
+xfos = []
+for i in xrange(4):
+    ori = Quat()
+    ori.setFromAxisAndAngle(Vec3(0.0, 1.0, 0.0), 0.25 * i)
+    xfos.append(Xfo(tr=Vec3(float(i), 1.0, 0.0), ori=ori, sc=Vec3(2.0, 2.0, 2.0)))
+
+xfoArray = XfoArray(xfos)
+print "len:" + str(len(xfoArray))
+print "tr:" + str(xfoArray[2].tr)
+print "translations:" + str(xfoArray.getTranslations())
+
+offset = Xfo(tr=Vec3(1.0, 0.0, 0.0))
+multiplied = xfoArray.multiply(offset)
+print "multiply:" + str([multiplied[i].tr.almostEqual(xfos[i].multiply(offset).tr) for i in xrange(4)])
+
+inverted = xfoArray.inverse()
+print "inverse:" + str([inverted[i].ori.almostEqual(xfos[i].inverse().ori) for i in xrange(4)])
+
+transformed = xfoArray.transformVector(Vec3(0.0, 0.0, 1.0))
+print "transformVector:" + str([transformed[i].almostEqual(xfos[i].transformVector(Vec3(0.0, 0.0, 1.0))) for i in xrange(4)])
+
+interpolated = xfoArray.linearInterpolate(XfoArray(list(reversed(xfos))), 0.5)
+print "linearInterpolate:" + str(interpolated[0].tr) + " " + str(interpolated[0].ori.almostEqual(xfos[0].linearInterpolate(xfos[3], 0.5).ori))
+
+mirrored = xfoArray.mirror(0)
+print "mirror:" + str(mirrored[3].tr)
+
+fromMat44 = XfoArray()
+fromMat44.setFromMat44([xfo.toMat44() for xfo in xfos])
+print "setFromMat44:" + str([fromMat44[i].ori.almostEqual(xfos[i].ori) and fromMat44[i].sc.almostEqual(xfos[i].sc) for i in xrange(4)])
+
+vecs = Vec3Array([Vec3(3.0, 0.0, 0.0), Vec3(0.0, 4.0, 0.0)])
+print "length:" + str(vecs.length())
+print "cross:" + str(vecs.cross(Vec3(0.0, 0.0, 1.0)))
@@ -10,6 +10,7 @@ from kraken.helpers.utility_methods import logHierarchy
 
 def buildArm(mode='guide'):
 
+    Profiler.getInstance().setEnabled(True)
     Profiler.getInstance().push("arm_build")
 
     guideContainer = Container('armGuide')
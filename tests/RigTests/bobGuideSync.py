@@ -7,6 +7,7 @@ from kraken.helpers.utility_methods import logHierarchy
 
 def buildBob(mode='guide'):
 
+    Profiler.getInstance().setEnabled(True)
     Profiler.getInstance().push("bob_build")
 
     bobGuideRig = Rig("char_bob")
@@ -0,0 +1,123 @@
+import array
+
+from kraken.core.kraken_system import ks
+from kraken.core.maths import Vec3, Xfo
+from kraken.core.objects.locator import Locator
+from kraken.core.objects.attributes.attribute_group import AttributeGroup
+from kraken.core.objects.attributes.bool_attribute import BoolAttribute
+from kraken.core.objects.attributes.scalar_attribute import ScalarAttribute
+from kraken.core.objects.attributes.integer_attribute import IntegerAttribute
+from kraken.core.objects.operators.splice_operator import SpliceOperator
+
+
+prevBackend = ks.getSolverBackend()
+ks.setSolverBackend('Python')
+
+root = Locator("root")
+settings = AttributeGroup("settings", parent=root)
+drawDebug = BoolAttribute("drawDebug", False, parent=settings)
+rigScale = ScalarAttribute("rigScale", 1.0, parent=settings)
+length = ScalarAttribute("length", 8.0, parent=settings)
+
+
+def locator(name, tr):
+    loc = Locator(name, parent=root)
+    loc.xfo = Xfo(tr=tr)
+    return loc
+
+
+def mat44Values(xfo):
+    mat = xfo.toMat44()
+    values = []
+    for row in (mat.row0, mat.row1, mat.row2, mat.row3):
+        values.extend([row.x, row.y, row.z, row.t])
+    return values
+
+
+def rounded(values):
+    return [round(x, 4) + 0.0 for x in values]
+
+
+tip = locator("tip", Vec3(4, 10, 0))
+spliceOp = SpliceOperator("spineSpliceOp", 'BezierSpineSolver', 'Kraken')
+spliceOp.setInput('drawDebug', drawDebug)
+spliceOp.setInput('rigScale', rigScale)
+spliceOp.setInput('length', length)
+spliceOp.setInput('base', locator("base", Vec3(0, 1, 0)))
+spliceOp.setInput('baseHandle', locator("baseHandle", Vec3(0, 4, 0)))
+spliceOp.setInput('tipHandle', locator("tipHandle", Vec3(4, 6, 0)))
+spliceOp.setInput('tip', tip)
+outputs = [Locator("spine" + str(i), parent=root) for i in xrange(3)]
+spliceOp.setOutput('outputs', outputs)
+
+# Three frames of the tip and rig scale, the other inputs keep the values of
+# the connected objects.
+tipPositions = [Vec3(4, 10, 0), Vec3(5, 9, 0), Vec3(6, 8, 1)]
+tipBuffer = array.array('d')
+for tr in tipPositions:
+    tipBuffer.extend(mat44Values(Xfo(tr=tr)))
+
+results = spliceOp.evaluateFrames(3, {'tip': tipBuffer, 'rigScale': [1.0, 1.0, 2.0]})
+print "outputs buffer: " + str(type(results['outputs']).__name__) + " of " + str(len(results['outputs']))
+print "connected outputs untouched: " + str(outputs[-1].xfo.tr.y == 0.0)
+
+# Stepping the connected objects gives the same frames.
+matches = True
+for frame, tr in enumerate(tipPositions):
+    tip.xfo = Xfo(tr=tr)
+    rigScale.setValue([1.0, 1.0, 2.0][frame])
+    spliceOp.evaluate()
+    for j, output in enumerate(outputs):
+        offset = (frame * len(outputs) + j) * 16
+        if rounded(results['outputs'][offset:offset + 16]) != rounded(mat44Values(output.xfo)):
+            matches = False
+
+    print "frame " + str(frame) + " tip output tr: " + str(rounded([results['outputs'][(frame * len(outputs) + 2) * 16 + k] for k in (3, 7, 11)]))
+
+print "matches evaluate: " + str(matches)
+
+# Evaluate converts the connected objects again after a batch.
+tip.xfo = Xfo(tr=Vec3(4, 10, 0))
+rigScale.setValue(1.0)
+spliceOp.evaluate()
+before = rounded(mat44Values(outputs[-1].xfo))
+spliceOp.evaluateFrames(1, {'tip': mat44Values(Xfo(tr=Vec3(0, 20, 0)))})
+spliceOp.evaluate()
+print "evaluate after batch: " + str(before == rounded(mat44Values(outputs[-1].xfo)))
+
+# Array inputs hold the elements of each frame one after the other.
+ikOp = SpliceOperator("chainSpliceOp", 'NBoneIKSolver', 'Kraken')
+useInitPose = BoolAttribute("useInitPose", False, parent=settings)
+ikblend = ScalarAttribute("ikblend", 1.0, parent=settings)
+tipBoneLen = ScalarAttribute("tipBoneLen", 2.0, parent=settings)
+rootIndex = IntegerAttribute("rootIndex", 0, parent=settings)
+for name, attr in [('drawDebug', drawDebug), ('rigScale', rigScale), ('useInitPose', useInitPose),
+                   ('ikblend', ikblend), ('tipBoneLen', tipBoneLen), ('rootIndex', rootIndex)]:
+    ikOp.setInput(name, attr)
+ikOp.setInput('chainBase', locator("chainBase", Vec3(0, 0, 0)))
+ikOp.setInput('upVector', locator("upVector", Vec3(0, 0, 5)))
+ikOp.setInput('ikgoal', locator("ikgoal", Vec3(3, 3, 0)))
+ikOp.setInput('fkcontrols', [locator("fk" + str(i), Vec3(2 * i, 0, 0)) for i in xrange(3)])
+ikOp.setOutput('pose', [Locator("bone" + str(i), parent=root) for i in xrange(3)])
+ikOp.setOutput('legEnd', Locator("legEnd", parent=root))
+
+fkBuffer = []
+goalBuffer = []
+for frame in xrange(2):
+    bend = 0.5 * (frame + 1)
+    fkBuffer.extend(mat44Values(Xfo(tr=Vec3(0, 0, 0))))
+    fkBuffer.extend(mat44Values(Xfo(tr=Vec3(2, bend, 0))))
+    fkBuffer.extend(mat44Values(Xfo(tr=Vec3(4, 0, 0))))
+    goalBuffer.extend(mat44Values(Xfo(tr=Vec3(3, 3 + frame, 0))))
+
+results = ikOp.evaluateFrames(2, {'fkcontrols': fkBuffer, 'ikgoal': goalBuffer})
+print "pose buffer size: " + str(len(results['pose']))
+for frame in xrange(2):
+    print "frame " + str(frame) + " legEnd tr: " + str(rounded([results['legEnd'][frame * 16 + k] for k in (3, 7, 11)]))
+
+try:
+    ikOp.evaluateFrames(2, {'ikgoal': goalBuffer[:20]})
+except Exception as e:
+    print "error: " + str(e)
+
+ks.setSolverBackend(prevBackend)
@@ -0,0 +1,57 @@
+import os
+import json
+import tempfile
+
+import kraken_examples
+from kraken.core.io.rig_definition_binary import encodeRigDefinition
+from kraken.core.io.rig_definition_binary import isBinaryRigDefinition
+from kraken.core.io.rig_definition_binary import RigDefinitionBinaryReader
+from kraken.core.objects.rig import Rig
+from kraken.helpers.utility_methods import prepareToLoad, prepareToSave
+
+
+rigFilePath = os.path.join(os.path.dirname(kraken_examples.__file__), 'bob_rig.krg')
+
+with open(rigFilePath) as rigFile:
+    pureJSON = json.load(rigFile)
+
+rigData = prepareToLoad(json.loads(json.dumps(pureJSON)))
+
+# Both the pure JSON and the decoded data can be encoded.
+binaryData = encodeRigDefinition(rigData)
+print prepareToSave(RigDefinitionBinaryReader(data=encodeRigDefinition(pureJSON)).read()) == pureJSON
+print len(binaryData) < len(json.dumps(pureJSON, indent=2))
+
+# Decoding round trips losslessly.
+decoded = RigDefinitionBinaryReader(data=binaryData).read()
+print prepareToSave(decoded) == pureJSON
+print type(decoded['components'][1]['neckPosition']).__name__
+
+# Files are detected by their header when loading.
+binaryPath = os.path.join(tempfile.gettempdir(), 'kraken_bob_rig.krgb')
+with open(binaryPath, 'wb') as binaryFile:
+    binaryFile.write(binaryData)
+
+print isBinaryRigDefinition(binaryPath), isBinaryRigDefinition(rigFilePath)
+
+bobRig = Rig()
+bobRig.loadRigDefinitionFile(binaryPath)
+print bobRig.getName(), len(bobRig.getChildrenByType('Component'))
+
+referenceRig = Rig()
+referenceRig.loadRigDefinitionFile(rigFilePath)
+print prepareToSave(bobRig.getData()) == prepareToSave(referenceRig.getData())
+
+# Rigs written in the binary format load the same as rigs written as JSON.
+jsonPath = os.path.join(tempfile.gettempdir(), 'kraken_bob_rig.krg')
+bobRig.writeRigDefinitionFile(binaryPath, binary=True)
+bobRig.writeRigDefinitionFile(jsonPath)
+
+binaryRig = Rig()
+binaryRig.loadRigDefinitionFile(binaryPath)
+jsonRig = Rig()
+jsonRig.loadRigDefinitionFile(jsonPath)
+print prepareToSave(binaryRig.getData()) == prepareToSave(jsonRig.getData())
+
+os.remove(binaryPath)
+os.remove(jsonPath)
@@ -0,0 +1,20 @@
+from kraken.core.objects.container import Container
+from kraken_examples.arm_component import ArmComponentRig
+
+
+# The objects of a rig component sit under the container's layers and the
+# component group, not under the component.
+container = Container('char')
+arm = ArmComponentRig('arm', container)
+
+print arm.bicepOutputTgt.getBuildName()
+print arm.bicepFKCtrl.getBuildName()
+
+arm.setName('limb')
+print arm.bicepOutputTgt.getBuildName()
+print arm.bicepFKCtrl.getBuildName()
+
+arm.setLocation('R')
+print arm.bicepOutputTgt.getPath()
+print arm.bicepOutputTgt.getBuildName()
+print arm.bicepFKCtrl.getBuildName()
@@ -0,0 +1,33 @@
+from kraken import plugins
+from kraken.core.objects.locator import Locator
+from kraken.core.objects.layer import Layer
+from kraken.core.objects.container import Container
+from kraken.core.objects.constraints.pose_constraint import PoseConstraint
+
+
+container = Container("myContainer")
+layer = Layer("myLayer", parent=container)
+locA = Locator("locA", parent=layer)
+locB = Locator("locB", parent=locA)
+
+constraint = PoseConstraint('poseConstraint')
+constraint.setConstrainee(locB)
+constraint.addConstrainer(locA)
+locB.addConstraint(constraint)
+
+builder = plugins.getBuilder()
+
+config = builder.getConfig()
+prevExplicitNaming = config.getExplicitNaming()
+config.setExplicitNaming(True)
+
+buildPlan = builder.createBuildPlan(container)
+print buildPlan
+
+for kObject, objectType, buildName in buildPlan.objects:
+    print objectType + ":" + kObject.getPath() + " as:" + buildName
+
+for kConstraint, constraintType in buildPlan.constraints:
+    print constraintType + ":" + kConstraint.getConstrainee().getPath()
+
+config.setExplicitNaming(prevExplicitNaming)
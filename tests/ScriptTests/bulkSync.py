@@ -0,0 +1,87 @@
+from kraken.core.maths import Vec3, Quat, Xfo
+from kraken.core.objects.container import Container
+from kraken.core.objects.layer import Layer
+from kraken.core.objects.locator import Locator
+from kraken.core.objects.attributes.attribute_group import AttributeGroup
+from kraken.core.objects.attributes.scalar_attribute import ScalarAttribute
+from kraken.core.synchronizer import Synchronizer
+
+
+class BulkSynchronizer(Synchronizer):
+
+    def __init__(self, dccValues):
+        self.dccValues = dccValues
+        self.bulkReads = 0
+        self.itemReads = 0
+        super(BulkSynchronizer, self).__init__()
+
+    def getDCCItem(self, kObject):
+        if kObject.getName() in self.dccValues:
+            return kObject.getName()
+
+        return None
+
+    def readXfos(self, kObjects):
+        self.bulkReads += 1
+        values = []
+        for kObject in kObjects:
+            values.extend(self.dccValues[kObject.getName()])
+
+        return values
+
+    def readAttributeValues(self, kObjects):
+        self.bulkReads += 1
+        return [self.dccValues[kObject.getName()] for kObject in kObjects]
+
+    def syncXfo(self, kObject):
+        self.itemReads += 1
+        return True
+
+
+container = Container("guide")
+layer = Layer("guides", parent=container)
+dccValues = {"guide": [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 1.0, 1.0, 1.0, 1.0],
+             "guides": [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 1.0, 1.0, 1.0, 1.0],
+             "blend": 0.25}
+for i in xrange(5):
+    locator = Locator("loc" + str(i), parent=layer)
+    dccValues[locator.getName()] = [float(i), 1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 2.0, 2.0, 2.0]
+
+# No DCC item, synced on its own.
+Locator("unbuilt", parent=layer)
+
+attrGroup = AttributeGroup("settings", parent=layer.getChildByName("loc0"))
+blend = ScalarAttribute("blend", 0.0, parent=attrGroup)
+
+synchronizer = BulkSynchronizer(dccValues)
+synchronizer.setTarget(container)
+synchronizer.sync()
+
+print synchronizer.getSyncedCount(), synchronizer.bulkReads, synchronizer.itemReads
+print layer.getChildByName("loc3").xfo
+print blend.getValue()
+
+# Incremental syncs only read the dirty items.
+synchronizer.bulkReads = 0
+synchronizer.markDirty(layer.getChildByName("loc4"))
+synchronizer.sync(incremental=True)
+print synchronizer.getSyncedCount(), synchronizer.getSkippedCount(), synchronizer.bulkReads
+
+# Without bulk support every item is synced with syncXfo.
+synchronizer.readXfos = lambda kObjects: None
+synchronizer.itemReads = 0
+synchronizer.sync()
+print synchronizer.itemReads
+
+# Items are updated per object in hierarchy order, and synchronize syncs a
+# part of the hierarchy.
+syncOrder = []
+synchronizer.readAttributeValues = lambda kObjects: None
+synchronizer.syncXfo = lambda kObject: syncOrder.append(kObject.getName())
+synchronizer.syncAttribute = lambda kObject: syncOrder.append(kObject.getName())
+synchronizer.sync()
+print syncOrder
+
+syncOrder = []
+synchronizer.synchronize(layer.getChildByName("loc0"))
+print syncOrder
@@ -0,0 +1,39 @@
+from kraken import plugins
+from kraken.core.objects.locator import Locator
+from kraken.core.objects.layer import Layer
+from kraken.core.objects.components.base_example_component import BaseExampleComponent
+
+
+myParent = Locator("myParent")
+for i in xrange(200):
+    Locator("joint", parent=myParent)
+
+print myParent.getNumChildren()
+print myParent.getChildByIndex(199).getName()
+
+myParent.removeChildByName("joint07")
+print myParent.getChildByName("joint07")
+print Locator("joint", parent=myParent).getName()
+print Locator("joint", parent=myParent).getName()
+
+myLoc = myParent.getChildByName("joint12")
+myLoc.setName("renamed")
+print myParent.getChildByName("joint12")
+print myParent.getChildByName("renamed").getPath()
+print Locator("joint", parent=myParent).getName()
+
+myLayer = Layer("myLayer")
+armL = BaseExampleComponent("arm", parent=myLayer)
+armL.setLocation("L")
+armR = BaseExampleComponent("arm", parent=myLayer)
+armR.setLocation("R")
+print myLayer.getChildByDecoratedName("arm:L") is armL
+print myLayer.getChildByDecoratedName("arm:R") is armR
+print myLayer.getChildByName("arm") is armL
+
+armL.setName("leg")
+print myLayer.getChildByDecoratedName("arm:L")
+print myLayer.getChildByDecoratedName("leg:L") is armL
+
+print armL.ctrlCmpGrp.getParent().getChildByDecoratedName("leg:L") is armL.ctrlCmpGrp
+
@@ -0,0 +1,20 @@
+from kraken.plugins.maya_plugin.command_buffer import CommandBuffer, CommandRecorder
+
+
+recorder = CommandRecorder()
+commandBuffer = CommandBuffer(recorder)
+
+commandBuffer.lockAttributes("|rig|arm_L_ctrl", ['rx', 'ry', 'rz'])
+commandBuffer.append('setAttr', "arm_L_ctrl.overrideEnabled", True)
+commandBuffer.append('connectAttr', "settings.blend", "arm_L_ctrl.blend", force=True)
+
+print commandBuffer.getNumCommands()
+print len(recorder.calls)
+
+print commandBuffer.flush()
+print commandBuffer.getNumCommands()
+
+for command, args, kwargs in recorder.calls:
+    print command, args, sorted(kwargs.items())
+
+print commandBuffer.flush()
@@ -0,0 +1,159 @@
+import os
+import sys
+import json
+import time
+import shutil
+import tempfile
+import subprocess
+
+
+componentSource = """
+from kraken.core.kraken_system import KrakenSystem
+from kraken.core.objects.components.base_example_component import BaseExampleComponent
+
+
+class ManifestTestGuide(BaseExampleComponent):
+
+    def __init__(self, name='manifestTest', parent=None):
+        super(ManifestTestGuide, self).__init__(name, parent)
+
+    @classmethod
+    def getComponentType(cls):
+        return 'Guide'
+
+
+KrakenSystem.getInstance().registerComponent(ManifestTestGuide)
+"""
+
+checkSource = """
+import sys
+from kraken.core.kraken_system import ks
+
+ks.loadComponentModules(sys.argv[1])
+
+className = 'manifestTestPackage.manifestTest.ManifestTestGuide'
+print className in ks.getComponentClassNames(), ks.getComponentType(className)
+print 'manifestTestPackage.manifestTest' in sys.modules
+print ks.getComponentClass(className).__name__, 'manifestTestPackage.manifestTest' in sys.modules
+"""
+
+# Registers a class defined in a module that doesn't register it.
+baseSource = """
+from kraken.core.objects.components.base_example_component import BaseExampleComponent
+
+
+class ManifestTestRig(BaseExampleComponent):
+
+    def __init__(self, name='manifestTest', parent=None):
+        super(ManifestTestRig, self).__init__(name, parent)
+
+    @classmethod
+    def getComponentType(cls):
+        return 'Rig'
+"""
+
+registerSource = """
+from kraken.core.kraken_system import KrakenSystem
+from manifestTestPackage.manifestTestBase import ManifestTestRig
+
+
+KrakenSystem.getInstance().registerComponent(ManifestTestRig)
+"""
+
+classesCheckSource = """
+import os
+import sys
+from kraken.core.kraken_system import ks
+
+ks.loadComponentModules(sys.argv[1])
+
+# Modules removed after loading are dropped by the next load.
+for removedPath in os.environ.get('REMOVE_MODULES', '').split(os.pathsep):
+    if removedPath != '':
+        os.remove(removedPath)
+        ks.loadComponentModules(sys.argv[1])
+
+for className in sys.argv[2:]:
+    if className not in ks.getComponentClassNames():
+        print className.split('.')[-1], 'not found'
+        continue
+
+    print className.split('.')[-1], ks.manifestComponents[className]['module'], ks.getComponentClass(className).__name__
+"""
+
+tempDir = tempfile.mkdtemp()
+packageDir = os.path.join(tempDir, 'manifestTestPackage')
+os.mkdir(packageDir)
+open(os.path.join(packageDir, '__init__.py'), 'w').close()
+
+modulePath = os.path.join(packageDir, 'manifestTest.py')
+with open(modulePath, 'w') as moduleFile:
+    moduleFile.write(componentSource)
+
+checkPath = os.path.join(tempDir, 'check.py')
+with open(checkPath, 'w') as checkFile:
+    checkFile.write(checkSource)
+
+manifestPath = os.path.join(tempDir, 'manifest', 'componentManifest.json')
+
+env = dict(os.environ)
+env['KRAKEN_PATHS'] = tempDir
+env['PYTHONPATH'] = os.pathsep.join(sys.path)
+
+
+def runCheck():
+    process = subprocess.Popen([sys.executable, checkPath, manifestPath], env=env,
+                               stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+    return process.communicate()[0].strip()
+
+
+def getManifestEntry():
+    with open(manifestPath, 'r') as manifestFile:
+        return json.load(manifestFile)['files'][modulePath]
+
+
+# Without a manifest every module is imported and the manifest is written.
+print runCheck()
+print [x['class'] for x in getManifestEntry()['components']]
+
+# With an up to date manifest the module is only imported on demand.
+print runCheck()
+
+# Changed modules are imported again and their manifest entries refreshed.
+mtime = getManifestEntry()['mtime']
+os.utime(modulePath, (time.time(), mtime + 10.0))
+print runCheck()
+print abs(getManifestEntry()['mtime'] - mtime - 10.0) < 0.01
+
+# Classes are recorded under the module registering them.
+for name, source in [('manifestTestBase', baseSource), ('manifestTestRegister', registerSource)]:
+    with open(os.path.join(packageDir, name + '.py'), 'w') as moduleFile:
+        moduleFile.write(source)
+
+classesCheckPath = os.path.join(tempDir, 'classesCheck.py')
+with open(classesCheckPath, 'w') as checkFile:
+    checkFile.write(classesCheckSource)
+
+classNames = ['manifestTestPackage.manifestTest.ManifestTestGuide',
+              'manifestTestPackage.manifestTestBase.ManifestTestRig']
+
+
+def runClassesCheck():
+    process = subprocess.Popen([sys.executable, classesCheckPath, manifestPath] + classNames, env=env,
+                               stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+    return process.communicate()[0].strip()
+
+
+print runClassesCheck()
+print runClassesCheck()
+
+# The classes of removed modules are dropped from the manifest.
+if os.path.exists(modulePath + 'c'):
+    os.remove(modulePath + 'c')
+
+env['REMOVE_MODULES'] = modulePath
+print runClassesCheck()
+del env['REMOVE_MODULES']
+print runClassesCheck()
+
+shutil.rmtree(tempDir)
@@ -0,0 +1,123 @@
+from kraken.core.maths import Vec3, Xfo
+from kraken.core.objects.container import Container
+from kraken.core.objects.locator import Locator
+from kraken.core.objects.components.component import Component
+from kraken.core.synchronizer import Synchronizer
+
+
+class DCCItem(object):
+
+    def __init__(self, value):
+        self.value = value
+        self.alive = True
+        self.callbacks = []
+
+    def set(self, value):
+        self.value = value
+        for callback in self.callbacks:
+            callback()
+
+
+class DCC(object):
+    """Builds a DCC item per object, building again replaces all of them."""
+
+    def __init__(self):
+        self.items = {}
+
+    def build(self, kObject):
+        for item in self.items.values():
+            item.alive = False
+            item.callbacks = []
+
+        self.items = {}
+        stack = [kObject]
+        while len(stack) > 0:
+            item = stack.pop()
+            if item.isTypeOf('Component') is False:
+                self.items[item.getDecoratedPath()] = DCCItem(item.xfo.tr)
+
+            stack.extend([item.getChildByIndex(i) for i in xrange(item.getNumChildren())])
+
+
+class TrackingSynchronizer(Synchronizer):
+    """Gets no change ids from the DCC and relies on change notifications."""
+
+    def __init__(self, dcc):
+        self.dcc = dcc
+        super(TrackingSynchronizer, self).__init__()
+
+    def getDCCItem(self, kObject):
+        return self.dcc.items.get(kObject.getDecoratedPath())
+
+    def isDCCItemValid(self, dccItem):
+        return dccItem.alive
+
+    def startChangeTracking(self):
+        self.stopChangeTracking()
+        for kObject, mapEntry in self.getHierarchyMap().iteritems():
+            if mapEntry['dccItem'] is not None:
+                mapEntry['dccItem'].callbacks.append(lambda kObject=kObject: self.markDirty(kObject))
+
+        self._trackingChanges = True
+        return True
+
+    def stopChangeTracking(self):
+        for item in self.dcc.items.values():
+            item.callbacks = []
+
+        return super(TrackingSynchronizer, self).stopChangeTracking()
+
+    def syncXfo(self, kObject):
+        dccItem = self.getMappedDCCItem(kObject)
+        if dccItem is None:
+            return False
+
+        kObject.xfo = Xfo(dccItem.value)
+        return True
+
+
+def synchGuideRig():
+    # Same steps as KGraphViewWidget.synchGuideRig.
+    if synchronizer.getTarget() is not guideRig or synchronizer.isHierarchyMapCurrent() is False:
+        synchronizer.setTarget(guideRig)
+
+    if synchronizer.isTrackingChanges() is False:
+        synchronizer.startChangeTracking()
+
+    synchronizer.sync(incremental=True)
+    print "synced:", synchronizer.getSyncedCount(), "skipped:", synchronizer.getSkippedCount()
+
+
+def dccItem(kObject):
+    return dcc.items[kObject.getDecoratedPath()]
+
+
+dcc = DCC()
+synchronizer = TrackingSynchronizer(dcc)
+
+guideRig = Container("rig")
+a = Locator("a", parent=Component("first", parent=guideRig))
+dcc.build(guideRig)
+
+synchGuideRig()
+synchGuideRig()
+print "map current:", synchronizer.isHierarchyMapCurrent()
+
+# A component added to the same rig is mapped on the next sync, unbuilt
+# items aren't reported as synced.
+b = Locator("b", parent=Component("second", parent=guideRig))
+print "map current:", synchronizer.isHierarchyMapCurrent()
+synchGuideRig()
+
+# Building the guide again replaces the DCC items, edits made afterwards are
+# picked up by the callbacks registered on the new items.
+dcc.build(guideRig)
+print "map current:", synchronizer.isHierarchyMapCurrent()
+synchGuideRig()
+
+dccItem(a).set(Vec3(9, 9, 9))
+dccItem(b).set(Vec3(5, 5, 5))
+synchGuideRig()
+print "a:", a.xfo.tr, "b:", b.xfo.tr
+
+synchGuideRig()
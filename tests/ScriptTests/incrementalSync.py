@@ -0,0 +1,73 @@
+from kraken.core.maths import Vec3, Xfo
+from kraken.core.objects.container import Container
+from kraken.core.objects.layer import Layer
+from kraken.core.objects.locator import Locator
+from kraken.core.objects.attributes.attribute_group import AttributeGroup
+from kraken.core.objects.attributes.scalar_attribute import ScalarAttribute
+from kraken.core.synchronizer import Synchronizer
+
+
+class DCCItem(object):
+
+    def __init__(self, value):
+        self.value = value
+        self.changeCount = 0
+
+    def set(self, value):
+        self.value = value
+        self.changeCount += 1
+
+
+class CountingSynchronizer(Synchronizer):
+
+    def __init__(self, dccItems):
+        self.dccItems = dccItems
+        super(CountingSynchronizer, self).__init__()
+
+    def getDCCItem(self, kObject):
+        return self.dccItems.get(kObject.getName())
+
+    def getChangeId(self, kObject):
+        return self.getHierarchyMap()[kObject]['dccItem'].changeCount
+
+    def syncXfo(self, kObject):
+        kObject.xfo = Xfo(self.getHierarchyMap()[kObject]['dccItem'].value)
+        return True
+
+    def syncAttribute(self, kObject):
+        kObject.setValue(self.getHierarchyMap()[kObject]['dccItem'].value)
+        return True
+
+
+container = Container("guide")
+layer = Layer("guides", parent=container)
+dccItems = {"guide": DCCItem(Vec3()), "guides": DCCItem(Vec3()), "blend": DCCItem(0.0)}
+for i in xrange(10):
+    locator = Locator("loc" + str(i), parent=layer)
+    dccItems[locator.getName()] = DCCItem(Vec3(float(i), 0.0, 0.0))
+
+attrGroup = AttributeGroup("settings", parent=layer.getChildByName("loc0"))
+blend = ScalarAttribute("blend", 0.0, parent=attrGroup)
+
+synchronizer = CountingSynchronizer(dccItems)
+synchronizer.setTarget(container)
+
+synchronizer.sync(incremental=True)
+print synchronizer.getSyncedCount(), synchronizer.getSkippedCount()
+
+synchronizer.sync(incremental=True)
+print synchronizer.getSyncedCount(), synchronizer.getSkippedCount()
+
+dccItems["loc3"].set(Vec3(3.0, 1.0, 0.0))
+dccItems["blend"].set(0.5)
+synchronizer.sync(incremental=True)
+print synchronizer.getSyncedCount(), synchronizer.getSkippedCount()
+print layer.getChildByName("loc3").xfo.tr, blend.getValue()
+
+synchronizer.markDirty(layer.getChildByName("loc7"))
+synchronizer.setTarget(container)
+synchronizer.sync(incremental=True)
+print synchronizer.getSyncedCount(), synchronizer.getSkippedCount()
+
+synchronizer.sync()
+print synchronizer.getSyncedCount(), synchronizer.getSkippedCount()
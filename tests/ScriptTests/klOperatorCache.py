@@ -0,0 +1,68 @@
+from kraken.core.kraken_system import ks, SolverArg
+from kraken.core.configs.config import Config
+from kraken.core.objects.container import Container
+from kraken.core.objects.layer import Layer
+from kraken.core.objects.locator import Locator
+from kraken.core.objects.components.component import Component
+from kraken.core.objects.attributes.attribute_group import AttributeGroup
+from kraken.core.objects.attributes.bool_attribute import BoolAttribute
+from kraken.core.objects.attributes.scalar_attribute import ScalarAttribute
+from kraken.core.objects.operators.splice_operator import SpliceOperator
+from kraken.plugins.recording_plugin.builder import Builder
+
+
+# Seed the shared solver arguments so no KL round-trip is needed.
+ks.solverArgs['CacheTestChainSolver'] = [
+    SolverArg('drawDebug', 'in', 'Boolean'),
+    SolverArg('rigScale', 'in', 'Scalar'),
+    SolverArg('chainBase', 'in', 'Mat44'),
+    SolverArg('pose', 'out', 'Mat44[]')
+]
+
+container = Container("myContainer")
+operators = []
+for name, numBones in [('chainA', 3), ('chainB', 3), ('chainC', 4), ('chainD', 3)]:
+    component = Component(name, parent=container)
+    layer = Layer(name + "Layer", parent=component)
+    base = Locator(name + "Base", parent=layer)
+    bones = [Locator(name + "Bone" + str(i), parent=layer) for i in xrange(numBones)]
+
+    settings = AttributeGroup("settings", parent=base)
+    drawDebug = BoolAttribute("drawDebug", False, parent=settings)
+    rigScale = ScalarAttribute("rigScale", 1.0, parent=settings)
+
+    spliceOp = SpliceOperator(name + "SpliceOp", 'CacheTestChainSolver', 'Kraken')
+    spliceOp.setInput('drawDebug', drawDebug)
+    spliceOp.setInput('rigScale', rigScale)
+    spliceOp.setInput('chainBase', base)
+    spliceOp.setOutput('pose', bones)
+    component.addOperator(spliceOp)
+    operators.append(spliceOp)
+
+# Stubs only depend on the solver type, extension, args and array sizes.
+print operators[0].getKLOperatorName({'pose': 3}) == operators[1].getKLOperatorName({'pose': 3})
+print operators[0].getKLOperatorName({'pose': 3}) != operators[2].getKLOperatorName({'pose': 4})
+print operators[0].generateSourceCode({'pose': 3}) is operators[3].generateSourceCode({'pose': 3})
+print operators[0].generateSourceCode({'pose': 3})
+
+prevExplicitNaming = Config.getInstance().getExplicitNaming()
+
+builder = Builder()
+builder.getConfig().setExplicitNaming(True)
+builder.build(container)
+
+for operation in builder.getOperations():
+    if operation['op'] == 'addKLOperator':
+        print operation['path'], operation['opName']
+
+stats = builder.getKLOperatorStats()
+print sorted(stats.items())
+
+# A second build generates no new stub source, the stub names are shared again.
+builder = Builder()
+builder.getConfig().setExplicitNaming(True)
+builder.build(container)
+print sorted(builder.getKLOperatorStats().items())
+
+# Builds clear the config, restore the setting on the current one.
+Config.getInstance().setExplicitNaming(prevExplicitNaming)
@@ -0,0 +1,54 @@
+# Needs Maya with the Fabric Splice plug-in, run it with mayapy.
+import maya.standalone
+maya.standalone.initialize()
+
+from maya import cmds
+
+from kraken.core.objects.container import Container
+from kraken.core.objects.layer import Layer
+from kraken.core.objects.control import Control
+from kraken.core.objects.attributes.attribute_group import AttributeGroup
+from kraken.core.objects.attributes.scalar_attribute import ScalarAttribute
+from kraken.plugins.maya_plugin.builder import Builder
+
+
+class FlushCheckingBuilder(Builder):
+    """Reports the recorded edits found in the scene when the operators are
+    built."""
+
+    def _buildOperators(self, buildPlan):
+        ctrlPath = self.getDCCSceneItem(ctrl).longName()
+        shapePath = self.getDCCSceneItem(ctrl).getShape().longName()
+
+        print "pending commands:", self.getCommandBuffer().getNumCommands()
+        print "locked:", [cmds.getAttr(ctrlPath + '.' + param, lock=True) for param in ('rx', 'ry', 'rz', 'tx')]
+        print "keyable:", [cmds.getAttr(ctrlPath + '.' + param, keyable=True) for param in ('rx', 'tx')]
+        print "group locked:", cmds.getAttr(ctrlPath + '.settings', lock=True)
+        print "shape visible:", cmds.getAttr(shapePath + '.visibility')
+        print "color:", cmds.getAttr(ctrlPath + '.overrideEnabled'), cmds.getAttr(ctrlPath + '.overrideColor')
+        drivers = cmds.listConnections(ctrlPath + '.blend', source=True, destination=False)
+        print "blend driven by driver:", cmds.ls(drivers, long=True) == [self.getDCCSceneItem(driver).longName()]
+
+        return super(FlushCheckingBuilder, self)._buildOperators(buildPlan)
+
+
+container = Container("flushTest")
+layer = Layer("controls", parent=container)
+
+driver = Control("driver", parent=layer, shape="circle")
+driverSettings = AttributeGroup("settings", parent=driver)
+driverBlend = ScalarAttribute("blend", 0.5, parent=driverSettings)
+
+ctrl = Control("ctrl", parent=layer, shape="circle")
+ctrl.setColor("yellow")
+ctrl.setShapeVisibility(False)
+for flag in ("lockXRotation", "lockYRotation", "lockZRotation"):
+    ctrl.setFlag(flag)
+
+settings = AttributeGroup("settings", parent=ctrl)
+blend = ScalarAttribute("blend", 0.0, parent=settings)
+blend.connect(driverBlend)
+
+builder = FlushCheckingBuilder()
+builder.build(container)
+print "pending commands after build:", builder.getCommandBuffer().getNumCommands()
@@ -0,0 +1,42 @@
+# Needs Maya, run it with mayapy.
+import maya.standalone
+maya.standalone.initialize()
+
+import pymel.core as pm
+
+from kraken.core.maths import Xfo
+from kraken.core.maths.xfo_array import XfoArray
+from kraken.core.objects.container import Container
+from kraken.core.objects.joint import Joint
+from kraken.plugins.maya_plugin.synchronizer import Synchronizer
+
+
+container = Container("readXfos")
+kJoints = [Joint("joint" + str(i), parent=container) for i in xrange(3)]
+
+# Joints with rotations on top of non-zero joint orients.
+pm.group(empty=True, name="readXfos")
+for i, kJoint in enumerate(kJoints):
+    pm.select(clear=True)
+    joint = pm.joint(name=kJoint.getName())
+    pm.parent(joint, "readXfos")
+    joint.setAttr("jointOrient", (10.0 * (i + 1), -25.0, 40.0 - i * 15.0))
+    joint.setAttr("rotate", (5.0, 30.0 * i, -12.0))
+    joint.setAttr("translate", (1.0 + i, 2.0, -3.0 * i))
+    joint.setAttr("scale", (1.0, 1.5, 2.0 - 0.25 * i))
+
+synchronizer = Synchronizer()
+synchronizer.setTarget(container)
+
+readXfos = XfoArray()
+readXfos.setFromValues(synchronizer.readXfos(kJoints))
+
+for i, kJoint in enumerate(kJoints):
+    kJoint.xfo = Xfo()
+    synchronizer.syncXfo(kJoint)
+    syncedXfo = kJoint.xfo
+
+    print kJoint.getName(), \
+        syncedXfo.tr.distanceTo(readXfos[i].tr) < 1e-5, \
+        abs(syncedXfo.ori.dot(readXfos[i].ori)) > 1.0 - 1e-6, \
+        syncedXfo.sc.distanceTo(readXfos[i].sc) < 1e-5
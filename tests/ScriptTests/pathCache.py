@@ -0,0 +1,32 @@
+from kraken import plugins
+from kraken.core.objects.layer import Layer
+from kraken.core.objects.locator import Locator
+from kraken.core.objects.components.base_example_component import BaseExampleComponent
+from kraken.core.objects.attributes.attribute_group import AttributeGroup
+from kraken.core.objects.attributes.scalar_attribute import ScalarAttribute
+
+
+myLayer = Layer("rig")
+myComponent = BaseExampleComponent("arm", parent=myLayer)
+myComponent.setLocation("L")
+locA = Locator("locA", parent=myComponent)
+locB = Locator("locB", parent=locA)
+attrGroup = AttributeGroup("settings", parent=locB)
+attr = ScalarAttribute("blend", 1.0, parent=attrGroup)
+
+print attr.getPath()
+print attr.getDecoratedPath()
+print myComponent.ctrlCmpGrp.getDecoratedPath()
+
+myComponent.setName("leg")
+myComponent.setLocation("R")
+print attr.getPath()
+print attr.getDecoratedPath()
+print myComponent.ctrlCmpGrp.getDecoratedPath()
+
+otherLayer = Layer("other")
+otherLayer.addChild(locA)
+print attr.getPath()
+
+locA.setName("locC")
+print attr.getDecoratedPath()
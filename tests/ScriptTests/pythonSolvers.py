@@ -0,0 +1,109 @@
+import os
+import re
+
+import kraken
+from kraken.core.kraken_system import ks
+from kraken.core.maths import Vec3, Xfo
+from kraken.core.objects.locator import Locator
+from kraken.core.objects.attributes.attribute_group import AttributeGroup
+from kraken.core.objects.attributes.bool_attribute import BoolAttribute
+from kraken.core.objects.attributes.scalar_attribute import ScalarAttribute
+from kraken.core.objects.operators.splice_operator import SpliceOperator
+
+
+prevBackend = ks.getSolverBackend()
+prevSolverBackends = dict(ks.solverBackends)
+ks.setSolverBackend('Python')
+
+root = Locator("root")
+settings = AttributeGroup("settings", parent=root)
+drawDebug = BoolAttribute("drawDebug", False, parent=settings)
+rigScale = ScalarAttribute("rigScale", 1.0, parent=settings)
+length = ScalarAttribute("length", 8.0, parent=settings)
+
+
+def locator(name, tr):
+    loc = Locator(name, parent=root)
+    loc.xfo = Xfo(tr=tr)
+    return loc
+
+
+# Same inputs as tests/kl/BezierSpineSolver.kl.
+spliceOp = SpliceOperator("spineSpliceOp", 'BezierSpineSolver', 'Kraken')
+spliceOp.setInput('drawDebug', drawDebug)
+spliceOp.setInput('rigScale', rigScale)
+spliceOp.setInput('length', length)
+spliceOp.setInput('base', locator("base", Vec3(0, 1, 0)))
+spliceOp.setInput('baseHandle', locator("baseHandle", Vec3(0, 4, 0)))
+spliceOp.setInput('tipHandle', locator("tipHandle", Vec3(4, 6, 0)))
+spliceOp.setInput('tip', locator("tip", Vec3(4, 10, 0)))
+outputs = [Locator("spine" + str(i), parent=root) for i in xrange(6)]
+spliceOp.setOutput('outputs', outputs)
+
+print "args: " + ", ".join([arg.name for arg in spliceOp.getSolverArgs()])
+spliceOp.evaluate()
+print "backend: " + spliceOp.solverBackend
+
+# The KL reference output predates the alignment offset putting the x axis of
+# the outputs down the spine, its y axis points down the spine instead.
+klOutputPath = os.path.join(os.path.dirname(kraken.__file__), '..', '..', 'tests', 'kl', 'BezierSpineSolver.out')
+klOutput = open(klOutputPath).read()
+klRows = [[float(x) for x in re.findall(r"[xyzt]:([-+0-9.e]+)", row)] for row in re.findall(r"row[0-3]:\{([^}]*)\}", klOutput)]
+
+maxError = 0.0
+for i, output in enumerate(outputs):
+    rows = klRows[i * 4:i * 4 + 4]
+    tr = output.xfo.tr
+    klTr = Vec3(rows[0][3], rows[1][3], rows[2][3])
+    aim = output.xfo.ori.getXaxis()
+    klAim = Vec3(rows[0][1], rows[1][1], rows[2][1])
+    maxError = max(maxError, tr.distanceTo(klTr), aim.distanceTo(klAim))
+    print output.getName() + " tr: " + str([round(x, 4) + 0.0 for x in (tr.x, tr.y, tr.z)])
+
+print "matches KL: " + str(maxError < 1e-4)
+
+# Changing an input attribute updates the outputs.
+rigScale.setValue(2.0)
+spliceOp.evaluate()
+print "scaled tip: " + str([round(x, 4) for x in (outputs[-1].xfo.tr.x, outputs[-1].xfo.tr.y)])
+
+# The backend can be selected per solver type.
+ks.setSolverBackend('KL', 'BezierSpineSolver')
+print "BezierSpineSolver class: " + str(ks.getPythonSolverClass('BezierSpineSolver'))
+print "TwoBoneIKSolver class: " + ks.getPythonSolverClass('TwoBoneIKSolver').__name__
+ks.setSolverBackend('Python', 'BezierSpineSolver')
+
+# Two bone IK reaching a goal within reach.
+ikOp = SpliceOperator("armSpliceOp", 'TwoBoneIKSolver', 'Kraken')
+ikblend = ScalarAttribute("ikblend", 1.0, parent=settings)
+softDist = ScalarAttribute("softDist", 0.0, parent=settings)
+stretchBlend = ScalarAttribute("stretchBlend", 0.0, parent=settings)
+bone0Len = ScalarAttribute("bone0Len", 4.0, parent=settings)
+bone1Len = ScalarAttribute("bone1Len", 4.0, parent=settings)
+rightSide = BoolAttribute("rightSide", False, parent=settings)
+softIK = BoolAttribute("softIK", False, parent=settings)
+stretch = BoolAttribute("stretch", False, parent=settings)
+rigScale.setValue(1.0)
+for name, attr in [('drawDebug', drawDebug), ('rigScale', rigScale), ('rightSide', rightSide),
+                   ('ikblend', ikblend), ('softIK', softIK), ('softDist', softDist),
+                   ('stretch', stretch), ('stretchBlend', stretchBlend),
+                   ('bone0Len', bone0Len), ('bone1Len', bone1Len)]:
+    ikOp.setInput(name, attr)
+
+ikOp.setInput('root', locator("armRoot", Vec3(0, 0, 0)))
+ikOp.setInput('bone0FK', locator("bone0FK", Vec3(0, 0, 0)))
+ikOp.setInput('bone1FK', locator("bone1FK", Vec3(4, 0, 0)))
+ikOp.setInput('ikHandle', locator("ikHandle", Vec3(6, 0, 0)))
+ikOp.setInput('upV', locator("upV", Vec3(3, 0, -5)))
+bones = [Locator("bone" + str(i), parent=root) for i in xrange(3)]
+ikOp.setOutput('bone0Out', bones[0])
+ikOp.setOutput('bone1Out', bones[1])
+ikOp.setOutput('bone2Out', bones[2])
+ikOp.evaluate()
+
+print "bone1 length: " + str(round(bones[0].xfo.tr.distanceTo(bones[1].xfo.tr), 4))
+print "bone2 at goal: " + str(bones[2].xfo.tr.distanceTo(Vec3(6, 0, 0)) < 1e-4)
+print "elbow towards upV: " + str(bones[1].xfo.tr.z < 0.0)
+
+ks.setSolverBackend(prevBackend)
+ks.solverBackends = prevSolverBackends
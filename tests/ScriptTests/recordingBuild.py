@@ -0,0 +1,56 @@
+import json
+
+from kraken.core.maths import Vec3, Xfo
+from kraken.core.configs.config import Config
+from kraken.core.objects.container import Container
+from kraken.core.objects.layer import Layer
+from kraken.core.objects.locator import Locator
+from kraken.core.objects.attributes.attribute_group import AttributeGroup
+from kraken.core.objects.attributes.scalar_attribute import ScalarAttribute
+from kraken.core.objects.constraints.pose_constraint import PoseConstraint
+from kraken.plugins.recording_plugin.builder import Builder
+
+
+container = Container("myContainer")
+layer = Layer("myLayer", parent=container)
+locA = Locator("locA", parent=layer)
+locA.xfo = Xfo(Vec3(1.0, 2.0, 3.0))
+locB = Locator("locB", parent=locA)
+locB.setShapeVisibility(False)
+
+settingsA = AttributeGroup("settings", parent=locA)
+blendA = ScalarAttribute("blend", 0.5, minValue=0.0, maxValue=1.0, parent=settingsA)
+settingsB = AttributeGroup("settings", parent=locB)
+blendB = ScalarAttribute("blend", 0.0, parent=settingsB)
+blendB.connect(blendA)
+
+constraint = PoseConstraint('poseConstraint')
+constraint.setConstrainee(locB)
+constraint.addConstrainer(locA)
+locB.addConstraint(constraint)
+
+prevExplicitNaming = Config.getInstance().getExplicitNaming()
+
+builder = Builder()
+builder.getConfig().setExplicitNaming(True)
+builder.build(container)
+
+for operation in builder.getOperations():
+    print json.dumps(operation)
+
+print builder.getDCCSceneItem(blendB).getPath()
+print builder.getKrakenSceneItem(builder.getDCCSceneItem(locB)).getPath()
+
+recording = json.loads(builder.dumpJSON())
+print len(recording['nodes']), len(recording['operations'])
+print json.dumps(recording["nodes"][2], sort_keys=True)
+
+# Building again records the same scene instead of adding to the recording.
+# The config is cleared after each build.
+Config.getInstance().setExplicitNaming(True)
+builder.build(container)
+recording = json.loads(builder.dumpJSON())
+print len(recording['nodes']), len(recording['operations'])
+print builder.getDCCSceneItem(locB).getPath()
+
+Config.getInstance().setExplicitNaming(prevExplicitNaming)
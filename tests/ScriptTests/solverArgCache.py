@@ -0,0 +1,101 @@
+import os
+import sys
+import json
+import time
+import shutil
+import tempfile
+import subprocess
+
+
+checkSource = """
+from kraken.core.kraken_system import ks
+from kraken.core.objects.operators.splice_operator import SpliceOperator
+
+try:
+    spliceOp = SpliceOperator('testSpliceOp', 'CacheTestSolver', 'CacheTestExt')
+except Exception:
+    print 'Solver arguments not cached'
+else:
+    print sorted(spliceOp.inputs.keys()), sorted(spliceOp.outputs.keys())
+    print [arg.dataType for arg in spliceOp.getSolverArgs()]
+
+    spliceOp2 = SpliceOperator('testSpliceOp2', 'CacheTestSolver', 'CacheTestExt')
+    print spliceOp2.getSolverArgs() is spliceOp.getSolverArgs()
+"""
+
+versionSource = """
+from kraken.core.kraken_system import ks
+
+print ks.getExtensionVersion('Kraken')
+print ks.getExtensionVersion('CacheTestExt')
+"""
+
+tempDir = tempfile.mkdtemp()
+
+# Fake extension folders, only the files are used to compute the versions.
+extsDir = os.path.join(tempDir, 'exts')
+extFiles = {}
+for extension in ['Kraken', 'CacheTestExt']:
+    extDir = os.path.join(extsDir, extension)
+    os.makedirs(extDir)
+    with open(os.path.join(extDir, extension + '.fpm.json'), 'w') as manifestFile:
+        json.dump({'version': '1.0.0'}, manifestFile)
+
+    extFiles[extension] = os.path.join(extDir, extension + '.kl')
+    open(extFiles[extension], 'w').close()
+
+checkPath = os.path.join(tempDir, 'check.py')
+with open(checkPath, 'w') as checkFile:
+    checkFile.write(checkSource)
+
+versionPath = os.path.join(tempDir, 'version.py')
+with open(versionPath, 'w') as versionFile:
+    versionFile.write(versionSource)
+
+cachePath = os.path.join(tempDir, 'cache', 'solverArgCache.json')
+
+env = dict(os.environ)
+env['FABRIC_EXTS_PATH'] = extsDir
+env['KRAKEN_SOLVER_ARG_CACHE'] = cachePath
+env['PYTHONPATH'] = os.pathsep.join(sys.path)
+
+
+def run(path):
+    process = subprocess.Popen([sys.executable, path], env=env,
+                               stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+    return process.communicate()[0].strip()
+
+
+def writeCache():
+    versions = run(versionPath).splitlines()
+    print versions[0] != 'None', versions[1] != 'None'
+
+    os.makedirs(os.path.dirname(cachePath))
+    with open(cachePath, 'w') as cacheFile:
+        json.dump({
+            'version': 1,
+            'solvers': {
+                'CacheTestSolver': {
+                    'extension': 'CacheTestExt',
+                    'versions': versions,
+                    'args': [
+                        ['drawDebug', 'in', 'Boolean'],
+                        ['rigScale', 'in', 'Scalar'],
+                        ['ikGoal', 'in', 'Mat44'],
+                        ['fkControls', 'in', 'Mat44[]'],
+                        ['pose', 'out', 'Mat44[]']
+                    ]
+                }
+            }
+        }, cacheFile)
+
+
+# Operators of cached solver types are constructed without a KL round-trip.
+writeCache()
+print run(checkPath)
+
+# Editing the extension invalidates the cached arguments.
+os.utime(extFiles['CacheTestExt'], (time.time(), os.path.getmtime(extFiles['CacheTestExt']) + 10.0))
+print run(checkPath)
+
+shutil.rmtree(tempDir)
@@ -0,0 +1,53 @@
+from kraken.core.kraken_system import ks
+from kraken.core.maths import Vec3, Xfo
+from kraken.core.objects.locator import Locator
+from kraken.core.objects.attributes.attribute_group import AttributeGroup
+from kraken.core.objects.attributes.bool_attribute import BoolAttribute
+from kraken.core.objects.attributes.scalar_attribute import ScalarAttribute
+from kraken.core.objects.operators.splice_operator import SpliceOperator
+
+
+prevBackend = ks.getSolverBackend()
+ks.setSolverBackend('Python')
+
+root = Locator("root")
+settings = AttributeGroup("settings", parent=root)
+drawDebug = BoolAttribute("drawDebug", False, parent=settings)
+rigScale = ScalarAttribute("rigScale", 1.0, parent=settings)
+
+constrainer = Locator("constrainer", parent=root)
+constrainer.xfo = Xfo(tr=Vec3(1, 2, 3))
+constrainee = Locator("constrainee", parent=root)
+
+spliceOp = SpliceOperator("constraintSpliceOp", 'PoseConstraintSolver', 'Kraken')
+spliceOp.setInput('drawDebug', drawDebug)
+spliceOp.setInput('rigScale', rigScale)
+spliceOp.setInput('constrainer', constrainer)
+spliceOp.setOutput('constrainee', constrainee)
+
+names = [arg.name for arg in spliceOp.getSolverArgs()]
+
+
+def evaluate():
+    # Reports the slots of the argument buffer that were converted again.
+    previous = list(spliceOp._argVals) if spliceOp._argVals is not None else [None] * len(names)
+    spliceOp.evaluate()
+    converted = [names[i] for i in xrange(len(names)) if spliceOp._argVals[i] is not previous[i] or previous[i] is None]
+    print "converted: " + ", ".join(converted) + " | constrainee: " + str(constrainee.xfo.tr)
+
+
+evaluate()
+evaluate()
+
+constrainer.xfo = Xfo(tr=Vec3(4, 5, 6))
+evaluate()
+
+rigScale.setValue(2.0)
+evaluate()
+
+# Setting an output from outside makes it be uploaded again.
+constrainee.xfo = Xfo(tr=Vec3(0, 0, 0))
+evaluate()
+evaluate()
+
+ks.setSolverBackend(prevBackend)
@@ -0,0 +1,80 @@
+import os
+import json
+
+import kraken_examples
+from kraken.core.io.rig_definition_reader import RigDefinitionReader
+from kraken.core.objects.rig import Rig
+from kraken.helpers.utility_methods import prepareToLoad, prepareToSave
+
+
+rigFilePath = os.path.join(os.path.dirname(kraken_examples.__file__), 'bob_rig.krg')
+
+with open(rigFilePath) as rigFile:
+    expectedData = prepareToLoad(json.load(rigFile))
+
+# A small chunk size makes the reader refill its buffer mid value.
+reader = RigDefinitionReader(rigFilePath, chunkSize=97)
+streamedData = {}
+numComponents = 0
+for key, value in reader.iterItems(streamKeys=('components', )):
+    if key == 'components':
+        numComponents += 1
+        streamedData.setdefault(key, []).append(value)
+    else:
+        streamedData[key] = value
+
+print numComponents, sorted(streamedData.keys())
+print prepareToSave(streamedData) == prepareToSave(expectedData)
+print type(streamedData['components'][1]['neckPosition']).__name__
+
+bobRig = Rig()
+bobRig.loadRigDefinitionFile(rigFilePath)
+
+referenceRig = Rig()
+referenceRig.loadRigDefinition(expectedData)
+
+print bobRig.getName(), referenceRig.getName()
+print [component.getDecoratedName() for component in bobRig.getChildrenByType('Component')]
+print prepareToSave(bobRig.getData()) == prepareToSave(referenceRig.getData())
+
+# Components are constructed once the rig has its name, wherever the name is
+# in the file.
+from collections import OrderedDict
+import tempfile
+
+
+class NameCheckingRig(Rig):
+
+    def _loadComponent(self, componentData):
+        rigNames.add(self.getName())
+        return super(NameCheckingRig, self)._loadComponent(componentData)
+
+
+class CustomLoadRig(Rig):
+
+    def loadRigDefinition(self, jsonData):
+        print "custom loadRigDefinition:", sorted(jsonData.keys())
+        return super(CustomLoadRig, self).loadRigDefinition(jsonData)
+
+
+savedData = prepareToSave(expectedData)
+nameLastData = OrderedDict([(key, savedData[key]) for key in sorted(savedData.keys()) if key != 'name'])
+nameLastData['name'] = savedData['name']
+
+fileHandle, nameLastFilePath = tempfile.mkstemp(suffix='.krg')
+with os.fdopen(fileHandle, 'w') as rigFile:
+    rigFile.write(json.dumps(nameLastData, indent=2))
+
+try:
+    rigNames = set()
+    nameLastRig = NameCheckingRig()
+    nameLastRig.loadRigDefinitionFile(nameLastFilePath)
+    print sorted(rigNames)
+    print prepareToSave(nameLastRig.getData()) == prepareToSave(referenceRig.getData())
+
+    customRig = CustomLoadRig()
+    customRig.loadRigDefinitionFile(nameLastFilePath)
+    print customRig.getName(), len(customRig.getChildrenByType('Component'))
+
+finally:
+    os.remove(nameLastFilePath)
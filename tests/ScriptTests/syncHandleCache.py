@@ -0,0 +1,58 @@
+from kraken.core.maths import Vec3, Xfo
+from kraken.core.objects.container import Container
+from kraken.core.objects.layer import Layer
+from kraken.core.objects.locator import Locator
+from kraken.core.synchronizer import Synchronizer
+
+
+class DCCItem(object):
+
+    def __init__(self, name):
+        self.name = name
+        self.alive = True
+
+
+class LookupCountingSynchronizer(Synchronizer):
+
+    def __init__(self):
+        self.dccItems = {}
+        self.lookups = 0
+        super(LookupCountingSynchronizer, self).__init__()
+
+    def getDCCItem(self, kObject):
+        self.lookups += 1
+        path = kObject.getDecoratedPath()
+        if path not in self.dccItems or self.dccItems[path].alive is False:
+            self.dccItems[path] = DCCItem(path)
+
+        return self.dccItems[path]
+
+    def isDCCItemValid(self, dccItem):
+        return dccItem.alive
+
+
+container = Container("guide")
+layer = Layer("guides", parent=container)
+for i in xrange(10):
+    Locator("loc" + str(i), parent=layer)
+
+synchronizer = LookupCountingSynchronizer()
+synchronizer.setTarget(container)
+print synchronizer.lookups
+
+synchronizer.setTarget(container)
+print synchronizer.lookups
+
+loc3 = layer.getChildByName("loc3")
+loc3DCCItem = synchronizer.getMappedDCCItem(loc3)
+loc3DCCItem.alive = False
+print synchronizer.getMappedDCCItem(loc3) is loc3DCCItem
+print synchronizer.lookups
+
+layer.getChildByName("loc5").setName("renamed")
+synchronizer.setTarget(container)
+print synchronizer.lookups
+print synchronizer.getHierarchyMap()[layer.getChildByName("renamed")]['dccItem'].name
+
+synchronizer.sync()
+print synchronizer.lookups, synchronizer.getSyncedCount()
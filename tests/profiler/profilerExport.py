@@ -0,0 +1,44 @@
+import os
+import json
+import tempfile
+
+from kraken.core.profiler import Profiler
+
+
+profiler = Profiler()
+profiler.push('build')
+profiler.push('component')
+profiler.push('loadData')
+profiler.pop()
+profiler.pop()
+profiler.push('component')
+profiler.pop()
+profiler.pop()
+profiler.push('sync;all')
+profiler.pop()
+
+trace = profiler.generateChromeTrace()
+events = trace['traceEvents']
+for event in events:
+    print event['name'], event['ph'], event['pid'], event['tid']
+
+build = events[0]
+print all([event['ts'] >= build['ts'] for event in events[1:4]])
+print all([event['ts'] + event['dur'] <= build['ts'] + build['dur'] for event in events[1:4]])
+
+# Collapsed stacks, the self times depend on the timings.
+for line in profiler.generateCollapsedStacks().split('\n'):
+    stack, value = line.rsplit(' ', 1)
+    print stack, int(value) >= 0
+
+tracePath = os.path.join(tempfile.gettempdir(), 'kraken_profiler_trace.json')
+profiler.writeChromeTrace(tracePath)
+with open(tracePath, 'r') as traceFile:
+    print len(json.load(traceFile)['traceEvents'])
+os.remove(tracePath)
+
+stacksPath = os.path.join(tempfile.gettempdir(), 'kraken_profiler_stacks.txt')
+profiler.writeCollapsedStacks(stacksPath)
+with open(stacksPath, 'r') as stacksFile:
+    print len(stacksFile.read().splitlines())
+os.remove(stacksPath)
@@ -0,0 +1,32 @@
+from kraken.core.objects.locator import Locator
+from kraken.core.profiler import Profiler
+
+
+profiler = Profiler(trackMemory=True, countObjects=True)
+
+locators = []
+profiler.push('build')
+profiler.push('createLocators')
+for i in xrange(3):
+    locators.append(Locator('loc' + str(i)))
+profiler.pop()
+profiler.pop()
+
+stats = profiler.getStats()
+print stats['createLocators']['objects']['Locator'], stats['build']['objects']['Locator']
+print stats['build']['net'] is not None, stats['build']['peak'] is not None
+
+report = profiler.generateMemoryReport().split('\n')
+print report[0]
+print '  Locator: +3' in report
+
+events = profiler.generateChromeTrace()['traceEvents']
+print events[1]['args']['objects']['Locator']
+
+# Without memory tracking nothing is measured.
+profiler = Profiler()
+profiler.push('build')
+profiler.pop()
+stats = profiler.getStats()['build']
+print stats['net'], stats['peak'], stats['objects']
+print profiler.generateMemoryReport()
@@ -0,0 +1,68 @@
+from kraken.core.profiler import Profiler, profiled
+
+
+profiler = Profiler()
+for i in xrange(3):
+    profiler.push('build')
+    profiler.push('component')
+    profiler.pop()
+    profiler.push('component')
+    profiler.pop()
+    profiler.pop()
+
+stats = profiler.getStats()
+for label in sorted(stats):
+    print label, stats[label]['count']
+
+build = stats['build']
+component = stats['component']
+print build['min'] <= build['max'], build['self'] <= build['total']
+print component['self'] == component['total']
+
+# Sections opened through the context manager are popped on exceptions.
+try:
+    with profiler.section('failing'):
+        raise ValueError('fail')
+except ValueError:
+    pass
+
+print profiler.getStats()['failing']['count']
+print profiler.generateReport().count('failing')
+
+# A disabled profiler records nothing, unmatched pops included.
+disabled = Profiler(enabled=False)
+disabled.push('build')
+disabled.pop()
+disabled.pop()
+with disabled.section('section'):
+    pass
+
+print disabled.getStats(), disabled.generateReport()
+
+# The call tree can be turned off to keep only the statistics.
+statsOnly = Profiler(recordTree=False)
+statsOnly.push('build')
+statsOnly.pop()
+print statsOnly.getStats()['build']['count'], statsOnly.generateReport()
+
+
+@profiled()
+def getName():
+    return 'name'
+
+
+@profiled('customLabel')
+def getOther():
+    return 'other'
+
+
+instance = Profiler.getInstance()
+instance.setEnabled(True)
+instance.reset()
+print getName(), getOther(), getName.__name__
+print sorted(instance.getStats().items())[0][0], instance.getStats()['getName']['count']
+
+instance.setEnabled(False)
+instance.reset()
+getName()
+print instance.getStats()
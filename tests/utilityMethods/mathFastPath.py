@@ -0,0 +1,37 @@
+from kraken.core.maths import Vec2, Vec3, Vec4, Quat, Xfo, Euler, Mat33
+from kraken.helpers.utility_methods import prepareToSave, prepareToLoad
+
+
+values = [
+    Vec2(1.0, 2.0),
+    Vec3(1.0, 2.0, 3.0),
+    Vec4(1.0, 2.0, 3.0, 4.0),
+    Quat(v=Vec3(0.1, 0.2, 0.3), w=0.9),
+    Xfo(tr=Vec3(1.0, 2.0, 3.0), ori=Quat(v=Vec3(0.0, 0.7071, 0.0), w=0.7071), sc=Vec3(2.0, 2.0, 2.0)),
+    Euler(0.1, 0.2, 0.3),
+    Mat33()
+]
+
+# The fast encoders match jsonEncode.
+for value in values:
+    print type(value).__name__, prepareToSave(value) == value.jsonEncode()
+
+# Decoding round trips.
+for value in values[:5]:
+    decoded = prepareToLoad(prepareToSave(value))
+    print type(decoded).__name__, prepareToSave(decoded) == value.jsonEncode()
+
+# Decoded values can be decoded again.
+data = prepareToLoad({'xfo': prepareToSave(values[4])})
+print prepareToSave(prepareToLoad(data)) == {'xfo': values[4].jsonEncode()}
+
+# Subtrees without math objects aren't copied.
+settings = {'name': 'arm', 'sizes': [1.0, 2.0], 'flags': {'mirror': True}}
+data = {'settings': settings, 'xfos': [values[4]], 'names': ['a', 'b']}
+saved = prepareToSave(data)
+print saved is data, saved['settings'] is settings, saved['names'] is data['names']
+print saved['xfos'] is data['xfos'], type(saved['xfos'][0]).__name__
+print prepareToSave(settings) is settings
+
+loaded = prepareToLoad(saved)
+print loaded['settings'] is settings, type(loaded['xfos'][0]).__name__